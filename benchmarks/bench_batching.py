@@ -0,0 +1,75 @@
+"""
+Microbenchmark of the task dispatch and result submission overhead through the process queues,
+for different batch sizes. It uses the `DummyScraper` worker from the tests, whose tasks are
+almost free, so the measured throughput is the queues (pickling, pipes and locks) throughput.
+
+Usage: python -m benchmarks.bench_batching [num_tasks] [num_workers]
+"""
+import sys
+import time
+
+from linkedin_scraper.processes import get_context
+from linkedin_scraper.scrapers.base import (
+    RESULTS_BATCH_STATUS,
+    SCRAPE_BATCH_MESSAGE,
+    SCRAPE_TASK_MESSAGE,
+)
+from tests.scrapers.test_base import DummyScraper
+
+BATCH_SIZES = [1, 10, 50, 200]
+
+
+def run(num_tasks: int, num_workers: int, batch_size: int) -> float:
+    """
+    Sends `num_tasks` tasks to `num_workers` workers, in batches of `batch_size`, and waits
+    for all their results.
+    :return: Tasks per second
+    """
+    input_queue = get_context().Queue()
+    results_queue = get_context().Queue()
+    workers = [
+        DummyScraper(
+            worker_id=worker_id,
+            input_queue=input_queue,
+            results_queue=results_queue,
+            result_batch_size=batch_size,
+        )
+        for worker_id in range(num_workers)
+    ]
+    for worker in workers:
+        worker.run_in_thread()
+
+    start = time.perf_counter()
+    if batch_size <= 1:
+        for task_id in range(num_tasks):
+            input_queue.put((SCRAPE_TASK_MESSAGE, task_id, "sample_data"))
+    else:
+        for first_task_id in range(0, num_tasks, batch_size):
+            batch = [
+                (task_id, "sample_data")
+                for task_id in range(first_task_id, min(first_task_id + batch_size, num_tasks))
+            ]
+            input_queue.put((SCRAPE_BATCH_MESSAGE, None, batch))
+
+    received = 0
+    while received < num_tasks:
+        worker_type, task_id, data, status = results_queue.get()
+        received += len(data) if status == RESULTS_BATCH_STATUS else 1
+    elapsed = time.perf_counter() - start
+
+    for worker in workers:
+        worker.request_stop()
+    for worker in workers:
+        worker.stop()
+
+    return num_tasks / elapsed
+
+
+def main(num_tasks: int = 100_000, num_workers: int = 4):
+    for batch_size in BATCH_SIZES:
+        tasks_per_second = run(num_tasks, num_workers, batch_size)
+        print(f"batch size {batch_size:>4}: {tasks_per_second:10.0f} tasks/s")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
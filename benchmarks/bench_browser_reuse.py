@@ -0,0 +1,58 @@
+"""
+Compares the per-task cost of launching a Chromium instance for every LinkedIn task against the
+persistent browser kept by `LinkedinScrapeWorker`.
+
+Usage: python -m benchmarks.bench_browser_reuse [num_tasks]
+"""
+import sys
+import time
+
+from playwright.sync_api import sync_playwright
+from playwright_stealth import stealth_sync
+
+from linkedin_scraper.scrapers import LinkedinScrapeWorker
+from benchmarks.stub_servers import LinkedinStubHandler, StubServer
+
+
+def run_task_with_fresh_browser(page_url: str) -> int:
+    """Previous `LinkedinScrapeWorker.run_task` behaviour: one browser launch per task."""
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        page = browser.new_page()
+        stealth_sync(page)
+        page.goto(page_url)
+        text = page.locator(".top-card-layout__card").first.inner_text()
+        page.close()
+        browser.close()
+        return LinkedinScrapeWorker.get_employee_count_regex(text)
+
+
+def timed(label: str, func, urls: list):
+    start = time.perf_counter()
+    for url in urls:
+        func(url)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<20} {len(urls)} tasks in {elapsed:.2f}s, "
+        f"{elapsed / len(urls) * 1000:.1f} ms/task"
+    )
+
+
+def main(num_tasks: int = 20):
+    # The stub pages are served with their top card, skip the HTTP fast path to time the browser
+    worker = LinkedinScrapeWorker(
+        worker_id=0, input_queue=None, results_queue=None, http_fast_path=False
+    )
+
+    with StubServer(LinkedinStubHandler) as server:
+        urls = [f"{server.base_url}/company/company-{i}" for i in range(num_tasks)]
+
+        timed("browser per task", run_task_with_fresh_browser, urls)
+        try:
+            timed("persistent browser", worker.run_task, urls)
+        finally:
+            worker.teardown()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,75 @@
+"""
+Measures the time and bandwidth saved per LinkedIn page by the `PageLoadPolicy` of the browser
+workers (resource blocking and waiting only for the top card), against a stub company page with
+stylesheets, fonts, scripts, images, a video and third-party trackers.
+
+Usage: python -m benchmarks.bench_page_policy [num_tasks]
+"""
+import sys
+import time
+
+from linkedin_scraper.scrapers import LinkedinScrapeWorker
+from linkedin_scraper.scrapers.page_policy import PageLoadPolicy
+from benchmarks.stub_servers import LinkedinStubHandler, StubServer, make_handler
+
+POLICIES = (
+    (
+        "load everything",
+        PageLoadPolicy(blocked_resource_types=(), block_third_party=False, wait_for_top_card=False),
+    ),
+    ("block resources", PageLoadPolicy(wait_for_top_card=False)),
+    ("block + top card", PageLoadPolicy()),
+)
+
+
+def run_policy(page_policy: PageLoadPolicy, urls: list) -> tuple:
+    """Returns the (seconds, KB, blocked requests) per page of loading `urls` with `page_policy`"""
+    worker = LinkedinScrapeWorker(
+        worker_id=0,
+        input_queue=None,
+        results_queue=None,
+        http_fast_path=False,
+        page_policy=page_policy,
+    )
+    try:
+        # Warm up, the browser launch is not part of the page cost
+        worker.run_task(urls[0])
+        stats = dict(worker.get_page_stats())
+
+        start = time.perf_counter()
+        for url in urls:
+            assert worker.run_task(url) is not None
+        elapsed = time.perf_counter() - start
+
+        page_stats = worker.get_page_stats()
+        kilobytes = (page_stats["bytes"] - stats["bytes"]) / 1024
+        blocked = page_stats["blocked_requests"] - stats["blocked_requests"]
+        return elapsed / len(urls), kilobytes / len(urls), blocked / len(urls)
+    finally:
+        worker.teardown()
+
+
+def main(num_tasks: int = 20):
+    handler = make_handler(LinkedinStubHandler, assets=True, asset_latency=0.05)
+    with StubServer(handler) as server:
+        urls = [f"{server.base_url}/company/company-{i}" for i in range(num_tasks)]
+
+        baseline = None
+        for label, page_policy in POLICIES:
+            seconds, kilobytes, blocked = run_policy(page_policy, urls)
+            line = (
+                f"{label:<18} {seconds * 1000:7.1f} ms/page {kilobytes:8.0f} KB/page "
+                f"{blocked:4.1f} blocked/page"
+            )
+            if baseline is None:
+                baseline = seconds, kilobytes
+            else:
+                line += (
+                    f"  saved {(baseline[0] - seconds) * 1000:.1f} ms, "
+                    f"{baseline[1] - kilobytes:.0f} KB per page"
+                )
+            print(line)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
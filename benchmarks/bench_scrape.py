@@ -0,0 +1,229 @@
+"""
+End to end scraping benchmark, against local stub Google and LinkedIn servers simulating latency,
+HTTP 429 bursts and the company pages top card. Real `GoogleScrapeWorker` and `LinkedinScrapeWorker`
+workers are used, pointed to the stubs with LINKEDIN_SCRAPER_GOOGLE_BASE_URL and
+LINKEDIN_SCRAPER_LINKEDIN_BASE_URL.
+
+For every input and concurrency setting of the matrix it reports companies per second, the p50/p99
+latency of each stage and the peak RSS of the whole process tree. Results can be saved with `--json`,
+and compared with a previous run with `--baseline`, failing if the performance regressed.
+
+Usage: python -m benchmarks.bench_scrape [--inputs fortune500,synthetic:5000]
+    [--google-concurrency 5,20] [--linkedin-concurrency 5,10] [--json results.json] [--baseline old.json]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import threading
+import subprocess
+
+from benchmarks.stub_servers import (
+    GoogleStubHandler,
+    LinkedinStubHandler,
+    StubServer,
+    make_handler,
+)
+
+FORTUNE500_CSV = os.path.join(os.path.dirname(__file__), "..", "sample_data", "fortune500.csv")
+RESULT_PREFIX = "BENCH_RESULT "
+
+
+class PeakRssSampler:
+    """Samples the RSS of the current process and all its children, keeping the peak value"""
+
+    def __init__(self, interval: float = 0.1):
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self.peak_mb = 0.0
+
+    def _run(self):
+        from linkedin_scraper.autoscale import get_rss_mb
+
+        while not self._stop.is_set():
+            self.peak_mb = max(self.peak_mb, get_rss_mb(os.getpid()))
+            self._stop.wait(self._interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def run_session(input_csv: str):
+    """
+    Runs a scraping session in the current process, configured by the environment, and prints its stats.
+    """
+    from linkedin_scraper import ScraperController
+    from linkedin_scraper.utils import read_csv
+
+    company_names = list(read_csv(input_csv))
+    controller = ScraperController(show_progress=False)
+
+    with PeakRssSampler() as sampler:
+        start = time.perf_counter()
+        results = controller.scrape(company_names_list=company_names)
+        elapsed = time.perf_counter() - start
+
+    summary = controller.get_metrics().summary()
+    stages = summary["stages"]
+    print(
+        RESULT_PREFIX
+        + json.dumps(
+            {
+                "companies": len(results),
+                "succeeded": sum(result["status"] == "success" for result in results.values()),
+                "seconds": elapsed,
+                "companies_per_second": len(results) / elapsed,
+                "google_p50": stages["google"]["latency_seconds"]["p50"],
+                "google_p99": stages["google"]["latency_seconds"]["p99"],
+                "linkedin_p50": stages["linkedin"]["latency_seconds"]["p50"],
+                "linkedin_p99": stages["linkedin"]["latency_seconds"]["p99"],
+                "throttled": stages["google"]["throttled"],
+                "peak_rss_mb": sampler.peak_mb,
+            }
+        ),
+        flush=True,
+    )
+
+
+def write_synthetic_csv(fname: str, rows: int):
+    with open(fname, "w") as f:
+        for i in range(rows):
+            f.write(f"Synthetic Company {i}\n")
+
+
+def get_input_csv(name: str, tmp_dir: str) -> str:
+    """Returns the csv path of a benchmark input: "fortune500" or "synthetic:<rows>"."""
+    if name == "fortune500":
+        return FORTUNE500_CSV
+
+    rows = int(name.split(":")[1])
+    input_csv = os.path.join(tmp_dir, f"synthetic_{rows}.csv")
+    write_synthetic_csv(input_csv, rows)
+    return input_csv
+
+
+def run_cell(input_csv: str, env: dict) -> dict:
+    """Runs a session in its own process, so its peak RSS and settings are isolated."""
+    process = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_scrape", "--run", input_csv],
+        env=env,
+        stdout=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    for line in process.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+    raise RuntimeError(f"The benchmark session printed no results:\n{process.stdout}")
+
+
+def format_seconds(value) -> str:
+    return "-" if value is None else f"{value * 1000:.0f}ms"
+
+
+def compare_with_baseline(results: list, baseline_path: str, tolerance: float) -> list:
+    """
+    Returns the regressions of `results` compared with the results saved in `baseline_path`: lower
+    throughput, or higher latency / RSS, by more than `tolerance` (a fraction).
+    """
+    with open(baseline_path) as f:
+        baseline = {result["cell"]: result for result in json.load(f)}
+
+    regressions = []
+    for result in results:
+        previous = baseline.get(result["cell"])
+        if previous is None:
+            continue
+
+        if result["companies_per_second"] < previous["companies_per_second"] * (1 - tolerance):
+            regressions.append(f"{result['cell']}: companies/s {previous['companies_per_second']:.1f} -> {result['companies_per_second']:.1f}")
+        for metric in ("google_p99", "linkedin_p99", "peak_rss_mb"):
+            if result[metric] and previous[metric] and result[metric] > previous[metric] * (1 + tolerance):
+                regressions.append(f"{result['cell']}: {metric} {previous[metric]:.3f} -> {result[metric]:.3f}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--inputs", default="fortune500,synthetic:5000")
+    parser.add_argument("--google-concurrency", default="5,20")
+    parser.add_argument("--linkedin-concurrency", default="5,10")
+    parser.add_argument("--google-rate", default="0", help="LINKEDIN_SCRAPER_GOOGLE_RATE, 0 disables it")
+    parser.add_argument("--google-latency", type=float, default=0.05)
+    parser.add_argument("--linkedin-latency", type=float, default=0.1)
+    parser.add_argument("--throttle-every", type=int, default=200, help="Stub 429 burst after this many searches")
+    parser.add_argument("--throttle-burst", type=int, default=10, help="Searches answered with 429 per burst")
+    parser.add_argument("--not-found-ratio", type=float, default=0.02)
+    parser.add_argument("--json", dest="json_path", help="Save the results to this file")
+    parser.add_argument("--baseline", help="Fail if the results regressed compared with this file")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--run", metavar="INPUT_CSV", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        run_session(args.run)
+        return
+
+    linkedin_handler = make_handler(LinkedinStubHandler, latency=args.linkedin_latency)
+    results = []
+    with StubServer(linkedin_handler) as linkedin_server, tempfile.TemporaryDirectory() as tmp_dir:
+        google_handler = make_handler(
+            GoogleStubHandler,
+            linkedin_base_url=linkedin_server.base_url,
+            latency=args.google_latency,
+            throttle_every=args.throttle_every,
+            throttle_burst=args.throttle_burst,
+            not_found_ratio=args.not_found_ratio,
+        )
+        with StubServer(google_handler) as google_server:
+            print(
+                f"{'input':<16} {'google':>6} {'linkedin':>8} {'companies/s':>11} "
+                f"{'google p50/p99':>15} {'linkedin p50/p99':>17} {'429s':>5} {'peak RSS':>9}"
+            )
+            for input_name in args.inputs.split(","):
+                input_csv = get_input_csv(input_name, tmp_dir)
+                for google_concurrency in args.google_concurrency.split(","):
+                    for linkedin_concurrency in args.linkedin_concurrency.split(","):
+                        env = dict(
+                            os.environ,
+                            LOG_LEVEL="WARNING",
+                            LINKEDIN_SCRAPER_GOOGLE_BASE_URL=google_server.base_url,
+                            LINKEDIN_SCRAPER_LINKEDIN_BASE_URL=linkedin_server.base_url,
+                            LINKEDIN_SCRAPER_GOOGLE_CONCURRENCY=google_concurrency,
+                            LINKEDIN_SCRAPER_LINKEDIN_CONCURRENCY=linkedin_concurrency,
+                            LINKEDIN_SCRAPER_GOOGLE_RATE=args.google_rate,
+                        )
+                        result = run_cell(input_csv, env)
+                        result["cell"] = f"{input_name}/g{google_concurrency}/l{linkedin_concurrency}"
+                        results.append(result)
+                        print(
+                            f"{input_name:<16} {google_concurrency:>6} {linkedin_concurrency:>8} "
+                            f"{result['companies_per_second']:>11.1f} "
+                            f"{format_seconds(result['google_p50']):>7}/{format_seconds(result['google_p99']):<7} "
+                            f"{format_seconds(result['linkedin_p50']):>8}/{format_seconds(result['linkedin_p99']):<8} "
+                            f"{result['throttled']:>5} {result['peak_rss_mb']:>6.0f} MB",
+                            flush=True,
+                        )
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        regressions = compare_with_baseline(results, args.baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Measures the write throughput of the output sinks, writing synthetic results one at a time, as
+the results loop does. A quarter of the rows are failed results, and some company names need
+CSV quoting. The hand-built "a, b, c" rows written by previous versions are measured as a baseline.
+
+Usage: python -m benchmarks.bench_sinks [--formats csv,jsonl,parquet,sqlite] [rows ...]
+"""
+import os
+import time
+import argparse
+import tempfile
+
+from linkedin_scraper.sinks import OUTPUT_FORMATS, open_sink
+
+BASELINE_FORMAT = "fstring"
+
+
+def generate_results(rows: int):
+    for i in range(rows):
+        if i % 4:
+            yield f"Synthetic Company {i}, Inc.", {
+                "status": "success",
+                "linkedin_url": f"https://www.linkedin.com/company/synthetic-company-{i}",
+                "employee_count": i,
+            }
+        else:
+            yield f"Synthetic Company {i}", {
+                "status": "failed",
+                "linkedin_url": None,
+                "employee_count": None,
+            }
+
+
+def write_baseline(path: str, rows: int):
+    """Unbuffered, unquoted rows of successful results only"""
+    with open(path, "w") as f:
+        f.write("company_name, status, linkedin_url, employee_count\n")
+        for company_name, result in generate_results(rows):
+            if result["status"] == "success":
+                f.write(
+                    f"{company_name}, {result['status']}, {result['linkedin_url']}, "
+                    f"{result['employee_count']}\n"
+                )
+
+
+def write_sink(path: str, output_format: str, rows: int):
+    sink = open_sink(output_format, path)
+    try:
+        for company_name, result in generate_results(rows):
+            sink.write(company_name, result)
+    finally:
+        sink.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("rows", nargs="*", type=int, default=[1_000_000])
+    parser.add_argument("--formats", default=",".join((BASELINE_FORMAT,) + OUTPUT_FORMATS))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for rows in args.rows:
+            # Generating the rows alone, to tell the sink time apart
+            start = time.perf_counter()
+            for _ in generate_results(rows):
+                pass
+            generation = time.perf_counter() - start
+            print(f"{rows} rows, generated in {generation:.2f}s")
+
+            for output_format in args.formats.split(","):
+                path = os.path.join(tmp_dir, f"output_{rows}.{output_format}")
+                start = time.perf_counter()
+                try:
+                    if output_format == BASELINE_FORMAT:
+                        write_baseline(path, rows)
+                    else:
+                        write_sink(path, output_format, rows)
+                except ImportError as e:
+                    print(f"{output_format:<8} skipped: {e}")
+                    continue
+                elapsed = time.perf_counter() - start
+                size_mb = os.path.getsize(path) / 1024 / 1024
+                print(
+                    f"{output_format:<8} {elapsed:7.2f}s  {rows / elapsed:10.0f} rows/s  "
+                    f"(writes only: {rows / max(elapsed - generation, 1e-9):10.0f} rows/s)  "
+                    f"{size_mb:7.1f} MB"
+                )
+                os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
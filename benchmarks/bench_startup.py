@@ -0,0 +1,109 @@
+"""
+Startup time benchmark, for every worker processes start method (LINKEDIN_SCRAPER_START_METHOD):
+the time to `import linkedin_scraper`, to run `linkedin_scraper --help`, and for a scraping session
+against the local stub servers, the time until the workers are spawned and the first task is
+dispatched, and until the first result is received. Every measure runs in a fresh interpreter.
+
+Usage: python -m benchmarks.bench_startup [--start-methods fork,forkserver,spawn] [--repeat 3]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+
+from benchmarks.stub_servers import (
+    GoogleStubHandler,
+    LinkedinStubHandler,
+    StubServer,
+    make_handler,
+)
+
+RESULT_PREFIX = "BENCH_RESULT "
+# The `linkedin_scraper` console script
+HELP_COMMAND = ["-c", "from linkedin_scraper.cli import scrape_companies_csv; scrape_companies_csv()", "--help"]
+
+
+def run_session():
+    """
+    Scrapes a few companies in the current process, configured by the environment, and prints the
+    time since the interpreter started until the first task is dispatched and the first result.
+    """
+    from linkedin_scraper import ScraperController
+
+    controller = ScraperController(show_progress=False)
+    controller.initialize()
+    dispatched = time.time()
+    for _ in controller.scrape_iter([f"Startup Company {i}" for i in range(5)]):
+        first_result = time.time()
+        break
+
+    started = float(os.environ["BENCH_STARTED"])
+    print(
+        RESULT_PREFIX
+        + json.dumps({"first_dispatch": dispatched - started, "first_result": first_result - started}),
+        flush=True,
+    )
+
+
+def time_command(args: list, env: dict) -> float:
+    """Returns the seconds the python `args` command takes, in a new interpreter"""
+    start = time.perf_counter()
+    subprocess.run([sys.executable] + args, env=env, stdout=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - start
+
+
+def time_session(env: dict) -> dict:
+    env = dict(env, BENCH_STARTED=str(time.time()))
+    process = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_startup", "--run"],
+        env=env,
+        stdout=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    for line in process.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+    raise RuntimeError(f"The benchmark session printed no results:\n{process.stdout}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--start-methods", default="fork,forkserver,spawn")
+    parser.add_argument("--repeat", type=int, default=3, help="Keep the best of this many runs")
+    parser.add_argument("--run", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        run_session()
+        return
+
+    with StubServer(LinkedinStubHandler) as linkedin_server:
+        google_handler = make_handler(GoogleStubHandler, linkedin_base_url=linkedin_server.base_url)
+        with StubServer(google_handler) as google_server:
+            print(f"{'start method':<12} {'import':>8} {'--help':>8} {'1st dispatch':>12} {'1st result':>10}")
+            for start_method in args.start_methods.split(","):
+                env = dict(
+                    os.environ,
+                    LOG_LEVEL="WARNING",
+                    LINKEDIN_SCRAPER_START_METHOD=start_method,
+                    LINKEDIN_SCRAPER_GOOGLE_BASE_URL=google_server.base_url,
+                    LINKEDIN_SCRAPER_LINKEDIN_BASE_URL=linkedin_server.base_url,
+                )
+                import_seconds = min(
+                    time_command(["-c", "import linkedin_scraper"], env) for _ in range(args.repeat)
+                )
+                help_seconds = min(time_command(HELP_COMMAND, env) for _ in range(args.repeat))
+                sessions = [time_session(env) for _ in range(args.repeat)]
+                print(
+                    f"{start_method:<12} {import_seconds * 1000:6.0f}ms {help_seconds * 1000:6.0f}ms "
+                    f"{min(s['first_dispatch'] for s in sessions) * 1000:10.0f}ms "
+                    f"{min(s['first_result'] for s in sessions) * 1000:8.0f}ms",
+                    flush=True,
+                )
+
+
+if __name__ == "__main__":
+    main()
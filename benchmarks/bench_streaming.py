@@ -0,0 +1,79 @@
+"""
+Measures the controller peak memory and throughput for growing synthetic inputs, comparing
+`ScraperController.scrape` (whole input in memory) with `ScraperController.scrape_stream`.
+Dummy workers are used, so only the controller and queues overhead is measured.
+
+Usage: python -m benchmarks.bench_streaming [--modes stream,batch] [rows ...]
+"""
+import os
+import sys
+import time
+import argparse
+import resource
+import tempfile
+import subprocess
+
+from linkedin_scraper import ScraperController
+from linkedin_scraper.utils import read_csv
+from tests.test_controller import DummyGoogleScraper, DummyLinkedinScraper
+
+
+def write_synthetic_csv(fname: str, rows: int):
+    with open(fname, "w") as f:
+        for i in range(rows):
+            f.write(f"Synthetic Company {i}\n")
+
+
+def run_session(input_csv: str, mode: str):
+    """Runs a scraping session in the current process, and prints its stats."""
+    controller = ScraperController(
+        show_progress=False,
+        google_worker_class=DummyGoogleScraper,
+        linkedin_worker_class=DummyLinkedinScraper,
+    )
+    finished = 0
+
+    def on_result(company_name, result):
+        nonlocal finished
+        finished += 1
+
+    start = time.perf_counter()
+    if mode == "stream":
+        controller.scrape_stream(company_names=read_csv(input_csv), on_result=on_result)
+    else:
+        finished = len(controller.scrape(company_names_list=read_csv(input_csv)))
+    elapsed = time.perf_counter() - start
+
+    # ru_maxrss is in kilobytes on Linux
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(
+        f"{mode:<7} {finished:>9} rows  {elapsed:8.1f}s  "
+        f"{finished / elapsed:9.0f} rows/s  peak RSS {peak_rss_mb:7.1f} MB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("rows", nargs="*", type=int, default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--modes", default="stream,batch")
+    parser.add_argument("--run", nargs=2, metavar=("INPUT_CSV", "MODE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        run_session(*args.run)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for rows in args.rows:
+            input_csv = os.path.join(tmp_dir, f"input_{rows}.csv")
+            write_synthetic_csv(input_csv, rows)
+            for mode in args.modes.split(","):
+                # Each session runs in its own process, so the peak RSS is not shared.
+                subprocess.run(
+                    [sys.executable, "-m", "benchmarks.bench_streaming", "--run", input_csv, mode],
+                    check=True,
+                )
+
+
+if __name__ == "__main__":
+    main()
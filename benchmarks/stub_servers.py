@@ -0,0 +1,230 @@
+"""
+Local stub servers used by the benchmarks, so they can run without hitting the real services.
+"""
+import time
+import random
+import threading
+import urllib.parse
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+LINKEDIN_COMPANY_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head><title>{name} | LinkedIn</title>{head_assets}</head>
+<body>
+<main>
+<section class="top-card-layout">
+<div class="top-card-layout__card">
+<h1 class="top-card-layout__title">{name}</h1>
+<h2 class="top-card-layout__headline">Retail</h2>
+<a class="face-pile__cta" href="#">View all {employee_count:,} employees</a>
+</div>
+</section>
+{body_assets}
+</main>
+</body>
+</html>
+"""
+
+# Resources of a real company page: stylesheets, fonts, scripts, images, media and third-party trackers
+LINKEDIN_HEAD_ASSETS = """
+<link rel="stylesheet" href="/static/style.css">
+<style>@font-face {{ font-family: "Stub"; src: url("/static/font.woff2"); }} body {{ font-family: "Stub"; }}</style>
+<script src="/static/app.js"></script>
+<script src="{third_party_url}/tracking.js" async></script>
+"""
+LINKEDIN_BODY_ASSETS = """
+<img src="/static/logo.png"><img src="/static/cover.jpg">
+<video src="/static/intro.mp4" preload="auto"></video>
+<img src="{third_party_url}/pixel.gif">
+"""
+# Sizes, in KB, of the stub resources
+LINKEDIN_ASSET_SIZES = {
+    ".css": 60,
+    ".woff2": 120,
+    ".js": 300,
+    ".png": 80,
+    ".jpg": 400,
+    ".mp4": 1500,
+    ".gif": 1,
+}
+ASSET_CONTENT_TYPES = {
+    ".css": "text/css",
+    ".woff2": "font/woff2",
+    ".js": "application/javascript",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".mp4": "video/mp4",
+    ".gif": "image/gif",
+}
+
+
+GOOGLE_RESULTS_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head><title>{query} - Google Search</title></head>
+<body>
+<div id="search">{results}</div>
+</body>
+</html>
+"""
+
+GOOGLE_RESULT_TEMPLATE = '<div class="g"><a href="/url?q={url}&amp;sa=U"><h3>{title}</h3></a></div>'
+
+
+def simulate_latency(latency: float, jitter: float):
+    """Sleeps `latency` seconds, +/- a random `jitter` fraction of it"""
+    if latency:
+        time.sleep(latency * random.uniform(1 - jitter, 1 + jitter))
+
+
+class GoogleStubHandler(BaseHTTPRequestHandler):
+    """
+    Serves Google search result pages for `<company> site:<linkedin_base_url>/company/` queries,
+    pointing to `linkedin_base_url`. Configure it by subclassing (see `make_handler`):
+
+    - `latency` and `jitter`: Response time, in seconds, and its random variation.
+    - `throttle_every` and `throttle_burst`: After every `throttle_every` searches, the next
+      `throttle_burst` ones are answered with HTTP 429 (0 disables throttling).
+    - `not_found_ratio`: Fraction of the companies without results.
+    """
+
+    linkedin_base_url = "https://www.linkedin.com"
+    latency = 0.0
+    jitter = 0.2
+    throttle_every = 0
+    throttle_burst = 0
+    not_found_ratio = 0.0
+
+    _lock = threading.Lock()
+    _searches = 0
+
+    @classmethod
+    def _is_throttled(cls) -> bool:
+        if not cls.throttle_every:
+            return False
+        with cls._lock:
+            cls._searches += 1
+            return cls._searches % (cls.throttle_every + cls.throttle_burst) >= cls.throttle_every
+
+    def do_GET(self):
+        url = urllib.parse.urlparse(self.path)
+        if url.path == "/":
+            # Home page, yagooglesearch visits it first to get the cookies
+            self._send_html("<html><body></body></html>")
+            return
+        if url.path != "/search":
+            self.send_error(404)
+            return
+
+        simulate_latency(self.latency, self.jitter)
+        if self._is_throttled():
+            self.send_error(429)
+            return
+
+        query = urllib.parse.parse_qs(url.query).get("q", [""])[0]
+        company_name = query.split(" site:")[0].strip()
+        results = ""
+        # Stable per company, so retries get the same answer
+        if company_name and random.Random(company_name).random() >= self.not_found_ratio:
+            slug = "-".join(company_name.lower().split())
+            results = GOOGLE_RESULT_TEMPLATE.format(
+                url=urllib.parse.quote(f"{self.linkedin_base_url}/company/{slug}/", safe=":/"),
+                title=company_name,
+            )
+        self._send_html(GOOGLE_RESULTS_PAGE_TEMPLATE.format(query=query, results=results))
+
+    def _send_html(self, html: str):
+        body = html.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LinkedinStubHandler(BaseHTTPRequestHandler):
+    """
+    Serves a minimal LinkedIn company page for any `/company/<slug>` path, after `latency` seconds.
+
+    With `assets` enabled, the page references stylesheets, fonts, scripts, images, a video and
+    third-party trackers (served by the same server, through its "localhost" name), each one
+    answered after `asset_latency` seconds.
+    """
+
+    employee_count = 2300000
+    latency = 0.0
+    jitter = 0.2
+    assets = False
+    asset_latency = 0.05
+
+    def do_GET(self):
+        path = urllib.parse.urlparse(self.path).path
+        extension = "." + path.rsplit(".", 1)[-1] if "." in path else ""
+        if extension in LINKEDIN_ASSET_SIZES:
+            simulate_latency(self.asset_latency, self.jitter)
+            body = b" " * (LINKEDIN_ASSET_SIZES[extension] * 1024)
+            self._send(body, ASSET_CONTENT_TYPES[extension])
+            return
+
+        if not path.startswith("/company/"):
+            self.send_error(404)
+            return
+
+        simulate_latency(self.latency, self.jitter)
+
+        head_assets = body_assets = ""
+        if self.assets:
+            third_party_url = f"http://localhost:{self.server.server_address[1]}"
+            head_assets = LINKEDIN_HEAD_ASSETS.format(third_party_url=third_party_url)
+            body_assets = LINKEDIN_BODY_ASSETS.format(third_party_url=third_party_url)
+
+        name = path.rstrip("/").rsplit("/", 1)[-1].replace("-", " ").title()
+        body = LINKEDIN_COMPANY_PAGE_TEMPLATE.format(
+            name=name,
+            employee_count=self.employee_count,
+            head_assets=head_assets,
+            body_assets=body_assets,
+        ).encode()
+        self._send(body, "text/html; charset=utf-8")
+
+    def _send(self, body: bytes, content_type: str):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_handler(handler_class, **options):
+    """Returns a subclass of `handler_class` with the given class attributes, i.e. `latency`"""
+    return type(handler_class.__name__, (handler_class,), options)
+
+
+class StubServer:
+    """
+    Runs a `handler_class` http server in a background thread, on a random local port.
+    """
+
+    def __init__(self, handler_class):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler_class)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
@@ -1,21 +1,70 @@
+import time
+import uuid
 import logging
 
-from typing import Type
+from collections import OrderedDict, deque
+from typing import AsyncIterator, Callable, Iterable, Iterator, Type
 from queue import Empty
-from multiprocessing import Queue
-
-import tqdm
 
+from linkedin_scraper.scrapers.base import (
+    RESULTS_BATCH_STATUS,
+    SCRAPE_BATCH_MESSAGE,
+    SCRAPE_TASK_MESSAGE,
+)
 from linkedin_scraper.scrapers import (
     BaseScraperWorker,
     GoogleScrapeWorker,
     LinkedinScrapeWorker,
+    AsyncLinkedinScrapeWorker,
 )
-from linkedin_scraper.utils import read_csv
+from linkedin_scraper.scrapers.slug_resolver import SlugResolver
+from linkedin_scraper.autoscale import Autoscaler
+from linkedin_scraper.cache import LinkedinUrlCache
+from linkedin_scraper.hedging import HedgingPolicy
+from linkedin_scraper.journal import ResultsJournal
+from linkedin_scraper.metrics import MetricsServer, ScraperMetrics
+from linkedin_scraper.pool import WorkerPool
+from linkedin_scraper.proxies import ProxyPool, load_proxies
+from linkedin_scraper.queues import MULTIPROCESSING_BACKEND, TaskQueue, create_queue
+from linkedin_scraper.ratelimit import AdaptiveRateLimiter
+from linkedin_scraper.retries import RetryPolicy, RetryScheduler
+from linkedin_scraper.supervisor import WorkerSupervisor
+from linkedin_scraper.tasks import (
+    DONE,
+    FAILED,
+    GOOGLE_STAGE,
+    LINKEDIN_STAGE,
+    QUEUED_GOOGLE,
+    QUEUED_LINKEDIN,
+    TaskRecord,
+    TaskTable,
+)
+from linkedin_scraper.utils import normalize_company_name, normalize_linkedin_url, read_csv
 from linkedin_scraper.config import (
     LINKEDIN_SCRAPER_GOOGLE_CONCURRENCY,
     LINKEDIN_SCRAPER_LINKEDIN_CONCURRENCY,
+    LINKEDIN_SCRAPER_LINKEDIN_ENGINE,
+    LINKEDIN_SCRAPER_ASYNC_WORKERS,
+    LINKEDIN_SCRAPER_ASYNC_MAX_PAGES,
+    LINKEDIN_SCRAPER_AUTOSCALE,
+    LINKEDIN_SCRAPER_GOOGLE_MIN_WORKERS,
+    LINKEDIN_SCRAPER_LINKEDIN_MIN_WORKERS,
     LINKEDIN_SCRAPER_MAX_GOOGLE_RETRY,
+    LINKEDIN_SCRAPER_MAX_LINKEDIN_RETRY,
+    LINKEDIN_SCRAPER_GOOGLE_RATE,
+    LINKEDIN_SCRAPER_MAX_IN_FLIGHT,
+    LINKEDIN_SCRAPER_TASK_BATCH_SIZE,
+    LINKEDIN_SCRAPER_WORKER_STOP_TIMEOUT,
+    LINKEDIN_SCRAPER_QUEUE_BACKEND,
+    LINKEDIN_SCRAPER_QUEUE_SESSION,
+    LINKEDIN_SCRAPER_METRICS_PORT,
+    LINKEDIN_SCRAPER_METRICS_HOST,
+    LINKEDIN_SCRAPER_NORMALIZE_NAMES,
+    LINKEDIN_SCRAPER_LINKEDIN_RESULTS_CACHE_SIZE,
+    LINKEDIN_SCRAPER_SLUG_RESOLVER,
+    LINKEDIN_SCRAPER_HEDGING,
+    LINKEDIN_SCRAPER_GOOGLE_TASK_TIMEOUT,
+    LINKEDIN_SCRAPER_LINKEDIN_TASK_TIMEOUT,
     LOG_LEVEL,
     LOGGER_NAME,
 )
@@ -23,6 +72,9 @@ from linkedin_scraper.config import (
 
 logger = logging.getLogger(LOGGER_NAME)
 
+# Minimum seconds between checks for tasks to hedge, so the main loop never spins
+MIN_HEDGE_CHECK_INTERVAL = 0.1
+
 
 class ScraperController:
     """
@@ -30,19 +82,147 @@ class ScraperController:
     with the different supported Scraper workers (GoogleScrapeWorker, LinkedinScrapeWorker)
     """
 
-    def __init__(self, show_progress=True):
+    def __init__(
+        self,
+        show_progress=True,
+        google_worker_class: Type[BaseScraperWorker] = GoogleScrapeWorker,
+        linkedin_worker_class: Type[BaseScraperWorker] = None,
+        url_cache: LinkedinUrlCache = None,
+        refresh_cache: bool = False,
+        journal: ResultsJournal = None,
+        autoscale: bool = LINKEDIN_SCRAPER_AUTOSCALE,
+        queue_backend: str = LINKEDIN_SCRAPER_QUEUE_BACKEND,
+        queue_session: str = LINKEDIN_SCRAPER_QUEUE_SESSION,
+        metrics_port: int = LINKEDIN_SCRAPER_METRICS_PORT,
+        metrics_host: str = LINKEDIN_SCRAPER_METRICS_HOST,
+        normalize_names: bool = LINKEDIN_SCRAPER_NORMALIZE_NAMES,
+        proxies: list = None,
+        slug_resolver: bool = LINKEDIN_SCRAPER_SLUG_RESOLVER,
+        hedging: bool = LINKEDIN_SCRAPER_HEDGING,
+    ):
         """
         :param show_progress: Boolean flag to, if enabled, display a command line progress bar.
+        :param google_worker_class: Worker Class used for the Google search stage.
+        :param linkedin_worker_class: Worker Class used for the LinkedIn extraction stage,
+            by default it is selected with the LINKEDIN_SCRAPER_LINKEDIN_ENGINE setting.
+        :param url_cache: Optional company -> LinkedIn url cache, used to skip the Google stage.
+        :param refresh_cache: If enabled, the cache is not read, only updated with fresh results.
+        :param journal: Optional journal where each finished task result is appended, as a checkpoint.
+        :param autoscale: If enabled, the worker pools are resized according to each stage backlog
+            and throughput (see `linkedin_scraper.autoscale`), instead of having a fixed size.
+        :param queue_backend: Backend of the workers queues (see `linkedin_scraper.queues`), the
+            "sqlite" backend allows workers of other hosts to process the tasks.
+        :param queue_session: Name of the session queues on a shared backend, a new one is
+            generated if not set, so concurrent sessions don't consume each other's tasks.
+        :param metrics_port: If set, the session metrics are served in the Prometheus text format
+            at http://<metrics_host>:<metrics_port>/metrics while scraping.
+        :param metrics_host: Address the metrics are served on, only local by default.
+        :param normalize_names: If enabled, equivalent company names (see `utils.normalize_company_name`)
+            are scraped once and share the result, otherwise only identical names are deduplicated.
+        :param proxies: Proxy urls shared by the workers of both stages (see `linkedin_scraper.proxies`),
+            by default they are loaded from the LINKEDIN_SCRAPER_PROXIES* settings.
+        :param slug_resolver: If enabled, the Google workers guess the LinkedIn url of each company
+            (see `scrapers.slug_resolver`), and only search the ones they can't guess in Google.
+        :param hedging: If enabled, the tasks in flight for much longer than the recent tasks of
+            their stage are dispatched again to another worker, and the first result wins
+            (see `linkedin_scraper.hedging`).
         """
-        self._google_scrape_queue = Queue()
-        self._linkedin_scrape_queue = Queue()
-        self._results_queue = Queue()
-        self._workers = []
-        self._results_data = {}
-        self._google_retry_counts = (
-            {}
-        )  # this variable holds the count for the google search retries.
-        self._pending_tasks = []
+        if linkedin_worker_class is None:
+            if LINKEDIN_SCRAPER_LINKEDIN_ENGINE == "async":
+                linkedin_worker_class = AsyncLinkedinScrapeWorker
+            else:
+                linkedin_worker_class = LinkedinScrapeWorker
+
+        self._google_worker_class = google_worker_class
+        self._linkedin_worker_class = linkedin_worker_class
+        self._url_cache = url_cache
+        self._refresh_cache = refresh_cache
+        self._journal = journal
+        self._autoscale = autoscale
+        self._task_batch_size = LINKEDIN_SCRAPER_TASK_BATCH_SIZE
+        self._dispatch_buffers = {}
+        if proxies is None:
+            proxies = load_proxies()
+        self._proxy_pool = ProxyPool(proxies) if proxies else None
+        self._slug_resolver = None
+        # Keyword arguments for the workers of each stage, only the GoogleScrapeWorker ones
+        # support the shared rate limiter and slug resolver, and the GoogleScrapeWorker and
+        # LinkedinScrapeWorker ones the proxy pool. With proxies, Google queries are rate
+        # limited per proxy.
+        self._google_worker_kwargs = {}
+        self._linkedin_worker_kwargs = {}
+        if issubclass(google_worker_class, GoogleScrapeWorker):
+            if slug_resolver:
+                self._slug_resolver = SlugResolver()
+                self._google_worker_kwargs["slug_resolver"] = self._slug_resolver
+            if self._proxy_pool:
+                self._google_worker_kwargs["proxy_pool"] = self._proxy_pool
+                if LINKEDIN_SCRAPER_GOOGLE_RATE > 0:
+                    self._google_worker_kwargs["proxy_rate_limiters"] = {
+                        proxy: AdaptiveRateLimiter() for proxy in proxies
+                    }
+            elif LINKEDIN_SCRAPER_GOOGLE_RATE > 0:
+                self._google_worker_kwargs["rate_limiter"] = AdaptiveRateLimiter()
+        if self._proxy_pool and issubclass(linkedin_worker_class, LinkedinScrapeWorker):
+            self._linkedin_worker_kwargs["proxy_pool"] = self._proxy_pool
+        self._on_result = None
+        self._queue_backend = queue_backend
+        if queue_backend != MULTIPROCESSING_BACKEND and not queue_session:
+            queue_session = uuid.uuid4().hex[:12]
+            logger.info(
+                f"Queue session: {queue_session}, run the workers of other hosts with "
+                f"LINKEDIN_SCRAPER_QUEUE_SESSION={queue_session}"
+            )
+        self._queue_session = queue_session
+        self._google_scrape_queue = create_queue(
+            GOOGLE_STAGE, backend=queue_backend, session=queue_session
+        )
+        self._linkedin_scrape_queue = create_queue(
+            LINKEDIN_STAGE, backend=queue_backend, session=queue_session
+        )
+        self._results_queue = create_queue("results", backend=queue_backend, session=queue_session)
+        # Created before the workers, which share its histograms
+        self._metrics = ScraperMetrics(
+            stages=(GOOGLE_STAGE, LINKEDIN_STAGE),
+            proxy_pool=self._proxy_pool,
+            slug_resolver=self._slug_resolver,
+        )
+        self._metrics_port = metrics_port
+        self._metrics_host = metrics_host
+        self._metrics_server = None
+        # Worker pools, by stage
+        self._pools = {}
+        self._autoscaler = None
+        self._supervisor = None
+        # Maximum seconds a task can run, by stage, before its worker is restarted
+        self._task_timeouts = {
+            GOOGLE_STAGE: LINKEDIN_SCRAPER_GOOGLE_TASK_TIMEOUT,
+            LINKEDIN_STAGE: LINKEDIN_SCRAPER_LINKEDIN_TASK_TIMEOUT,
+        }
+        self._tasks = TaskTable()
+        self._normalize_names = normalize_names
+        # Task id by normalized company name, and the other input names sharing each task
+        self._task_ids_by_key = {}
+        self._aliases = {}
+        # LinkedIn extractions coalescing, by normalized LinkedIn url: the tasks waiting for the
+        # in-flight extraction of another task, and the employee counts already extracted.
+        self._linkedin_waiting = {}
+        self._linkedin_results = OrderedDict()
+        self._linkedin_results_cache_size = LINKEDIN_SCRAPER_LINKEDIN_RESULTS_CACHE_SIZE
+        # Failed tasks wait in the retry scheduler, according to the retry policy of their stage
+        self._retry_policies = {
+            GOOGLE_STAGE: RetryPolicy(max_retries=LINKEDIN_SCRAPER_MAX_GOOGLE_RETRY),
+            LINKEDIN_STAGE: RetryPolicy(max_retries=LINKEDIN_SCRAPER_MAX_LINKEDIN_RETRY),
+        }
+        self._retry_scheduler = RetryScheduler()
+        # Hedged requests: the (dispatch time, task id, input) of the dispatched tasks of each
+        # hedged stage, oldest first, as hedging candidates.
+        self._hedging_policy = None
+        if hedging:
+            self._hedging_policy = HedgingPolicy(
+                {stage: self._metrics.get_latency(stage) for stage in (GOOGLE_STAGE, LINKEDIN_STAGE)}
+            )
+        self._hedge_candidates = {GOOGLE_STAGE: deque(), LINKEDIN_STAGE: deque()}
 
         # Progress bar stuff
         if LOG_LEVEL == "DEBUG":
@@ -59,55 +239,133 @@ class ScraperController:
         This method initializes everything is neeed for the scraping session, such as
         spawning the scraper workers threads.
         """
-        self._pending_tasks = []
-        self._results_data = {}
+        self._tasks = TaskTable()
+        self._task_ids_by_key = {}
+        self._aliases = {}
+        self._linkedin_waiting = {}
+        self._retry_scheduler.clear()
+        self._clear_hedge_candidates()
+        self._google_scrape_queue.reopen()
+        self._linkedin_scrape_queue.reopen()
+        self._metrics.start()
+        if self._metrics_port and self._metrics_server is None:
+            self._metrics_server = MetricsServer(
+                self._metrics, port=self._metrics_port, host=self._metrics_host
+            )
+            self._metrics_server.start()
 
         # Spawn the required amount of workers of each type, according to the variables:
         # LINKEDIN_SCRAPER_GOOGLE_CONCURRENCY, LINKEDIN_SCRAPER_LINKEDIN_CONCURRENCY
+        # (or LINKEDIN_SCRAPER_ASYNC_WORKERS, for the async LinkedIn engine, since each
+        # async worker process already runs many pages concurrently).
+        # With autoscaling, those are the maximum pool sizes, and the pools start at their minimum.
 
-        for worker_id in range(0, LINKEDIN_SCRAPER_GOOGLE_CONCURRENCY):
-            self._spawn_worker_thread(
-                worker_id=worker_id,
-                worker_class=GoogleScrapeWorker,
-                input_queue=self._google_scrape_queue,
+        if issubclass(self._linkedin_worker_class, AsyncLinkedinScrapeWorker):
+            linkedin_concurrency = LINKEDIN_SCRAPER_ASYNC_WORKERS
+        else:
+            linkedin_concurrency = LINKEDIN_SCRAPER_LINKEDIN_CONCURRENCY
+
+        if self._autoscale:
+            google_min_workers = min(
+                LINKEDIN_SCRAPER_GOOGLE_MIN_WORKERS, LINKEDIN_SCRAPER_GOOGLE_CONCURRENCY
             )
+            linkedin_min_workers = min(
+                LINKEDIN_SCRAPER_LINKEDIN_MIN_WORKERS, linkedin_concurrency
+            )
+        else:
+            google_min_workers = LINKEDIN_SCRAPER_GOOGLE_CONCURRENCY
+            linkedin_min_workers = linkedin_concurrency
 
-        for worker_id in range(0, LINKEDIN_SCRAPER_LINKEDIN_CONCURRENCY):
-            self._spawn_worker_thread(
-                worker_id=worker_id,
-                worker_class=LinkedinScrapeWorker,
-                input_queue=self._linkedin_scrape_queue,
+        self._pools = self.create_worker_pools(
+            google_workers=(google_min_workers, LINKEDIN_SCRAPER_GOOGLE_CONCURRENCY),
+            linkedin_workers=(linkedin_min_workers, linkedin_concurrency),
+        )
+
+        self._supervisor = WorkerSupervisor(
+            pools=list(self._pools.values()),
+            task_timeouts=self._task_timeouts,
+            on_task_lost=self._fail_lost_task,
+            metrics=self._metrics,
+        )
+        if self._autoscale:
+            self._autoscaler = Autoscaler(
+                pools=list(self._pools.values()), get_backlog=self._get_stage_backlog
             )
 
+    def create_worker_pools(self, google_workers: tuple, linkedin_workers: tuple) -> dict:
+        """
+        Creates the worker pools of each stage, listening on the controller queues, and spawns
+        their minimum number of workers.
+        :param google_workers: (min, max) number of Google stage workers.
+        :param linkedin_workers: (min, max) number of LinkedIn stage workers.
+        :return: Dict of stage -> `WorkerPool`
+        """
+        if issubclass(self._linkedin_worker_class, AsyncLinkedinScrapeWorker):
+            linkedin_tasks_per_worker = LINKEDIN_SCRAPER_ASYNC_MAX_PAGES
+        else:
+            linkedin_tasks_per_worker = 1
+
+        pools = {
+            GOOGLE_STAGE: WorkerPool(
+                stage=GOOGLE_STAGE,
+                worker_class=self._google_worker_class,
+                input_queue=self._google_scrape_queue,
+                results_queue=self._results_queue,
+                min_size=google_workers[0],
+                max_size=google_workers[1],
+                worker_kwargs={
+                    **self._google_worker_kwargs,
+                    "service_time_histogram": self._metrics.get_service_time(GOOGLE_STAGE),
+                },
+            ),
+            LINKEDIN_STAGE: WorkerPool(
+                stage=LINKEDIN_STAGE,
+                worker_class=self._linkedin_worker_class,
+                input_queue=self._linkedin_scrape_queue,
+                results_queue=self._results_queue,
+                min_size=linkedin_workers[0],
+                max_size=linkedin_workers[1],
+                tasks_per_worker=linkedin_tasks_per_worker,
+                worker_kwargs={
+                    **self._linkedin_worker_kwargs,
+                    "service_time_histogram": self._metrics.get_service_time(LINKEDIN_STAGE),
+                },
+            ),
+        }
+        for pool in pools.values():
+            pool.resize(pool.get_min_size())
+        return pools
+
     def get_workers(self):
         """Useful for testing"""
-        return self._workers
+        return [worker for pool in self._pools.values() for worker in pool.get_workers()]
 
-    def _spawn_worker_thread(
-        self, worker_id: int, worker_class: Type[BaseScraperWorker], input_queue: Queue
-    ):
+    def get_metrics(self) -> ScraperMetrics:
+        """Returns the session metrics, see `ScraperMetrics.summary`"""
+        return self._metrics
+
+    def get_pools(self) -> dict:
+        """Returns the worker pools, by stage"""
+        return self._pools
+
+    def _get_stage_backlog(self, stage: str) -> int:
         """
-        Spawns the required `worker_class` Worker type and keep track of the instance.
-        :param worker_id: Identifier for the worker instance
-        :param worker_class: Worker Class to instantiate
-        :param input_queue: Queue the worker will use to listen for tasks
-        :return: None
+        Returns the number of tasks queued (or in-flight) for `stage`.
         """
-        worker = worker_class(
-            worker_id=worker_id,
-            input_queue=input_queue,
-            results_queue=self._results_queue,
-        )
-        self._workers.append(worker)
-        worker.run_in_thread()
+        if stage == GOOGLE_STAGE:
+            return self._tasks.count(QUEUED_GOOGLE)
+        return self._tasks.count(QUEUED_LINKEDIN)
 
     def _init_progress_bar(self, total: int):
         """
         Initialize the command line progress bar
-        :param total: Integer of total tasks, considered 100%.
+        :param total: Integer of total tasks, considered 100%. None if unknown (streaming mode).
         :return: None
         """
         if self._use_progress_bar:
+            # Imported on first use, it's not needed without progress bar
+            import tqdm
+
             self._progress_bar = tqdm.tqdm(total=total)
 
     def _update_progress_bar(self):
@@ -115,6 +373,7 @@ class ScraperController:
         Refresh the command line progress bar if enabled.
         """
         if self._use_progress_bar:
+            self._progress_bar.set_postfix(self._tasks.counts(), refresh=False)
             self._progress_bar.update(1)
 
             if self._progress_bar.n == self._progress_bar.total:
@@ -130,12 +389,33 @@ class ScraperController:
 
     def remove_task_from_pending(self, task_id: str):
         """
-        Removes the required `task_id` from the pending task list
+        Moves the required `task_id` to its final state (done or failed, according to its status).
         :param task_id:
         :return:
         """
-        if task_id in self._pending_tasks:
-            self._pending_tasks.remove(task_id)
+        record = self._tasks.get(task_id)
+        if record is None or record.is_final():
+            return
+
+        self._tasks.set_state(record, DONE if record.status == "success" else FAILED)
+        self._metrics.record_finished()
+
+        # The result is fanned out to every input name sharing the task
+        result = record.to_dict()
+        company_names = [task_id] + self._aliases.get(task_id, [])
+
+        if self._journal:
+            # The task reached its final status, checkpoint its result
+            for company_name in company_names:
+                self._journal.append(company_name, result)
+
+        if self._on_result:
+            # Streaming mode, hand over the result instead of keeping it in memory
+            self._tasks.pop(task_id)
+            self._aliases.pop(task_id, None)
+            self._task_ids_by_key.pop(self._get_company_key(task_id), None)
+            for company_name in company_names:
+                self._on_result(company_name, dict(result))
 
         self._update_progress_bar()
 
@@ -144,23 +424,48 @@ class ScraperController:
         Sets the result data for the required `task_id`.
         :param task_id:
         :param status:
-        :param data:
+        :param data: Dict with the `linkedin_url` and/or `employee_count` values.
         :return:
         """
-        if task_id not in self._results_data:
-            self._results_data[task_id] = {}
+        record = self._tasks.get(task_id)
+        if record is None:
+            record = self._tasks.add(TaskRecord(task_id, task_id, QUEUED_GOOGLE))
 
         if data:
-            self._results_data[task_id].update(data)
+            for key, value in data.items():
+                setattr(record, key, value)
 
-        self._results_data[task_id]["status"] = status
+        record.status = status
 
     def get_results_data(self) -> dict:
         """
         Returns the Scrape session tasks results
+        :return: Dict of company name -> {"status", "linkedin_url", "employee_count"}, including
+            the names that shared the task of an equivalent name.
+        """
+        results = {}
+        for record in self._tasks:
+            result = record.to_dict()
+            results[record.task_id] = result
+            for company_name in self._aliases.get(record.task_id, ()):
+                results[company_name] = dict(result)
+        return results
+
+    def get_task_counts(self) -> dict:
+        """
+        Returns the number of tasks in each state (see `linkedin_scraper.tasks`)
         :return: Dict
         """
-        return self._results_data
+        return self._tasks.counts()
+
+    def _get_active_task(self, task_id: str):
+        """
+        Returns the task record for `task_id`, or None if the task is unknown or already finished.
+        """
+        record = self._tasks.get(task_id)
+        if record is None or record.is_final():
+            return None
+        return record
 
     def queue_google_scrape(self, task_id: str, input_data: str):
         """
@@ -169,7 +474,11 @@ class ScraperController:
         :param input_data: Input for the task.
         :return: None
         """
-        self._google_scrape_queue.put(("scrape_task", task_id, input_data))
+        record = self._get_active_task(task_id)
+        if record:
+            self._tasks.set_state(record, QUEUED_GOOGLE)
+            self._track_dispatch(GOOGLE_STAGE, record, input_data)
+        self._dispatch_task(self._google_scrape_queue, task_id, input_data)
 
     def queue_linkedin_scrape(self, task_id: str, input_data: str):
         """
@@ -178,7 +487,77 @@ class ScraperController:
         :param input_data: Input for the task.
         :return: None
         """
-        self._linkedin_scrape_queue.put(("scrape_task", task_id, input_data))
+        record = self._get_active_task(task_id)
+        if record:
+            self._tasks.set_state(record, QUEUED_LINKEDIN)
+            self._track_dispatch(LINKEDIN_STAGE, record, input_data)
+        self._dispatch_task(self._linkedin_scrape_queue, task_id, input_data)
+
+    def _track_dispatch(self, stage: str, record: TaskRecord, input_data: str):
+        """
+        Records the dispatch time of a task of `stage`, and tracks it as a hedging candidate.
+        """
+        record.queued_at = time.monotonic()
+        record.hedged = False
+        if self._hedging_policy and stage in self._hedging_policy.get_stages():
+            self._hedging_policy.record_dispatch()
+            self._hedge_candidates[stage].append((record.queued_at, record.task_id, input_data))
+
+    def _dispatch_task(self, queue: TaskQueue, task_id: str, input_data: str):
+        """
+        Sends a task to a worker input queue. With LINKEDIN_SCRAPER_TASK_BATCH_SIZE greater than 1,
+        tasks are buffered and sent in batches, see `flush_dispatched_tasks`.
+        """
+        if self._task_batch_size <= 1:
+            queue.put((SCRAPE_TASK_MESSAGE, task_id, input_data))
+            return
+
+        buffer = self._dispatch_buffers.setdefault(queue, [])
+        buffer.append((task_id, input_data))
+        if len(buffer) >= self._task_batch_size:
+            self._dispatch_buffers[queue] = []
+            queue.put((SCRAPE_BATCH_MESSAGE, None, buffer))
+
+    def flush_dispatched_tasks(self):
+        """
+        Sends the buffered tasks to the workers, even if their batch is not full.
+        It's called every time the controller waits for results, so tasks never wait for a batch
+        to fill up while the workers are idle.
+        """
+        for queue, buffer in self._dispatch_buffers.items():
+            if buffer:
+                self._dispatch_buffers[queue] = []
+                queue.put((SCRAPE_BATCH_MESSAGE, None, buffer))
+
+    def queue_cached_scrape(self, task_id: str, input_data: str) -> bool:
+        """
+        Skips the Google stage for the companies present in the LinkedIn url cache.
+        Cached LinkedIn urls are queued directly for LinkedIn extraction, and negatively
+        cached companies are marked as failed.
+        :param task_id: Task identifier
+        :param input_data: Company name
+        :return: True if the task was resolved from the cache, False if it needs a Google search.
+        """
+        if not self._url_cache or self._refresh_cache:
+            return False
+
+        cached = self._url_cache.get(company_name=input_data)
+        if cached is None:
+            return False
+
+        found, linkedin_url = cached
+        if found:
+            logger.debug(f"Cached LinkedIn url for {input_data}: {linkedin_url}")
+            self.set_task_results_data(
+                task_id=task_id, status="success", data={"linkedin_url": linkedin_url}
+            )
+            self._queue_linkedin_extraction(task_id=task_id, linkedin_url=linkedin_url)
+        else:
+            logger.debug(f"Cached Page not found for {input_data}")
+            self.set_task_results_data(task_id=task_id, status="failed")
+            self.remove_task_from_pending(task_id=task_id)
+
+        return True
 
     def process_google_scrape_result(self, task_id: str, data: tuple, status: str):
         """
@@ -189,24 +568,38 @@ class ScraperController:
         :return: None
         """
         input_data, linkedin_url = data
+        record = self._get_active_task(task_id)
+        if record is None or record.state != QUEUED_GOOGLE:
+            logger.debug(f"Ignoring stale GoogleScrapeWorker result: {task_id}")
+            return
+        self._record_result_metrics(GOOGLE_STAGE, record, status, linkedin_url)
+        if status == "failed" and record.hedged:
+            # The other dispatch of the task is still in flight
+            record.hedged = False
+            return
+
         if status == "success":
             logger.debug(f"Got success result: {input_data} {linkedin_url}")
-            # Queue the second task, LinkedIn page data extraction
-            self.queue_linkedin_scrape(task_id=task_id, input_data=linkedin_url)
+            if self._url_cache:
+                self._url_cache.set(company_name=input_data, linkedin_url=linkedin_url)
 
             self.set_task_results_data(
                 task_id=task_id, status=status, data={"linkedin_url": linkedin_url}
             )
+
+            # Queue the second task, LinkedIn page data extraction
+            self._queue_linkedin_extraction(task_id=task_id, linkedin_url=linkedin_url)
         elif status == "failed":
-            # Retry the failed tasks for a maximum of `RETRY_COUNT` times
-            retry_count = self._google_retry_counts.get(input_data, 0)
-            if retry_count < LINKEDIN_SCRAPER_MAX_GOOGLE_RETRY:
-                # bump the retry count and requeue the task
-                self._google_retry_counts[input_data] = retry_count + 1
+            # Retry the failed tasks later, unless their retry budget is exhausted or they would fail again
+            if self._retry_policies[GOOGLE_STAGE].should_retry(linkedin_url, record.google_retries):
                 logger.debug("failed GoogleScrapeWorker task retrying...")
-                self.queue_google_scrape(task_id=task_id, input_data=input_data)
+                self._schedule_retry(GOOGLE_STAGE, record, input_data, record.google_retries)
+                record.google_retries += 1
             else:
                 logger.error(f"GoogleScrapeWorker failure: {task_id} {data}.")
+                if self._url_cache and linkedin_url == "scrape_error: Page not found":
+                    self._url_cache.set_not_found(company_name=input_data)
+
                 # Can not be retried, set the task status and remove it from pending tasks
                 self.set_task_results_data(task_id=task_id, status=status)
 
@@ -221,9 +614,200 @@ class ScraperController:
         :return: None
         """
         input_data, linkedin_data = data
+        record = self._get_active_task(task_id)
+        if record is None or record.state != QUEUED_LINKEDIN:
+            logger.debug(f"Ignoring stale LinkedinScrapeWorker result: {task_id}")
+            return
+        self._record_result_metrics(LINKEDIN_STAGE, record, status, linkedin_data)
+        if status == "failed" and record.hedged:
+            # The other dispatch of the task is still in flight
+            record.hedged = False
+            return
+
+        if status == "failed" and self._retry_policies[LINKEDIN_STAGE].should_retry(
+            linkedin_data, record.linkedin_retries
+        ):
+            # The tasks waiting for the same company page keep waiting for the retry
+            logger.debug("failed LinkedinScrapeWorker task retrying...")
+            self._schedule_retry(LINKEDIN_STAGE, record, input_data, record.linkedin_retries)
+            record.linkedin_retries += 1
+            return
+
+        self._set_linkedin_result(task_id=task_id, data=data, status=status)
+
+        key = normalize_linkedin_url(input_data)
+        if status == "success":
+            self._linkedin_results[key] = linkedin_data
+            self._linkedin_results.move_to_end(key)
+            if len(self._linkedin_results) > self._linkedin_results_cache_size:
+                self._linkedin_results.popitem(last=False)
+
+        # The tasks waiting for the same company page get the same result
+        for waiting_task_id in self._linkedin_waiting.pop(key, ()):
+            self._set_linkedin_result(task_id=waiting_task_id, data=data, status=status)
+
+    def _queue_linkedin_extraction(self, task_id: str, linkedin_url: str):
+        """
+        Queues the LinkedIn extraction of a task, unless another task already extracted, or is
+        extracting, the same company page (see `utils.normalize_linkedin_url`). In that case the
+        task gets the result of the other task, instead of loading the page again.
+        :param task_id: Task identifier
+        :param linkedin_url: LinkedIn company url of the task.
+        :return: None
+        """
+        key = normalize_linkedin_url(linkedin_url)
+        if key in self._linkedin_results:
+            self._linkedin_results.move_to_end(key)
+            self._metrics.record_coalesced()
+            self._set_linkedin_result(
+                task_id=task_id,
+                data=(linkedin_url, self._linkedin_results[key]),
+                status="success",
+            )
+            return
+
+        waiting = self._linkedin_waiting.get(key)
+        if waiting is not None:
+            logger.debug(f"Waiting for the in-flight LinkedIn extraction of {linkedin_url}: {task_id}")
+            record = self._get_active_task(task_id)
+            if record:
+                self._tasks.set_state(record, QUEUED_LINKEDIN)
+            waiting.append(task_id)
+            self._metrics.record_coalesced()
+            return
+
+        self._linkedin_waiting[key] = []
+        self.queue_linkedin_scrape(task_id=task_id, input_data=linkedin_url)
+
+    def _schedule_retry(self, stage: str, record: TaskRecord, input_data: str, retries: int):
+        """
+        Schedules the retry of a failed task of `stage`, after the backoff delay of its retry policy.
+        :param retries: Number of times the task was already retried in `stage`.
+        """
+        delay = self._retry_policies[stage].get_delay(retries)
+        # Tasks waiting for their retry are not in flight, nor hedged
+        record.queued_at = None
+        self._metrics.record_retry(stage)
+        self._retry_scheduler.schedule(delay, stage, record.task_id, input_data)
+
+    def _dispatch_due_retries(self):
+        """
+        Queues again the failed tasks whose retry delay expired.
+        """
+        for stage, task_id, input_data in self._retry_scheduler.pop_due():
+            record = self._get_active_task(task_id)
+            if record is None or record.state != self._get_stage_state(stage):
+                continue
+            if stage == GOOGLE_STAGE:
+                self.queue_google_scrape(task_id=task_id, input_data=input_data)
+            else:
+                self.queue_linkedin_scrape(task_id=task_id, input_data=input_data)
+
+    @staticmethod
+    def _get_stage_state(stage: str) -> str:
+        """Returns the state of the tasks queued for `stage`"""
+        return QUEUED_GOOGLE if stage == GOOGLE_STAGE else QUEUED_LINKEDIN
+
+    def _dispatch_hedges(self):
+        """
+        Dispatches again the tasks in flight for longer than the hedging threshold of their stage,
+        while the stage has idle workers and the hedging budget allows it (see `HedgingPolicy`).
+        The first result of a hedged task wins, the other one is ignored as a stale result.
+        """
+        if not self._hedging_policy:
+            return
+
+        now = time.monotonic()
+        for stage, candidates in self._hedge_candidates.items():
+            threshold = self._hedging_policy.get_threshold(stage)
+            while candidates:
+                queued_at, task_id, input_data = candidates[0]
+                record = self._get_active_task(task_id)
+                if (
+                    record is None
+                    or record.state != self._get_stage_state(stage)
+                    or record.queued_at != queued_at
+                ):
+                    # Finished, moved to another stage, waiting for a retry or dispatched again
+                    candidates.popleft()
+                    continue
+                if threshold is None or now - queued_at < threshold:
+                    break
+                if not self._has_idle_workers(stage):
+                    break
+
+                candidates.popleft()
+                if not self._hedging_policy.can_hedge():
+                    continue
+                logger.debug(f"Hedging {stage} task in flight for {now - queued_at:.1f}s: {task_id}")
+                record.hedged = True
+                self._hedging_policy.record_hedge()
+                self._metrics.record_hedge(stage)
+                if stage == GOOGLE_STAGE:
+                    self._dispatch_task(self._google_scrape_queue, task_id, input_data)
+                else:
+                    self._dispatch_task(self._linkedin_scrape_queue, task_id, input_data)
+
+    def _has_idle_workers(self, stage: str) -> bool:
+        """Returns True if `stage` has fewer tasks in flight than its workers can run"""
+        pool = self._pools.get(stage)
+        if pool is None:
+            return False
+        return self._get_stage_backlog(stage) < pool.size() * pool.get_tasks_per_worker()
+
+    def _seconds_until_next_hedge(self):
+        """
+        Returns the seconds until the oldest task in flight reaches its hedging threshold,
+        or None if there is no task to hedge.
+        """
+        if not self._hedging_policy:
+            return None
+
+        now = time.monotonic()
+        timeouts = []
+        for stage, candidates in self._hedge_candidates.items():
+            threshold = self._hedging_policy.get_threshold(stage)
+            if candidates and threshold is not None:
+                timeouts.append(candidates[0][0] + threshold - now)
+        if not timeouts:
+            return None
+        return max(min(timeouts), MIN_HEDGE_CHECK_INTERVAL)
+
+    def _clear_hedge_candidates(self):
+        for candidates in self._hedge_candidates.values():
+            candidates.clear()
+
+    def _fail_lost_task(self, stage: str, task_id: str, error: str):
+        """
+        Fails a task of `stage` whose worker was killed, or exited, while running it, so it is
+        retried (or finished) as if the worker had sent the failure.
+        """
+        record = self._get_active_task(task_id)
+        if record is None or record.state != self._get_stage_state(stage):
+            logger.warning(f"Lost {stage} task is not in flight: {task_id}")
+            return
+
+        if stage == GOOGLE_STAGE:
+            data = (record.input_data, f"scrape_error: {error}")
+            self.process_google_scrape_result(task_id=task_id, data=data, status="failed")
+        else:
+            data = (record.linkedin_url, f"scrape_error: {error}")
+            self.process_linkedin_scrape_result(task_id=task_id, data=data, status="failed")
+
+    def _set_linkedin_result(self, task_id: str, data: tuple, status: str):
+        """
+        Sets the LinkedIn extraction result of a task, which reaches its final status.
+        :param task_id: Task identifier
+        :param data: (LinkedIn url, employee count or error message)
+        :param status: Status of the extraction
+        :return: None
+        """
+        if self._get_active_task(task_id) is None:
+            return
+
         if status == "success":
             self.set_task_results_data(
-                task_id=task_id, status=status, data={"employee_count": linkedin_data}
+                task_id=task_id, status=status, data={"employee_count": data[1]}
             )
             logger.info(f"Successful LinkedIn extraction for: {task_id}")
         elif status == "failed":
@@ -232,58 +816,390 @@ class ScraperController:
 
         self.remove_task_from_pending(task_id=task_id)
 
+    def _record_result_metrics(self, stage: str, record: TaskRecord, status: str, data):
+        """
+        Records the latency and status of a task result of `stage`.
+        :param data: Task result, the error message for failed tasks.
+        """
+        latency = None
+        if record.queued_at is not None:
+            latency = time.monotonic() - record.queued_at
+        self._metrics.record_result(
+            stage, status, latency=latency, error=data if status == "failed" else None
+        )
+
+    def _update_metrics_gauges(self):
+        for stage, pool in self._pools.items():
+            self._metrics.set_queue_depth(stage, self._get_stage_backlog(stage))
+            self._metrics.set_workers(stage, pool.size())
+
     def stop(self):
-        """Gracefully stops the scraping session closing the child processes."""
+        """
+        Gracefully stops the scraping session closing the child processes.
+        The tasks not started yet are discarded, and the workers finish their in-flight
+        tasks, whose results are still processed.
+        """
         logger.info("Stopping workers.")
-        for worker in self._workers:
-            worker.stop()
+        self._discard_queued_tasks(self._google_scrape_queue)
+        self._discard_queued_tasks(self._linkedin_scrape_queue)
+        # Shared queues tell the workers of other hosts, which may not get a stop message, that
+        # the session ended
+        self._google_scrape_queue.shutdown()
+        self._linkedin_scrape_queue.shutdown()
 
-        self._workers = []
+        # Every worker consumes a single stop message, so all of them must be sent before
+        # waiting for any worker, since the input queues are shared.
+        for pool in self._pools.values():
+            pool.request_stop()
+
+        # Keep processing results while the workers finish, so in-flight results are not lost.
+        deadline = time.monotonic() + LINKEDIN_SCRAPER_WORKER_STOP_TIMEOUT
+        while time.monotonic() < deadline and any(
+            worker.is_alive() for worker in self.get_workers()
+        ):
+            self._process_next_result(timeout=0.1)
+        while self._process_next_result(timeout=0):
+            pass
+
+        for pool in self._pools.values():
+            pool.stop()
+
+        # Late results may have queued follow up tasks or retries, which won't be processed anymore
+        self._discard_queued_tasks(self._google_scrape_queue)
+        self._discard_queued_tasks(self._linkedin_scrape_queue)
+        self._retry_scheduler.clear()
+        self._clear_hedge_candidates()
+
+        self._pools = {}
+        self._autoscaler = None
+        self._supervisor = None
         self._close_progress_bar()
+        self._update_metrics_gauges()
+        if self._proxy_pool:
+            self._proxy_pool.log_stats()
+        if self._slug_resolver:
+            self._slug_resolver.log_stats()
+
+        if self._metrics_server:
+            self._metrics_server.stop()
+            self._metrics_server = None
+
+        if self._journal:
+            self._journal.flush()
 
-    def scrape(self, company_names_list: list[str]):
+    def _discard_queued_tasks(self, queue: TaskQueue):
+        """
+        Removes all the queued (or buffered for dispatch) messages from `queue`.
+        """
+        self._dispatch_buffers.pop(queue, None)
+        queue.purge()
+
+    def scrape(self, company_names_list: list[str], completed_results: dict = None):
         """
         This method starts the scrape tasks.
         :param company_names_list: List of company names
+        :param completed_results: Optional results of a previous, interrupted, session (see `ResultsJournal.load`).
+            Those companies are not scraped again, and their results are included in the returned data.
         :return:
         """
-        if not len(self._workers):
+        if not self._pools:
             self.initialize()
 
-        # make sure there are no duplicates
-        company_names_list = list(set(company_names_list))
-        self._init_progress_bar(total=len(company_names_list))
+        completed_results = completed_results or {}
+        for task_id, data in completed_results.items():
+            self._tasks.add(TaskRecord.from_dict(task_id, data))
+            self._task_ids_by_key.setdefault(self._get_company_key(task_id), task_id)
 
+        # Skip the already completed companies, and scrape duplicated or equivalent names only once
+        new_company_names = []
+        deduplicated = 0
         for company_name in company_names_list:
-            task_id = company_name  # for task_id we will use the company name
-            self.queue_google_scrape(task_id=task_id, input_data=company_name)
-            self._pending_tasks.append(task_id)
+            if company_name in completed_results:
+                continue
+            if self._register_company(company_name):
+                new_company_names.append(company_name)
+            else:
+                deduplicated += 1
+
+        if completed_results:
+            logger.info(
+                f"Resuming session: {len(completed_results)} companies already completed, "
+                f"{len(new_company_names)} remaining."
+            )
+        if deduplicated:
+            logger.info(
+                f"{deduplicated} duplicated or equivalent company names share the result of "
+                f"another name, saving {deduplicated} queries."
+            )
+        self._init_progress_bar(total=len(new_company_names))
+
+        for company_name in new_company_names:
+            self._queue_new_task(company_name=company_name)
 
         while True:
             # This is the controller main loop, the scraping tasks are queued for the workers
             # and this loops waits for the results.
-            if not len(self._pending_tasks):
+            if not self._tasks.pending_count():
                 # If there are no more pending tasks, finish the main loop.
                 self.stop()
                 break
 
-            try:
-                # listen for task results from the scraper workers
-                worker_type, task_id, data, status = self._results_queue.get(
-                    timeout=0.2
-                )
-            except Empty:
-                continue
+            self._run_main_loop_step()
 
-            logger.debug(f"Got result: {worker_type, task_id, data, status}")
+        return self.get_results_data()
 
-            if worker_type == "GoogleScrapeWorker":
-                self.process_google_scrape_result(
-                    task_id=task_id, data=data, status=status
-                )
-            elif worker_type == "LinkedinScrapeWorker":
-                self.process_linkedin_scrape_result(
-                    task_id=task_id, data=data, status=status
-                )
+    def scrape_stream(
+        self,
+        company_names: Iterable[str],
+        on_result: Callable[[str, dict], None],
+        completed_results: dict = None,
+        max_in_flight: int = LINKEDIN_SCRAPER_MAX_IN_FLIGHT,
+    ):
+        """
+        Streaming variant of `scrape`, for very large inputs.
+        The input is consumed lazily, at most `max_in_flight` tasks are queued for the workers
+        at any time, and each task result is handed to `on_result` (and then discarded) as soon
+        as it reaches its final status, so memory usage does not depend on the input size.
+        Duplicated or equivalent company names are only detected among the in-flight tasks.
+        :param company_names: Iterable of company names, for example `utils.read_csv`
+        :param on_result: Callable receiving the (company_name, result data) of every finished task.
+        :param completed_results: Optional results of a previous, interrupted, session, those companies are skipped.
+        :param max_in_flight: Maximum number of tasks being processed at the same time.
+        :return: None
+        """
+        if not self._pools:
+            self.initialize()
 
-        return self.get_results_data()
+        completed_results = completed_results or {}
+        company_names = iter(company_names)
+        input_exhausted = False
+
+        self._on_result = on_result
+        self._init_progress_bar(total=None)
+        try:
+            while True:
+                if not input_exhausted:
+                    input_exhausted = not self._queue_in_flight_tasks(
+                        company_names, completed_results, max_in_flight
+                    )
+
+                if not len(self._tasks):
+                    break
+
+                self._run_main_loop_step()
+        finally:
+            # On interruptions, stop the workers while `on_result` is still set, so the
+            # results of the in-flight tasks are handed over too.
+            self.stop()
+            self._on_result = None
+
+        self._log_deduplicated()
+
+    def scrape_iter(
+        self,
+        company_names: Iterable[str],
+        completed_results: dict = None,
+        max_in_flight: int = LINKEDIN_SCRAPER_MAX_IN_FLIGHT,
+    ) -> Iterator[tuple]:
+        """
+        Generator variant of `scrape_stream`: yields the (company_name, result data) of every
+        task as soon as it reaches its final status, with the same bounded memory usage.
+        The scraping only progresses while the generator is consumed. Closing it (e.g. leaving
+        the loop early) stops the workers, the results of the in-flight tasks are then only
+        written to the journal, if any.
+        :param company_names: Iterable of company names, for example `utils.read_csv`
+        :param completed_results: Optional results of a previous, interrupted, session, those companies are skipped.
+        :param max_in_flight: Maximum number of tasks being processed at the same time.
+        :return: Iterator of (company_name, result data) tuples.
+        """
+        if not self._pools:
+            self.initialize()
+
+        completed_results = completed_results or {}
+        company_names = iter(company_names)
+        input_exhausted = False
+        finished = deque()
+
+        self._on_result = lambda company_name, result: finished.append((company_name, result))
+        self._init_progress_bar(total=None)
+        try:
+            while True:
+                if not input_exhausted:
+                    input_exhausted = not self._queue_in_flight_tasks(
+                        company_names, completed_results, max_in_flight
+                    )
+
+                # Tasks resolved from the caches finish without waiting for the workers
+                while finished:
+                    yield finished.popleft()
+
+                if not len(self._tasks):
+                    break
+
+                self._run_main_loop_step()
+        finally:
+            self.stop()
+            self._on_result = None
+
+        self._log_deduplicated()
+
+    async def scrape_aiter(
+        self,
+        company_names: Iterable[str],
+        completed_results: dict = None,
+        max_in_flight: int = LINKEDIN_SCRAPER_MAX_IN_FLIGHT,
+    ) -> AsyncIterator[tuple]:
+        """
+        Asynchronous iterator variant of `scrape_iter`, for asyncio applications. The controller
+        waits for the results in a separate thread, so the event loop is never blocked.
+        :param company_names: Iterable of company names, for example `utils.read_csv`
+        :param completed_results: Optional results of a previous, interrupted, session, those companies are skipped.
+        :param max_in_flight: Maximum number of tasks being processed at the same time.
+        :return: Asynchronous iterator of (company_name, result data) tuples.
+        """
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+
+        loop = asyncio.get_running_loop()
+        results = self.scrape_iter(company_names, completed_results, max_in_flight)
+        # A single thread runs all the generator steps, as a plain `scrape_iter` loop would
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            while True:
+                result = await loop.run_in_executor(executor, next, results, None)
+                if result is None:
+                    break
+                yield result
+        finally:
+            await loop.run_in_executor(executor, results.close)
+            executor.shutdown()
+
+    def _queue_in_flight_tasks(
+        self, company_names: Iterator[str], completed_results: dict, max_in_flight: int
+    ) -> bool:
+        """
+        Keeps the workers busy, queueing tasks from `company_names` until there are
+        `max_in_flight` tasks. Completed, duplicated and equivalent company names are skipped.
+        :return: False if `company_names` is exhausted, True otherwise.
+        """
+        while len(self._tasks) < max_in_flight:
+            company_name = next(company_names, None)
+            if company_name is None:
+                return False
+            if company_name not in completed_results and self._register_company(company_name):
+                self._queue_new_task(company_name=company_name)
+        return True
+
+    def _log_deduplicated(self):
+        deduplicated = self._metrics.get_deduplicated()
+        if deduplicated:
+            logger.info(
+                f"{deduplicated} duplicated or equivalent company names shared the result of "
+                f"another name, saving {deduplicated} queries."
+            )
+
+    def _get_company_key(self, company_name: str) -> str:
+        """Returns the key identifying equivalent company names"""
+        if self._normalize_names:
+            return normalize_company_name(company_name)
+        return company_name
+
+    def _register_company(self, company_name: str) -> bool:
+        """
+        Registers an input company name. Only the first of the equivalent names is scraped,
+        the others are recorded as aliases of its task, and get the same result.
+        :param company_name: Company name
+        :return: True if a task must be queued for `company_name`, False if it shares an existing task.
+        """
+        key = self._get_company_key(company_name)
+        task_id = self._task_ids_by_key.get(key)
+        if task_id is None:
+            self._task_ids_by_key[key] = company_name
+            return True
+
+        aliases = self._aliases.setdefault(task_id, [])
+        if company_name != task_id and company_name not in aliases:
+            aliases.append(company_name)
+        self._metrics.record_deduplicated()
+        return False
+
+    def _queue_new_task(self, company_name: str):
+        """
+        Creates the task for a company, and queues its first stage.
+        :param company_name: Company name
+        :return: None
+        """
+        task_id = company_name  # for task_id we will use the company name
+        self._tasks.add(TaskRecord(task_id, company_name, QUEUED_GOOGLE))
+        if not self.queue_cached_scrape(task_id=task_id, input_data=company_name):
+            self.queue_google_scrape(task_id=task_id, input_data=company_name)
+
+    def _run_main_loop_step(self):
+        """
+        Waits for the next task result and processes it, then queues the retries and hedges
+        that are due, updates the metrics gauges, flushes the journal and runs the supervisor
+        and autoscaler if due.
+        """
+        timeouts = [self._retry_scheduler.seconds_until_next(), self._seconds_until_next_hedge()]
+        if self._journal:
+            timeouts.append(self._journal.seconds_until_flush())
+        if self._supervisor:
+            timeouts.append(self._supervisor.seconds_until_next_tick())
+        if self._autoscaler:
+            timeouts.append(self._autoscaler.seconds_until_next_tick())
+        timeouts = [timeout for timeout in timeouts if timeout is not None]
+        timeout = min(timeouts) if timeouts else None
+
+        self._process_next_result(timeout=timeout)
+        self._dispatch_due_retries()
+        self._dispatch_hedges()
+        self._update_metrics_gauges()
+        if self._journal:
+            # The last records must not stay buffered while the results stop coming
+            self._journal.flush_if_due()
+
+        # Workers that exited are replaced by the supervisor before the autoscaler sizes the pools
+        if self._supervisor:
+            self._supervisor.tick()
+        if self._autoscaler:
+            self._autoscaler.tick()
+
+    def _process_next_result(self, timeout: float = None) -> bool:
+        """
+        Waits for the next task result from the scraper workers, and processes it.
+        :param timeout: Maximum seconds to wait for a result, by default it blocks until there is one.
+        :return: True if a result was processed, False if the timeout expired.
+        """
+        self.flush_dispatched_tasks()
+        try:
+            # listen for task results from the scraper workers
+            message = self._results_queue.get(block=timeout != 0, timeout=timeout)
+        except Empty:
+            return False
+
+        worker_type, task_id, data, status = message
+        if status == RESULTS_BATCH_STATUS:
+            for task_id, task_data, task_status in data:
+                self._process_result(worker_type, task_id, task_data, task_status)
+        else:
+            self._process_result(worker_type, task_id, data, status)
+
+        self._results_queue.ack(message)
+        return True
+
+    def _process_result(self, worker_type: str, task_id: str, data: tuple, status: str):
+        """
+        Processes a single task result, according to the worker type that produced it.
+        """
+        logger.debug(f"Got result: {worker_type, task_id, data, status}")
+
+        if worker_type == self._google_worker_class.__name__:
+            if self._autoscaler:
+                self._autoscaler.record_completion(GOOGLE_STAGE)
+            self.process_google_scrape_result(task_id=task_id, data=data, status=status)
+        elif worker_type == self._linkedin_worker_class.__name__:
+            if self._autoscaler:
+                self._autoscaler.record_completion(LINKEDIN_STAGE)
+            self.process_linkedin_scrape_result(
+                task_id=task_id, data=data, status=status
+            )
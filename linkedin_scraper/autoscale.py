@@ -0,0 +1,210 @@
+import math
+import os
+import time
+import logging
+from typing import Callable, Optional
+
+from linkedin_scraper.pool import WorkerPool
+from linkedin_scraper.processes import get_children_by_pid, get_rss_mb
+from linkedin_scraper.config import (
+    LINKEDIN_SCRAPER_AUTOSCALE_INTERVAL,
+    LINKEDIN_SCRAPER_AUTOSCALE_HORIZON,
+    LINKEDIN_SCRAPER_AUTOSCALE_MEMORY_BUDGET_MB,
+    LINKEDIN_SCRAPER_AUTOSCALE_MAX_CPU_LOAD,
+    LINKEDIN_SCRAPER_AUTOSCALE_MIN_FREE_MEMORY_MB,
+    LOGGER_NAME,
+)
+
+logger = logging.getLogger(LOGGER_NAME)
+
+# Weight of the last interval in the per-task service time moving average
+SERVICE_TIME_SMOOTHING = 0.3
+
+
+def get_cpu_load() -> Optional[float]:
+    """
+    Returns the 1 minute load average per CPU core, or None if it is not available on this platform.
+    """
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except (AttributeError, OSError):
+        return None
+
+
+def get_available_memory_mb() -> Optional[float]:
+    """
+    Returns the host available memory in MB, from /proc/meminfo, or None if it can't be read.
+    """
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+class Autoscaler:
+    """
+    Resizes the worker pools of each scraping stage, so the backlog of every stage can be
+    processed within `horizon` seconds.
+
+    The per-task service time of each stage is estimated from the completed tasks between ticks,
+    and the pools only grow while the host has spare CPU and memory, and (if set) while the
+    workers memory stays within `memory_budget_mb`.
+    """
+
+    def __init__(
+        self,
+        pools: list,
+        get_backlog: Callable[[str], int],
+        interval: float = LINKEDIN_SCRAPER_AUTOSCALE_INTERVAL,
+        horizon: float = LINKEDIN_SCRAPER_AUTOSCALE_HORIZON,
+        memory_budget_mb: float = LINKEDIN_SCRAPER_AUTOSCALE_MEMORY_BUDGET_MB,
+        max_cpu_load: float = LINKEDIN_SCRAPER_AUTOSCALE_MAX_CPU_LOAD,
+        min_free_memory_mb: float = LINKEDIN_SCRAPER_AUTOSCALE_MIN_FREE_MEMORY_MB,
+    ):
+        """
+        :param pools: List of `WorkerPool`, one per stage.
+        :param get_backlog: Callable returning the number of queued or in-flight tasks of a stage.
+        :param interval: Seconds between scaling decisions.
+        :param horizon: Seconds in which the current backlog of each stage should be processed.
+        :param memory_budget_mb: Maximum memory of all the workers together, 0 for no limit.
+        :param max_cpu_load: Pools don't grow while the load average per CPU core is above this value.
+        :param min_free_memory_mb: Pools don't grow while the host available memory is below this value.
+        """
+        self._pools = pools
+        self._get_backlog = get_backlog
+        self._interval = interval
+        self._horizon = horizon
+        self._memory_budget_mb = memory_budget_mb
+        self._max_cpu_load = max_cpu_load
+        self._min_free_memory_mb = min_free_memory_mb
+
+        self._completions = {pool.get_stage(): 0 for pool in pools}
+        self._service_times = {}
+        self._last_tick = time.monotonic()
+
+    def get_service_time(self, stage: str) -> Optional[float]:
+        """Returns the estimated seconds a single task of `stage` takes, or None if unknown yet"""
+        return self._service_times.get(stage)
+
+    def record_completion(self, stage: str):
+        """Counts a task result of `stage`, used to estimate its service time"""
+        self._completions[stage] = self._completions.get(stage, 0) + 1
+
+    def seconds_until_next_tick(self) -> float:
+        return max(0.0, self._last_tick + self._interval - time.monotonic())
+
+    def tick(self, force: bool = False):
+        """
+        Resizes the pools, if the scaling interval elapsed since the last decision.
+        :param force: Resize the pools even if the interval did not elapse yet.
+        """
+        now = time.monotonic()
+        elapsed = now - self._last_tick
+        if not force and elapsed < self._interval:
+            return
+        self._last_tick = now
+
+        # The exited workers are left to the `supervisor.WorkerSupervisor`, which reaps and
+        # replaces them, and fails the tasks they were running
+        for pool in self._pools:
+            stage = pool.get_stage()
+            backlog = self._get_backlog(stage)
+            completions = self._completions.get(stage, 0)
+            self._completions[stage] = 0
+            self._update_service_time(pool, backlog, completions, elapsed)
+
+            desired_size = self._get_desired_size(pool, backlog)
+            pool.resize(self._limit_growth(pool, desired_size))
+
+    def _update_service_time(self, pool: WorkerPool, backlog: int, completions: int, elapsed: float):
+        """
+        Updates the moving average of the per-task service time of the pool stage.
+        Only the busy task slots are taken into account, so idle workers don't skew the estimation.
+        """
+        if not completions or elapsed <= 0:
+            return
+
+        slots = pool.size() * pool.get_tasks_per_worker()
+        busy_slots = min(slots, backlog + completions)
+        if not busy_slots:
+            return
+
+        service_time = busy_slots * elapsed / completions
+        stage = pool.get_stage()
+        previous = self._service_times.get(stage)
+        if previous is not None:
+            service_time = (
+                SERVICE_TIME_SMOOTHING * service_time + (1 - SERVICE_TIME_SMOOTHING) * previous
+            )
+        self._service_times[stage] = service_time
+
+    def _get_desired_size(self, pool: WorkerPool, backlog: int) -> int:
+        """
+        Returns the number of workers needed to process the stage backlog within the horizon.
+        """
+        size = pool.size()
+        tasks_per_worker = pool.get_tasks_per_worker()
+        # More workers than tasks would just sit idle
+        max_useful_size = math.ceil(backlog / tasks_per_worker)
+
+        service_time = self._service_times.get(pool.get_stage())
+        if service_time is None:
+            # No throughput data yet, grow one worker at a time while there is backlog
+            desired_size = size + 1 if backlog > size * tasks_per_worker else size
+        else:
+            desired_size = math.ceil(backlog * service_time / self._horizon / tasks_per_worker)
+            # Grow gradually, the service time estimation changes with the pool size
+            desired_size = min(desired_size, size * 2 + 1)
+
+        return min(desired_size, max_useful_size)
+
+    def _limit_growth(self, pool: WorkerPool, desired_size: int) -> int:
+        """
+        Returns the largest size up to `desired_size` the host resources allow for `pool`.
+        """
+        size = pool.size()
+        if desired_size <= size:
+            return desired_size
+
+        cpu_load = get_cpu_load()
+        if cpu_load is not None and cpu_load > self._max_cpu_load:
+            logger.debug(f"Not growing {pool.get_stage()} workers, CPU load {cpu_load:.2f}")
+            return size
+
+        used_memory = 0.0
+        pool_memory = 0.0
+        # A single scan of /proc for all the workers
+        children = get_children_by_pid() or {}
+        for current_pool in self._pools:
+            for worker in current_pool.get_workers():
+                process = worker.get_process()
+                if process is None or process.pid is None:
+                    continue
+                rss = get_rss_mb(process.pid, children=children)
+                used_memory += rss
+                if current_pool is pool:
+                    pool_memory += rss
+
+        # Assume every new worker uses the current average of its pool
+        workers = len(pool.get_workers())
+        worker_memory = pool_memory / workers if workers else 0.0
+
+        free_memory = get_available_memory_mb()
+        if free_memory is not None:
+            free_memory -= self._min_free_memory_mb
+        if self._memory_budget_mb:
+            budget_left = self._memory_budget_mb - used_memory
+            free_memory = budget_left if free_memory is None else min(free_memory, budget_left)
+
+        if free_memory is not None:
+            if free_memory <= 0:
+                logger.debug(f"Not growing {pool.get_stage()} workers, out of memory budget")
+                return size
+            if worker_memory:
+                desired_size = min(desired_size, size + int(free_memory // worker_memory))
+
+        return desired_size
@@ -0,0 +1,101 @@
+import os
+import time
+import sqlite3
+import logging
+from typing import Optional
+
+from linkedin_scraper.config import (
+    LINKEDIN_SCRAPER_CACHE_PATH,
+    LINKEDIN_SCRAPER_CACHE_TTL,
+    LINKEDIN_SCRAPER_CACHE_NEGATIVE_TTL,
+    LOGGER_NAME,
+)
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class LinkedinUrlCache:
+    """
+    Persistent company name -> LinkedIn company page cache, stored in a SQLite database.
+    It allows skipping the Google search stage for already known companies.
+    Companies with no LinkedIn page ("Page not found") are cached as well, with a shorter TTL.
+    """
+
+    def __init__(
+        self,
+        path: str = LINKEDIN_SCRAPER_CACHE_PATH,
+        ttl: int = LINKEDIN_SCRAPER_CACHE_TTL,
+        negative_ttl: int = LINKEDIN_SCRAPER_CACHE_NEGATIVE_TTL,
+    ):
+        """
+        :param path: Path to the SQLite database file, it is created if it does not exist.
+        :param ttl: Seconds a found LinkedIn url is considered valid.
+        :param negative_ttl: Seconds a "Page not found" result is considered valid.
+        """
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS linkedin_urls ("
+            "company_name TEXT PRIMARY KEY, linkedin_url TEXT, expires_at REAL NOT NULL)"
+        )
+        self._connection.commit()
+
+    def get(self, company_name: str) -> Optional[tuple]:
+        """
+        Looks up a company in the cache.
+        :param company_name: Company name, as used for the Google query.
+        :return: None on a cache miss, otherwise a (found, linkedin_url) tuple, where `found`
+            is False for companies negatively cached as "Page not found".
+        """
+        row = self._connection.execute(
+            "SELECT linkedin_url FROM linkedin_urls WHERE company_name = ? AND expires_at > ?",
+            (company_name, time.time()),
+        ).fetchone()
+        if row is None:
+            return None
+
+        linkedin_url = row[0]
+        return linkedin_url is not None, linkedin_url
+
+    def set(self, company_name: str, linkedin_url: str):
+        """
+        Stores the LinkedIn page found for a company.
+        """
+        self._store(company_name, linkedin_url, self._ttl)
+
+    def set_not_found(self, company_name: str):
+        """
+        Stores a negative ("Page not found") result for a company.
+        """
+        self._store(company_name, None, self._negative_ttl)
+
+    def _store(self, company_name: str, linkedin_url: Optional[str], ttl: int):
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO linkedin_urls (company_name, linkedin_url, expires_at) "
+                "VALUES (?, ?, ?)",
+                (company_name, linkedin_url, time.time() + ttl),
+            )
+
+    def prune(self) -> int:
+        """
+        Deletes the expired entries.
+        :return: Number of deleted entries.
+        """
+        with self._connection:
+            cursor = self._connection.execute(
+                "DELETE FROM linkedin_urls WHERE expires_at <= ?", (time.time(),)
+            )
+        logger.info(f"Pruned {cursor.rowcount} expired LinkedIn url cache entries.")
+        return cursor.rowcount
+
+    def close(self):
+        self._connection.close()
@@ -1,20 +1,129 @@
+import os
+import json
 import time
 import sys
 import click
 import logging
 
 from linkedin_scraper import ScraperController
+from linkedin_scraper.cache import LinkedinUrlCache
+from linkedin_scraper.journal import ResultsJournal
+from linkedin_scraper.queues import MULTIPROCESSING_BACKEND
+from linkedin_scraper.sinks import OUTPUT_FORMATS, open_sink
 from linkedin_scraper.utils import read_csv
-from linkedin_scraper.config import LOG_LEVEL, LOGGER_NAME
+from linkedin_scraper.config import (
+    LINKEDIN_SCRAPER_CACHE_PATH,
+    LINKEDIN_SCRAPER_GOOGLE_CONCURRENCY,
+    LINKEDIN_SCRAPER_LINKEDIN_CONCURRENCY,
+    LINKEDIN_SCRAPER_QUEUE_BACKEND,
+    LINKEDIN_SCRAPER_QUEUE_SESSION,
+    LINKEDIN_SCRAPER_METRICS_PORT,
+    LINKEDIN_SCRAPER_METRICS_HOST,
+    LINKEDIN_SCRAPER_OUTPUT_FORMAT,
+    LOG_LEVEL,
+    LOGGER_NAME,
+)
 
 logger = logging.getLogger(LOGGER_NAME)
 
 
+def write_metrics_summary(path: str, scraper_controller: ScraperController):
+    """Writes the session metrics summary as JSON, if a `path` was given."""
+    if path:
+        with open(path, "w") as f:
+            json.dump(scraper_controller.get_metrics().summary(), f, indent=2)
+        logger.info(f"Metrics summary saved to: {path}")
+
+
 @click.command()
 @click.argument("input_csv", type=click.Path(exists=True))
 @click.argument("output_file_path", type=click.Path(exists=False))
 @click.option("--progress/--no-progress", default=True)
-def scrape_companies_csv(input_csv, output_file_path, progress):
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(OUTPUT_FORMATS),
+    default=LINKEDIN_SCRAPER_OUTPUT_FORMAT,
+    show_default=True,
+    help="Output file format. Parquet needs pyarrow.",
+)
+@click.option(
+    "--cache/--no-cache",
+    default=True,
+    help="Use the company -> LinkedIn url cache to skip Google searches.",
+)
+@click.option(
+    "--cache-path",
+    type=click.Path(dir_okay=False),
+    default=LINKEDIN_SCRAPER_CACHE_PATH,
+    show_default=True,
+    help="Path to the LinkedIn url cache database.",
+)
+@click.option(
+    "--refresh-cache",
+    is_flag=True,
+    default=False,
+    help="Ignore the cached entries, search every company again and update the cache.",
+)
+@click.option(
+    "--prune-cache",
+    is_flag=True,
+    default=False,
+    help="Delete the expired cache entries before scraping, even with --no-cache.",
+)
+@click.option(
+    "--journal",
+    "journal_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Path to the checkpoint journal of finished tasks. [default: OUTPUT_FILE_PATH.journal]",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    default=False,
+    help="Resume an interrupted session, skipping the companies already present in the journal.",
+)
+@click.option(
+    "--stream",
+    is_flag=True,
+    default=False,
+    help="Stream the input and write each result as soon as it finishes, with bounded memory usage.",
+)
+@click.option(
+    "--metrics-port",
+    type=int,
+    default=LINKEDIN_SCRAPER_METRICS_PORT,
+    help="Serve the metrics in the Prometheus text format at http://localhost:PORT/metrics.",
+)
+@click.option(
+    "--metrics-host",
+    default=LINKEDIN_SCRAPER_METRICS_HOST,
+    help="Address the metrics are served on, use 0.0.0.0 to reach them from other hosts.",
+)
+@click.option(
+    "--metrics-summary",
+    "metrics_summary_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Path where a JSON summary of the session metrics is written when it finishes.",
+)
+def scrape_companies_csv(
+    input_csv,
+    output_file_path,
+    progress,
+    output_format,
+    cache,
+    cache_path,
+    refresh_cache,
+    prune_cache,
+    journal_path,
+    resume,
+    stream,
+    metrics_port,
+    metrics_host,
+    metrics_summary_path,
+):
     """
     INPUT_CSV: Path to a .csv file containing company names
 
@@ -28,24 +137,129 @@ def scrape_companies_csv(input_csv, output_file_path, progress):
 
     company_names = read_csv(fname=input_csv)
 
+    url_cache = None
+    if cache:
+        url_cache = LinkedinUrlCache(path=cache_path)
+        if prune_cache:
+            url_cache.prune()
+    elif prune_cache and os.path.exists(cache_path):
+        # The session doesn't use the cache, but it was explicitly asked to be pruned
+        unused_cache = LinkedinUrlCache(path=cache_path)
+        unused_cache.prune()
+        unused_cache.close()
+
+    journal_path = journal_path or f"{output_file_path}.journal"
+    completed_results = None
+    if resume:
+        completed_results = ResultsJournal.load(journal_path)
+    elif os.path.exists(journal_path):
+        # Not resuming, start from a clean checkpoint
+        os.remove(journal_path)
+    journal = ResultsJournal(path=journal_path)
+
     logger.info("Starting scraping session")
-    scraper_controller = ScraperController(show_progress=progress)
+    scraper_controller = ScraperController(
+        show_progress=progress,
+        url_cache=url_cache,
+        refresh_cache=refresh_cache,
+        journal=journal,
+        metrics_port=metrics_port,
+        metrics_host=metrics_host,
+    )
+
+    # When streaming, results are written as soon as each task finishes
+    sink = open_sink(output_format, output_file_path)
 
     try:
-        results = scraper_controller.scrape(company_names_list=company_names)
+        if stream:
+            if completed_results:
+                # The output is written again from the journal, it has every finished task,
+                # even those still buffered by the sink when the session was interrupted.
+                sink.write_results(completed_results)
+            scraper_controller.scrape_stream(
+                company_names=company_names,
+                on_result=sink.write,
+                completed_results=completed_results,
+            )
+        else:
+            results = scraper_controller.scrape(
+                company_names_list=company_names, completed_results=completed_results
+            )
+            # Export the results in the output path
+            sink.write_results(results)
     except KeyboardInterrupt:
-        # gracefully stop the child processes
+        # gracefully stop the child processes, and persist the finished tasks
         scraper_controller.stop()
+        journal.close()
+        write_metrics_summary(metrics_summary_path, scraper_controller)
+        logger.info(
+            f"\nScraping interrupted. Finished tasks saved to: {journal_path}, "
+            f"use --resume to continue the session."
+        )
         time.sleep(1)
         sys.exit(0)
+    finally:
+        journal.close()
+        sink.close()
 
-    # Export the results in the output path
-    with open(output_file_path, "w") as f:
-        f.write("company_name, status, linkedin_url, employee_count\n")
-        for k in results.keys():
-            if results[k]["status"] == "success":
-                f.write(
-                    f"{k}, {results[k]['status']}, {results[k]['linkedin_url']}, {results[k]['employee_count']}\n"
-                )
+    # The session is complete, the checkpoint is not needed anymore
+    os.remove(journal_path)
+    write_metrics_summary(metrics_summary_path, scraper_controller)
 
     logger.info(f"\nScraping finished. Results saved to: {output_file_path}")
+
+
+@click.command()
+@click.option(
+    "--google-workers",
+    type=int,
+    default=LINKEDIN_SCRAPER_GOOGLE_CONCURRENCY,
+    show_default=True,
+    help="Number of Google scrape workers.",
+)
+@click.option(
+    "--linkedin-workers",
+    type=int,
+    default=LINKEDIN_SCRAPER_LINKEDIN_CONCURRENCY,
+    show_default=True,
+    help="Number of Linkedin scrape workers.",
+)
+def run_workers(google_workers, linkedin_workers):
+    """
+    Runs scraper workers processing the tasks of a scraping session started on another host.
+    The queues are shared through the "sqlite" queue backend, see LINKEDIN_SCRAPER_QUEUE_BACKEND,
+    LINKEDIN_SCRAPER_QUEUE_PATH and LINKEDIN_SCRAPER_QUEUE_SESSION. The workers exit when the
+    controller shuts the session queues down, once the scraping session finishes.
+    """
+    if LINKEDIN_SCRAPER_QUEUE_BACKEND == MULTIPROCESSING_BACKEND:
+        raise click.UsageError(
+            "Remote workers need a shared queue backend, set LINKEDIN_SCRAPER_QUEUE_BACKEND=sqlite."
+        )
+    if not LINKEDIN_SCRAPER_QUEUE_SESSION:
+        raise click.UsageError(
+            "Set LINKEDIN_SCRAPER_QUEUE_SESSION to the queue session logged by the controller."
+        )
+
+    logging.basicConfig(format="[%(levelname)s] %(asctime)s %(message)s", level=LOG_LEVEL)
+
+    # The controller picks the worker classes and their settings, from the same configuration
+    controller = ScraperController(show_progress=False)
+    pools = list(
+        controller.create_worker_pools(
+            google_workers=(google_workers, google_workers),
+            linkedin_workers=(linkedin_workers, linkedin_workers),
+        ).values()
+    )
+
+    logger.info(f"Started {google_workers} Google and {linkedin_workers} Linkedin workers")
+    try:
+        while any(pool.get_workers() for pool in pools):
+            time.sleep(1)
+            for pool in pools:
+                pool.reap()
+    except KeyboardInterrupt:
+        # The tasks in progress are delivered again to other workers, after their visibility timeout
+        for pool in pools:
+            pool.terminate()
+
+    logger.info("Workers finished")
@@ -3,12 +3,209 @@ import os
 LINKEDIN_SCRAPER_PROXY = os.getenv(
     "LINKEDIN_SCRAPER_PROXY", None,
 )
-LINKEDIN_SCRAPER_GOOGLE_CONCURRENCY = os.getenv(
-    "LINKEDIN_SCRAPER_GOOGLE_CONCURRENCY", 20
+# Proxy pool shared by the Google and LinkedIn workers: comma separated proxy urls, and/or a file
+# with a proxy url per line. LINKEDIN_SCRAPER_PROXY, if set, is part of the pool too.
+LINKEDIN_SCRAPER_PROXIES = os.getenv("LINKEDIN_SCRAPER_PROXIES", "")
+LINKEDIN_SCRAPER_PROXIES_FILE = os.getenv("LINKEDIN_SCRAPER_PROXIES_FILE", None)
+# Seconds a throttled, timed out or failing proxy is not used, doubled on every consecutive cool
+# down up to LINKEDIN_SCRAPER_PROXY_MAX_COOLDOWN, and consecutive errors that cool down a proxy.
+LINKEDIN_SCRAPER_PROXY_COOLDOWN = float(os.getenv("LINKEDIN_SCRAPER_PROXY_COOLDOWN", 30))
+LINKEDIN_SCRAPER_PROXY_MAX_COOLDOWN = float(os.getenv("LINKEDIN_SCRAPER_PROXY_MAX_COOLDOWN", 600))
+LINKEDIN_SCRAPER_PROXY_MAX_ERRORS = int(os.getenv("LINKEDIN_SCRAPER_PROXY_MAX_ERRORS", 3))
+LINKEDIN_SCRAPER_GOOGLE_CONCURRENCY = int(
+    os.getenv("LINKEDIN_SCRAPER_GOOGLE_CONCURRENCY", 20)
 )
-LINKEDIN_SCRAPER_LINKEDIN_CONCURRENCY = os.getenv(
-    "LINKEDIN_SCRAPER_LINKEDIN_CONCURRENCY", 10
+LINKEDIN_SCRAPER_LINKEDIN_CONCURRENCY = int(
+    os.getenv("LINKEDIN_SCRAPER_LINKEDIN_CONCURRENCY", 10)
 )
-LINKEDIN_SCRAPER_MAX_GOOGLE_RETRY = os.getenv("LINKEDIN_SCRAPER_MAX_GOOGLE_RETRY", 3)
+# Resize the worker pools of each stage according to its backlog, throughput and the host
+# resources. The *_CONCURRENCY (or ASYNC_WORKERS) settings become the maximum pool sizes.
+LINKEDIN_SCRAPER_AUTOSCALE = os.getenv(
+    "LINKEDIN_SCRAPER_AUTOSCALE", "false"
+).lower() in ("1", "true", "yes")
+LINKEDIN_SCRAPER_GOOGLE_MIN_WORKERS = int(os.getenv("LINKEDIN_SCRAPER_GOOGLE_MIN_WORKERS", 1))
+LINKEDIN_SCRAPER_LINKEDIN_MIN_WORKERS = int(
+    os.getenv("LINKEDIN_SCRAPER_LINKEDIN_MIN_WORKERS", 1)
+)
+LINKEDIN_SCRAPER_AUTOSCALE_INTERVAL = float(os.getenv("LINKEDIN_SCRAPER_AUTOSCALE_INTERVAL", 5))
+LINKEDIN_SCRAPER_AUTOSCALE_HORIZON = float(os.getenv("LINKEDIN_SCRAPER_AUTOSCALE_HORIZON", 30))
+# Maximum memory (RSS, browsers included) of all the workers together, 0 for no limit.
+LINKEDIN_SCRAPER_AUTOSCALE_MEMORY_BUDGET_MB = float(
+    os.getenv("LINKEDIN_SCRAPER_AUTOSCALE_MEMORY_BUDGET_MB", 0)
+)
+LINKEDIN_SCRAPER_AUTOSCALE_MAX_CPU_LOAD = float(
+    os.getenv("LINKEDIN_SCRAPER_AUTOSCALE_MAX_CPU_LOAD", 0.9)
+)
+LINKEDIN_SCRAPER_AUTOSCALE_MIN_FREE_MEMORY_MB = float(
+    os.getenv("LINKEDIN_SCRAPER_AUTOSCALE_MIN_FREE_MEMORY_MB", 512)
+)
+# How the worker processes are started: "forkserver" (forked from a server process which already
+# imported the scrapers dependencies, safe with a multithreaded controller), "fork" (each worker
+# imports the dependencies it uses) or "spawn". Unsupported methods use the platform default.
+LINKEDIN_SCRAPER_START_METHOD = os.getenv("LINKEDIN_SCRAPER_START_METHOD", "forkserver")
+# Playwright engine used for LinkedIn scraping: "sync" runs one page per worker process,
+# "async" multiplexes up to LINKEDIN_SCRAPER_ASYNC_MAX_PAGES pages per worker process.
+LINKEDIN_SCRAPER_LINKEDIN_ENGINE = os.getenv("LINKEDIN_SCRAPER_LINKEDIN_ENGINE", "sync")
+LINKEDIN_SCRAPER_ASYNC_WORKERS = int(os.getenv("LINKEDIN_SCRAPER_ASYNC_WORKERS", 1))
+LINKEDIN_SCRAPER_ASYNC_MAX_PAGES = int(os.getenv("LINKEDIN_SCRAPER_ASYNC_MAX_PAGES", 50))
+# Try to extract the employee count from the server rendered page with a plain HTTP request,
+# before falling back to the Playwright browser.
+LINKEDIN_SCRAPER_HTTP_FAST_PATH = os.getenv(
+    "LINKEDIN_SCRAPER_HTTP_FAST_PATH", "true"
+).lower() in ("1", "true", "yes")
+LINKEDIN_SCRAPER_HTTP_TIMEOUT = float(os.getenv("LINKEDIN_SCRAPER_HTTP_TIMEOUT", 10))
+LINKEDIN_SCRAPER_HTTP_POOL_SIZE = int(os.getenv("LINKEDIN_SCRAPER_HTTP_POOL_SIZE", 10))
+# Guess the LinkedIn company page url from the company name (i.e. /company/walmart) before
+# searching it in Google, checking at most SLUG_MAX_CANDIDATES urls per company.
+LINKEDIN_SCRAPER_SLUG_RESOLVER = os.getenv(
+    "LINKEDIN_SCRAPER_SLUG_RESOLVER", "false"
+).lower() in ("1", "true", "yes")
+LINKEDIN_SCRAPER_SLUG_MAX_CANDIDATES = int(os.getenv("LINKEDIN_SCRAPER_SLUG_MAX_CANDIDATES", 3))
+# Browser page loads: Playwright resource types aborted (comma separated, empty to load everything),
+# and whether requests to domains other than the page and LINKEDIN_SCRAPER_ALLOWED_DOMAINS ones are aborted.
+LINKEDIN_SCRAPER_BLOCK_RESOURCE_TYPES = tuple(
+    resource_type.strip()
+    for resource_type in os.getenv(
+        "LINKEDIN_SCRAPER_BLOCK_RESOURCE_TYPES", "image,media,font,stylesheet"
+    ).split(",")
+    if resource_type.strip()
+)
+LINKEDIN_SCRAPER_BLOCK_THIRD_PARTY = os.getenv(
+    "LINKEDIN_SCRAPER_BLOCK_THIRD_PARTY", "true"
+).lower() in ("1", "true", "yes")
+LINKEDIN_SCRAPER_ALLOWED_DOMAINS = tuple(
+    domain.strip()
+    for domain in os.getenv("LINKEDIN_SCRAPER_ALLOWED_DOMAINS", "linkedin.com,licdn.com").split(",")
+    if domain.strip()
+)
+# Read the top card as soon as it is attached to the page, instead of waiting for the load event.
+LINKEDIN_SCRAPER_WAIT_FOR_TOP_CARD = os.getenv(
+    "LINKEDIN_SCRAPER_WAIT_FOR_TOP_CARD", "true"
+).lower() in ("1", "true", "yes")
+# Base urls of the scraped services, they can point to local stub servers for benchmarking.
+LINKEDIN_SCRAPER_GOOGLE_BASE_URL = os.getenv(
+    "LINKEDIN_SCRAPER_GOOGLE_BASE_URL", "https://www.google.com"
+).rstrip("/")
+LINKEDIN_SCRAPER_LINKEDIN_BASE_URL = os.getenv(
+    "LINKEDIN_SCRAPER_LINKEDIN_BASE_URL", "https://www.linkedin.com"
+).rstrip("/")
+# Retry budgets of the failed tasks of each stage. Retries are delayed with an exponential backoff,
+# from LINKEDIN_SCRAPER_RETRY_BASE_DELAY up to LINKEDIN_SCRAPER_RETRY_MAX_DELAY seconds, with a
+# random jitter (a fraction of the delay). "Not found" and invalid results are never retried.
+LINKEDIN_SCRAPER_MAX_GOOGLE_RETRY = int(os.getenv("LINKEDIN_SCRAPER_MAX_GOOGLE_RETRY", 3))
+LINKEDIN_SCRAPER_MAX_LINKEDIN_RETRY = int(os.getenv("LINKEDIN_SCRAPER_MAX_LINKEDIN_RETRY", 2))
+LINKEDIN_SCRAPER_RETRY_BASE_DELAY = float(os.getenv("LINKEDIN_SCRAPER_RETRY_BASE_DELAY", 1))
+LINKEDIN_SCRAPER_RETRY_MAX_DELAY = float(os.getenv("LINKEDIN_SCRAPER_RETRY_MAX_DELAY", 60))
+LINKEDIN_SCRAPER_RETRY_JITTER = float(os.getenv("LINKEDIN_SCRAPER_RETRY_JITTER", 0.5))
+# Hedged requests: a task in flight for longer than the HEDGE_QUANTILE of the recent latencies of
+# its stage (over HEDGE_WINDOW seconds, and at least HEDGE_MIN_DELAY seconds) is dispatched again
+# to an idle worker, the first result wins. Hedges are capped to HEDGE_MAX_RATIO of the dispatches.
+LINKEDIN_SCRAPER_HEDGING = os.getenv(
+    "LINKEDIN_SCRAPER_HEDGING", "false"
+).lower() in ("1", "true", "yes")
+LINKEDIN_SCRAPER_HEDGE_STAGES = tuple(
+    stage.strip()
+    for stage in os.getenv("LINKEDIN_SCRAPER_HEDGE_STAGES", "google,linkedin").split(",")
+    if stage.strip()
+)
+LINKEDIN_SCRAPER_HEDGE_QUANTILE = float(os.getenv("LINKEDIN_SCRAPER_HEDGE_QUANTILE", 0.95))
+LINKEDIN_SCRAPER_HEDGE_MIN_DELAY = float(os.getenv("LINKEDIN_SCRAPER_HEDGE_MIN_DELAY", 1))
+LINKEDIN_SCRAPER_HEDGE_MIN_SAMPLES = int(os.getenv("LINKEDIN_SCRAPER_HEDGE_MIN_SAMPLES", 20))
+LINKEDIN_SCRAPER_HEDGE_WINDOW = float(os.getenv("LINKEDIN_SCRAPER_HEDGE_WINDOW", 300))
+LINKEDIN_SCRAPER_HEDGE_MAX_RATIO = float(os.getenv("LINKEDIN_SCRAPER_HEDGE_MAX_RATIO", 0.05))
+# Adaptive rate limit shared by all the Google scrape workers, in queries per second.
+# Set LINKEDIN_SCRAPER_GOOGLE_RATE to 0 to disable it.
+LINKEDIN_SCRAPER_GOOGLE_RATE = float(os.getenv("LINKEDIN_SCRAPER_GOOGLE_RATE", 2))
+LINKEDIN_SCRAPER_GOOGLE_MIN_RATE = float(os.getenv("LINKEDIN_SCRAPER_GOOGLE_MIN_RATE", 0.05))
+LINKEDIN_SCRAPER_GOOGLE_MAX_RATE = float(os.getenv("LINKEDIN_SCRAPER_GOOGLE_MAX_RATE", 20))
+LINKEDIN_SCRAPER_GOOGLE_RATE_INCREASE = float(
+    os.getenv("LINKEDIN_SCRAPER_GOOGLE_RATE_INCREASE", 0.05)
+)
+LINKEDIN_SCRAPER_GOOGLE_RATE_DECREASE = float(
+    os.getenv("LINKEDIN_SCRAPER_GOOGLE_RATE_DECREASE", 0.5)
+)
+LINKEDIN_SCRAPER_MAX_IN_FLIGHT = int(os.getenv("LINKEDIN_SCRAPER_MAX_IN_FLIGHT", 1000))
+# Scrape company names that only differ in case, punctuation or legal suffix ("Walmart", "Walmart Inc.")
+# once, sharing the result. If disabled, only identical names are deduplicated.
+LINKEDIN_SCRAPER_NORMALIZE_NAMES = os.getenv(
+    "LINKEDIN_SCRAPER_NORMALIZE_NAMES", "true"
+).lower() in ("1", "true", "yes")
+# Number of LinkedIn extraction results kept by company url, so companies resolving to an already
+# extracted url reuse its result instead of loading the page again.
+LINKEDIN_SCRAPER_LINKEDIN_RESULTS_CACHE_SIZE = int(
+    os.getenv("LINKEDIN_SCRAPER_LINKEDIN_RESULTS_CACHE_SIZE", 100000)
+)
+# Number of tasks sent to the workers, and of results sent back, in a single queue message.
+LINKEDIN_SCRAPER_TASK_BATCH_SIZE = int(os.getenv("LINKEDIN_SCRAPER_TASK_BATCH_SIZE", 1))
+LINKEDIN_SCRAPER_RESULT_BATCH_SIZE = int(os.getenv("LINKEDIN_SCRAPER_RESULT_BATCH_SIZE", 1))
+LINKEDIN_SCRAPER_BATCH_FLUSH_INTERVAL = float(
+    os.getenv("LINKEDIN_SCRAPER_BATCH_FLUSH_INTERVAL", 0.05)
+)
+LINKEDIN_SCRAPER_WORKER_STOP_TIMEOUT = float(
+    os.getenv("LINKEDIN_SCRAPER_WORKER_STOP_TIMEOUT", 30)
+)
+
+# Worker supervision: a worker running a task for longer than the *_TASK_TIMEOUT seconds of its
+# stage (0 to disable) is killed and replaced, and the task fails with a timeout, so it's retried.
+# Workers are recycled, replaced by a fresh process, after WORKER_MAX_TASKS tasks or once their
+# memory (browser included) goes over WORKER_MAX_RSS_MB, 0 for no limit.
+LINKEDIN_SCRAPER_GOOGLE_TASK_TIMEOUT = float(os.getenv("LINKEDIN_SCRAPER_GOOGLE_TASK_TIMEOUT", 300))
+LINKEDIN_SCRAPER_LINKEDIN_TASK_TIMEOUT = float(
+    os.getenv("LINKEDIN_SCRAPER_LINKEDIN_TASK_TIMEOUT", 300)
+)
+LINKEDIN_SCRAPER_WORKER_MAX_TASKS = int(os.getenv("LINKEDIN_SCRAPER_WORKER_MAX_TASKS", 0))
+LINKEDIN_SCRAPER_WORKER_MAX_RSS_MB = float(os.getenv("LINKEDIN_SCRAPER_WORKER_MAX_RSS_MB", 0))
+LINKEDIN_SCRAPER_SUPERVISOR_INTERVAL = float(os.getenv("LINKEDIN_SCRAPER_SUPERVISOR_INTERVAL", 1))
+LINKEDIN_SCRAPER_CACHE_PATH = os.getenv(
+    "LINKEDIN_SCRAPER_CACHE_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "linkedin_scraper", "linkedin_urls.sqlite3"),
+)
+LINKEDIN_SCRAPER_CACHE_TTL = int(os.getenv("LINKEDIN_SCRAPER_CACHE_TTL", 30 * 24 * 3600))
+LINKEDIN_SCRAPER_CACHE_NEGATIVE_TTL = int(
+    os.getenv("LINKEDIN_SCRAPER_CACHE_NEGATIVE_TTL", 24 * 3600)
+)
+LINKEDIN_SCRAPER_JOURNAL_FLUSH_INTERVAL = float(
+    os.getenv("LINKEDIN_SCRAPER_JOURNAL_FLUSH_INTERVAL", 1.0)
+)
+LINKEDIN_SCRAPER_JOURNAL_FLUSH_RECORDS = int(
+    os.getenv("LINKEDIN_SCRAPER_JOURNAL_FLUSH_RECORDS", 100)
+)
+# Output file format ("csv", "jsonl", "parquet" or "sqlite"). Results are buffered and written in
+# bulk every OUTPUT_FLUSH_ROWS rows or OUTPUT_FLUSH_INTERVAL seconds, Parquet files are written
+# in row groups of PARQUET_ROW_GROUP_SIZE rows.
+LINKEDIN_SCRAPER_OUTPUT_FORMAT = os.getenv("LINKEDIN_SCRAPER_OUTPUT_FORMAT", "csv")
+LINKEDIN_SCRAPER_OUTPUT_FLUSH_ROWS = int(os.getenv("LINKEDIN_SCRAPER_OUTPUT_FLUSH_ROWS", 1000))
+LINKEDIN_SCRAPER_OUTPUT_FLUSH_INTERVAL = float(
+    os.getenv("LINKEDIN_SCRAPER_OUTPUT_FLUSH_INTERVAL", 1.0)
+)
+LINKEDIN_SCRAPER_PARQUET_ROW_GROUP_SIZE = int(
+    os.getenv("LINKEDIN_SCRAPER_PARQUET_ROW_GROUP_SIZE", 100000)
+)
+# Queues between the controller and the workers: "multiprocessing" (single host), or "sqlite"
+# to share the queues with workers of other hosts through a database in a shared volume.
+LINKEDIN_SCRAPER_QUEUE_BACKEND = os.getenv("LINKEDIN_SCRAPER_QUEUE_BACKEND", "multiprocessing")
+LINKEDIN_SCRAPER_QUEUE_PATH = os.getenv(
+    "LINKEDIN_SCRAPER_QUEUE_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "linkedin_scraper", "queues.sqlite3"),
+)
+# Seconds a delivered message stays invisible to the other workers. It restarts when each task of
+# a batch starts, so it must be longer than a single task: twice the longest task timeout by default.
+LINKEDIN_SCRAPER_QUEUE_VISIBILITY_TIMEOUT = float(
+    os.getenv(
+        "LINKEDIN_SCRAPER_QUEUE_VISIBILITY_TIMEOUT",
+        2 * max(LINKEDIN_SCRAPER_GOOGLE_TASK_TIMEOUT, LINKEDIN_SCRAPER_LINKEDIN_TASK_TIMEOUT, 300),
+    )
+)
+LINKEDIN_SCRAPER_QUEUE_POLL_INTERVAL = float(
+    os.getenv("LINKEDIN_SCRAPER_QUEUE_POLL_INTERVAL", 0.05)
+)
+# Name of the scraping session, its queues are kept apart from the ones of the other sessions
+# sharing the database. Remote workers must use the name of the session they work for, the
+# controller generates (and logs) one if not set.
+LINKEDIN_SCRAPER_QUEUE_SESSION = os.getenv("LINKEDIN_SCRAPER_QUEUE_SESSION", "")
+# Port of the Prometheus metrics endpoint (http://host:port/metrics), 0 to disable it, and the
+# address it listens on, only local by default. Use 0.0.0.0 to reach it from other hosts.
+LINKEDIN_SCRAPER_METRICS_PORT = int(os.getenv("LINKEDIN_SCRAPER_METRICS_PORT", 0))
+LINKEDIN_SCRAPER_METRICS_HOST = os.getenv("LINKEDIN_SCRAPER_METRICS_HOST", "127.0.0.1")
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 LOGGER_NAME = "linkedinscraper_logger"
@@ -1,2 +1,40 @@
+import re
+
+
 class ScrapingError(Exception):
     pass
+
+
+class TopCardNotFoundError(ScrapingError):
+    """The LinkedIn page was served without its top card, i.e. an auth wall"""
+    pass
+
+
+# Error classes of the failed task results, see `classify_error`
+THROTTLED_ERROR = "throttled"
+TIMEOUT_ERROR = "timeout"
+NOT_FOUND_ERROR = "not_found"
+INVALID_RESULT_ERROR = "invalid_result"
+OTHER_ERROR = "error"
+
+# HTTP 429 status in an error message, i.e. "HTTP_429_DETECTED" (yagooglesearch), "HTTP 429 fetching ..."
+# or "429 Client Error: Too Many Requests" (requests). A bare 429 elsewhere in the message is not a status.
+HTTP_429_PATTERN = re.compile(r"\bhttp_429_detected\b|\bhttp 429\b|\b429 client error\b|\btoo many requests\b")
+
+
+def classify_error(message: str) -> str:
+    """
+    Classifies the error message of a failed task result (i.e. "scrape_error: Page not found").
+    :param message: Error message returned by the scraper worker.
+    :return: One of the *_ERROR classes.
+    """
+    message = str(message).lower()
+    if HTTP_429_PATTERN.search(message):
+        return THROTTLED_ERROR
+    if "timeout" in message or "timed out" in message:
+        return TIMEOUT_ERROR
+    if "not found" in message or "http 404" in message:
+        return NOT_FOUND_ERROR
+    if "invalid extracted" in message:
+        return INVALID_RESULT_ERROR
+    return OTHER_ERROR
@@ -0,0 +1,114 @@
+import time
+from collections import deque
+from typing import Optional
+
+from linkedin_scraper.metrics import Histogram
+from linkedin_scraper.config import (
+    LINKEDIN_SCRAPER_HEDGE_STAGES,
+    LINKEDIN_SCRAPER_HEDGE_QUANTILE,
+    LINKEDIN_SCRAPER_HEDGE_MIN_DELAY,
+    LINKEDIN_SCRAPER_HEDGE_MIN_SAMPLES,
+    LINKEDIN_SCRAPER_HEDGE_WINDOW,
+    LINKEDIN_SCRAPER_HEDGE_MAX_RATIO,
+)
+
+# Seconds between updates of the hedging thresholds
+THRESHOLD_REFRESH_INTERVAL = 1.0
+
+
+class HedgingPolicy:
+    """
+    Decides when a slow task is hedged: dispatched again to another worker while its first dispatch
+    is still in flight, so a few outliers (a slow proxy, a hung page load) don't hold the session.
+
+    The threshold of each stage is the `quantile` of its task latencies over the last `window`
+    seconds, estimated from the session latency histograms (see `metrics.ScraperMetrics`), and at
+    least `min_delay` seconds. Hedges are capped to `max_ratio` of the dispatched tasks, so they
+    don't add much load on the rate limited services.
+    """
+
+    def __init__(
+        self,
+        latency_histograms: dict,
+        stages: tuple = LINKEDIN_SCRAPER_HEDGE_STAGES,
+        quantile: float = LINKEDIN_SCRAPER_HEDGE_QUANTILE,
+        min_delay: float = LINKEDIN_SCRAPER_HEDGE_MIN_DELAY,
+        min_samples: int = LINKEDIN_SCRAPER_HEDGE_MIN_SAMPLES,
+        window: float = LINKEDIN_SCRAPER_HEDGE_WINDOW,
+        max_ratio: float = LINKEDIN_SCRAPER_HEDGE_MAX_RATIO,
+        refresh_interval: float = THRESHOLD_REFRESH_INTERVAL,
+    ):
+        """
+        :param latency_histograms: Dict of stage -> `Histogram` of the task latencies, from their
+            dispatch to their result.
+        :param stages: Stages whose tasks are hedged.
+        :param quantile: Quantile of the recent latencies a task must exceed to be hedged.
+        :param min_delay: Minimum seconds in flight before a task is hedged.
+        :param min_samples: Minimum number of latencies observed before hedging the tasks of a stage.
+        :param window: Seconds of latencies the quantile is estimated from.
+        :param max_ratio: Maximum number of hedges, as a fraction of the dispatched tasks.
+        :param refresh_interval: Seconds between updates of the thresholds.
+        """
+        self._histograms = {
+            stage: histogram for stage, histogram in latency_histograms.items() if stage in stages
+        }
+        self._quantile = quantile
+        self._min_delay = min_delay
+        self._min_samples = min_samples
+        self._window = window
+        self._max_ratio = max_ratio
+        self._refresh_interval = refresh_interval
+
+        # (time.monotonic(), histogram counts) of each stage, over the last window
+        self._snapshots = {stage: deque() for stage in self._histograms}
+        self._thresholds = {stage: None for stage in self._histograms}
+        self._refreshed_at = None
+        self._dispatches = 0
+        self._hedges = 0
+
+    def get_stages(self) -> tuple:
+        return tuple(self._histograms)
+
+    def get_threshold(self, stage: str) -> Optional[float]:
+        """
+        Returns the seconds in flight after which a task of `stage` is hedged, or None if its
+        tasks are not hedged (yet).
+        """
+        now = time.monotonic()
+        if self._refreshed_at is None or now - self._refreshed_at >= self._refresh_interval:
+            self._refreshed_at = now
+            for histogram_stage, histogram in self._histograms.items():
+                self._thresholds[histogram_stage] = self._get_recent_quantile(
+                    histogram_stage, histogram, now
+                )
+        return self._thresholds.get(stage)
+
+    def _get_recent_quantile(self, stage: str, histogram: Histogram, now: float) -> Optional[float]:
+        counts = histogram.snapshot()[0]
+        snapshots = self._snapshots[stage]
+        snapshots.append((now, counts))
+        # The last snapshot older than the window is the base of the window counts
+        while len(snapshots) > 1 and snapshots[1][0] <= now - self._window:
+            snapshots.popleft()
+
+        recent_counts = [count - base_count for count, base_count in zip(counts, snapshots[0][1])]
+        if sum(recent_counts) < self._min_samples:
+            # Too few recent latencies, use all of them
+            recent_counts = counts
+        if sum(recent_counts) < self._min_samples:
+            return None
+        return max(self._min_delay, histogram.get_quantile(self._quantile, recent_counts))
+
+    def record_dispatch(self):
+        """Records a task dispatch, every dispatch allows `max_ratio` hedges"""
+        self._dispatches += 1
+
+    def can_hedge(self) -> bool:
+        """Returns True if a hedge fits in the hedging budget"""
+        return self._hedges + 1 <= self._max_ratio * self._dispatches
+
+    def record_hedge(self):
+        self._hedges += 1
+
+    def get_hedges(self) -> int:
+        return self._hedges
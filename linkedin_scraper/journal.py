@@ -0,0 +1,118 @@
+import os
+import json
+import time
+import logging
+
+from linkedin_scraper.config import (
+    LINKEDIN_SCRAPER_JOURNAL_FLUSH_INTERVAL,
+    LINKEDIN_SCRAPER_JOURNAL_FLUSH_RECORDS,
+    LOGGER_NAME,
+)
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class ResultsJournal:
+    """
+    Append-only journal of finished scrape tasks, one JSON record per line.
+    It is used as a checkpoint, to resume an interrupted scraping session without
+    scraping again the companies that already reached a final status.
+
+    Writes are buffered, and flushed to the OS every `flush_records` records or
+    `flush_interval` seconds, so journaling does not slow down the results loop.
+    The controller also calls `flush_if_due` while waiting for results, so the last records
+    don't stay buffered when results stop coming. Flushed records survive a crash of the
+    scraper process.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        flush_interval: float = LINKEDIN_SCRAPER_JOURNAL_FLUSH_INTERVAL,
+        flush_records: int = LINKEDIN_SCRAPER_JOURNAL_FLUSH_RECORDS,
+    ):
+        """
+        :param path: Path to the journal file, new records are appended to it.
+        :param flush_interval: Maximum seconds a record stays buffered in memory.
+        :param flush_records: Maximum number of records buffered in memory.
+        """
+        self._path = path
+        self._flush_interval = flush_interval
+        self._flush_records = flush_records
+        self._file = open(path, "a", encoding="utf-8")
+        self._buffered_records = 0
+        self._last_flush = time.monotonic()
+
+    def get_path(self) -> str:
+        return self._path
+
+    @staticmethod
+    def load(path: str) -> dict:
+        """
+        Reads the records of an existing journal.
+        A partially written last line (from a crash in the middle of a write), and any other line
+        that isn't a task record, is ignored.
+        :param path: Path to the journal file.
+        :return: Dict of task_id -> task result data, empty if the journal does not exist.
+        """
+        results = {}
+        if not os.path.exists(path):
+            return results
+
+        with open(path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    logger.warning(f"Skipping corrupted journal line {line_number}.")
+                    continue
+                if not isinstance(record, dict) or not isinstance(record.get("task_id"), str):
+                    logger.warning(f"Skipping invalid journal record at line {line_number}.")
+                    continue
+                task_id = record.pop("task_id")
+                results[task_id] = record
+
+        return results
+
+    def append(self, task_id: str, data: dict):
+        """
+        Appends a finished task result to the journal.
+        :param task_id: Task identifier
+        :param data: Task result data
+        """
+        record = {"task_id": task_id}
+        record.update(data)
+        self._file.write(json.dumps(record) + "\n")
+        self._buffered_records += 1
+
+        if self._buffered_records >= self._flush_records:
+            self.flush()
+        else:
+            self.flush_if_due()
+
+    def seconds_until_flush(self):
+        """
+        Returns the seconds until the buffered records must be flushed, or None if there are none.
+        """
+        if not self._buffered_records:
+            return None
+        return max(0.0, self._last_flush + self._flush_interval - time.monotonic())
+
+    def flush_if_due(self):
+        """Flushes the buffered records, if the oldest one was buffered `flush_interval` seconds ago."""
+        if self._buffered_records and time.monotonic() - self._last_flush >= self._flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Flushes the buffered records to the OS."""
+        self._file.flush()
+        self._buffered_records = 0
+        self._last_flush = time.monotonic()
+
+    def close(self):
+        """Flushes the buffered records to disk and closes the journal file."""
+        if self._file.closed:
+            return
+        self.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
@@ -0,0 +1,415 @@
+import time
+import bisect
+import logging
+import threading
+from collections import Counter
+
+from linkedin_scraper.exceptions import THROTTLED_ERROR, classify_error
+from linkedin_scraper.config import LINKEDIN_SCRAPER_METRICS_HOST, LOGGER_NAME
+from linkedin_scraper.processes import get_context
+from linkedin_scraper.proxies import ProxyPool
+
+logger = logging.getLogger(LOGGER_NAME)
+
+# Upper bounds (in seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Histogram:
+    """
+    Latency histogram with fixed buckets, stored in shared memory: an instance created by the
+    controller aggregates the observations of every worker process it is passed to.
+    """
+
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS):
+        """
+        :param buckets: Sorted upper bounds of the buckets, a last +Inf bucket is implicit.
+        """
+        self._buckets = tuple(buckets)
+        context = get_context()
+        self._lock = context.Lock()
+        self._counts = context.Array("Q", len(self._buckets) + 1, lock=False)
+        self._sum = context.Value("d", 0.0, lock=False)
+
+    def get_buckets(self) -> tuple:
+        return self._buckets
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum.value += value
+
+    def snapshot(self) -> tuple:
+        """Returns the (per bucket counts, sum) of the observations"""
+        with self._lock:
+            return list(self._counts), self._sum.value
+
+    def get_count(self) -> int:
+        return sum(self.snapshot()[0])
+
+    def get_quantile(self, quantile: float, counts: list = None):
+        """
+        Estimates a quantile of the observations, interpolating inside its bucket.
+        :param quantile: Quantile to estimate, between 0 and 1.
+        :param counts: Per bucket counts, by default a new snapshot is taken.
+        :return: The estimated value, or None if there are no observations.
+        """
+        if counts is None:
+            counts = self.snapshot()[0]
+        total = sum(counts)
+        if not total:
+            return None
+
+        rank = quantile * total
+        cumulative = 0
+        for index, count in enumerate(counts):
+            if count and cumulative + count >= rank:
+                if index == len(self._buckets):
+                    # Observations above the last bucket, its bound is the best estimation
+                    return self._buckets[-1]
+                lower = self._buckets[index - 1] if index else 0.0
+                upper = self._buckets[index]
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self._buckets[-1]
+
+    def summary(self) -> dict:
+        counts, total_sum = self.snapshot()
+        count = sum(counts)
+        return {
+            "count": count,
+            "mean": total_sum / count if count else None,
+            "p50": self.get_quantile(0.5, counts),
+            "p95": self.get_quantile(0.95, counts),
+            "p99": self.get_quantile(0.99, counts),
+        }
+
+
+class ScraperMetrics:
+    """
+    Metrics of a scraping session, per stage:
+
+    - Task latency, from the task dispatch to its result (recorded by the controller).
+    - Task service time, the time spent running it (recorded by the workers, see `get_service_time`).
+    - Results by status, retries, hedges, throttled (HTTP 429) results and failures by reason.
+    - Queue depth, number of workers and worker restarts by reason.
+    - Deduplicated inputs, the queries saved by scraping equivalent company names once.
+    - Coalesced LinkedIn extractions, the page loads saved by companies sharing a LinkedIn url.
+    - Requests, outcomes and health of every proxy, if the session uses a proxy pool.
+    - Companies resolved by guessing their LinkedIn url, and the Google queries saved.
+
+    They can be exported in the Prometheus text format (see `MetricsServer`), or as a summary.
+    """
+
+    def __init__(self, stages: tuple, proxy_pool: ProxyPool = None, slug_resolver=None):
+        """
+        :param stages: Names of the scraping stages.
+        :param proxy_pool: Proxy pool of the session, if any.
+        :param slug_resolver: `scrapers.slug_resolver.SlugResolver` of the session, if any.
+        """
+        self._stages = tuple(stages)
+        self._proxy_pool = proxy_pool
+        self._slug_resolver = slug_resolver
+        self._latency = {stage: Histogram() for stage in self._stages}
+        self._service_time = {stage: Histogram() for stage in self._stages}
+        # Counters and gauges are only updated by the controller process, the lock protects
+        # them from the metrics server thread.
+        self._lock = threading.Lock()
+        self._results = Counter()
+        self._retries = Counter()
+        self._hedges = Counter()
+        self._throttled = Counter()
+        self._failures = Counter()
+        self._worker_restarts = Counter()
+        self._queue_depth = {}
+        self._workers = {}
+        self._finished = 0
+        self._deduplicated = 0
+        self._coalesced = 0
+        self._started_at = time.monotonic()
+
+    def start(self):
+        """Starts measuring the session throughput"""
+        self._started_at = time.monotonic()
+
+    def get_latency(self, stage: str) -> Histogram:
+        """Returns the latency histogram of `stage`"""
+        return self._latency[stage]
+
+    def get_service_time(self, stage: str) -> Histogram:
+        """Returns the service time histogram of `stage`, to be observed by its workers"""
+        return self._service_time[stage]
+
+    def record_result(self, stage: str, status: str, latency: float = None, error: str = None):
+        """
+        Records a task result of `stage`.
+        :param latency: Seconds since the task was dispatched, if known.
+        :param error: Error message of failed results.
+        """
+        if latency is not None:
+            self._latency[stage].observe(latency)
+
+        with self._lock:
+            self._results[stage, status] += 1
+            if status == "failed":
+                reason = classify_error(error)
+                self._failures[stage, reason] += 1
+                if reason == THROTTLED_ERROR:
+                    self._throttled[stage] += 1
+
+    def record_retry(self, stage: str):
+        with self._lock:
+            self._retries[stage] += 1
+
+    def record_hedge(self, stage: str):
+        """Records a task dispatched again while its first dispatch is in flight"""
+        with self._lock:
+            self._hedges[stage] += 1
+
+    def record_worker_restart(self, stage: str, reason: str):
+        """Records a worker of `stage` replaced by a new one, see `supervisor.WorkerSupervisor`"""
+        with self._lock:
+            self._worker_restarts[stage, reason] += 1
+
+    def record_finished(self):
+        """Records a task reaching its final state"""
+        with self._lock:
+            self._finished += 1
+
+    def record_deduplicated(self):
+        """Records an input sharing the task of an equivalent company name, saving its queries"""
+        with self._lock:
+            self._deduplicated += 1
+
+    def get_deduplicated(self) -> int:
+        return self._deduplicated
+
+    def record_coalesced(self):
+        """Records a task reusing the LinkedIn extraction of another task with the same url"""
+        with self._lock:
+            self._coalesced += 1
+
+    def set_queue_depth(self, stage: str, depth: int):
+        self._queue_depth[stage] = depth
+
+    def set_workers(self, stage: str, workers: int):
+        self._workers[stage] = workers
+
+    def get_tasks_per_second(self) -> float:
+        elapsed = time.monotonic() - self._started_at
+        return self._finished / elapsed if elapsed > 0 else 0.0
+
+    def summary(self) -> dict:
+        """
+        Returns the session metrics as a JSON serializable dict.
+        """
+        with self._lock:
+            stages = {}
+            for stage in self._stages:
+                stages[stage] = {
+                    "latency_seconds": self._latency[stage].summary(),
+                    "service_time_seconds": self._service_time[stage].summary(),
+                    "results": {
+                        status: count
+                        for (result_stage, status), count in self._results.items()
+                        if result_stage == stage
+                    },
+                    "retries": self._retries[stage],
+                    "hedges": self._hedges[stage],
+                    "throttled": self._throttled[stage],
+                    "failures": {
+                        reason: count
+                        for (failure_stage, reason), count in self._failures.items()
+                        if failure_stage == stage
+                    },
+                    "queue_depth": self._queue_depth.get(stage, 0),
+                    "workers": self._workers.get(stage, 0),
+                    "worker_restarts": {
+                        reason: count
+                        for (restart_stage, reason), count in self._worker_restarts.items()
+                        if restart_stage == stage
+                    },
+                }
+            return {
+                "elapsed_seconds": time.monotonic() - self._started_at,
+                "finished_tasks": self._finished,
+                "tasks_per_second": self.get_tasks_per_second(),
+                "deduplicated_inputs": self._deduplicated,
+                "coalesced_linkedin_scrapes": self._coalesced,
+                "stages": stages,
+                "proxies": self._proxy_pool.stats() if self._proxy_pool else [],
+                "slug_resolver": self._slug_resolver.stats() if self._slug_resolver else None,
+            }
+
+    def to_prometheus(self) -> str:
+        """
+        Returns the metrics in the Prometheus text exposition format.
+        """
+        lines = []
+        for name, description, histograms in (
+            ("task_latency_seconds", "Seconds from the task dispatch to its result.", self._latency),
+            ("task_service_seconds", "Seconds spent by the workers running a task.", self._service_time),
+        ):
+            lines.append(f"# HELP linkedin_scraper_{name} {description}")
+            lines.append(f"# TYPE linkedin_scraper_{name} histogram")
+            for stage, histogram in histograms.items():
+                counts, total_sum = histogram.snapshot()
+                cumulative = 0
+                for bound, count in zip(histogram.get_buckets() + ("+Inf",), counts):
+                    cumulative += count
+                    lines.append(
+                        f'linkedin_scraper_{name}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}'
+                    )
+                lines.append(f'linkedin_scraper_{name}_sum{{stage="{stage}"}} {total_sum}')
+                lines.append(f'linkedin_scraper_{name}_count{{stage="{stage}"}} {cumulative}')
+
+        with self._lock:
+            counters = (
+                ("results_total", "Task results.", ("stage", "status"), self._results),
+                ("retries_total", "Retried tasks.", ("stage",), self._retries),
+                ("hedges_total", "Tasks dispatched again while in flight.", ("stage",), self._hedges),
+                ("throttled_total", "Task results throttled with HTTP 429.", ("stage",), self._throttled),
+                ("failures_total", "Failed task results, by reason.", ("stage", "reason"), self._failures),
+                ("worker_restarts_total", "Replaced workers, by reason.", ("stage", "reason"), self._worker_restarts),
+            )
+            for name, description, label_names, counter in counters:
+                lines.append(f"# HELP linkedin_scraper_{name} {description}")
+                lines.append(f"# TYPE linkedin_scraper_{name} counter")
+                for key, value in sorted(counter.items()):
+                    values = key if isinstance(key, tuple) else (key,)
+                    labels = ",".join(f'{label}="{value}"' for label, value in zip(label_names, values))
+                    lines.append(f"linkedin_scraper_{name}{{{labels}}} {value}")
+
+            gauges = (
+                ("queue_depth", "Tasks queued or in-flight.", self._queue_depth),
+                ("workers", "Running workers.", self._workers),
+            )
+            for name, description, values in gauges:
+                lines.append(f"# HELP linkedin_scraper_{name} {description}")
+                lines.append(f"# TYPE linkedin_scraper_{name} gauge")
+                for stage, value in sorted(values.items()):
+                    lines.append(f'linkedin_scraper_{name}{{stage="{stage}"}} {value}')
+
+            lines.append("# HELP linkedin_scraper_finished_tasks_total Tasks that reached a final state.")
+            lines.append("# TYPE linkedin_scraper_finished_tasks_total counter")
+            lines.append(f"linkedin_scraper_finished_tasks_total {self._finished}")
+
+            lines.append(
+                "# HELP linkedin_scraper_deduplicated_inputs_total Inputs sharing the task of an "
+                "equivalent company name."
+            )
+            lines.append("# TYPE linkedin_scraper_deduplicated_inputs_total counter")
+            lines.append(f"linkedin_scraper_deduplicated_inputs_total {self._deduplicated}")
+
+            lines.append(
+                "# HELP linkedin_scraper_coalesced_linkedin_scrapes_total Tasks reusing the LinkedIn "
+                "extraction of another task with the same url."
+            )
+            lines.append("# TYPE linkedin_scraper_coalesced_linkedin_scrapes_total counter")
+            lines.append(f"linkedin_scraper_coalesced_linkedin_scrapes_total {self._coalesced}")
+
+        if self._proxy_pool:
+            lines.extend(self._proxies_to_prometheus())
+        if self._slug_resolver:
+            lines.extend(self._slug_resolver_to_prometheus())
+
+        lines.append("# HELP linkedin_scraper_tasks_per_second Finished tasks per second.")
+        lines.append("# TYPE linkedin_scraper_tasks_per_second gauge")
+        lines.append(f"linkedin_scraper_tasks_per_second {self.get_tasks_per_second()}")
+        return "\n".join(lines) + "\n"
+
+    def _slug_resolver_to_prometheus(self) -> list:
+        """Returns the Prometheus text format lines of the slug resolver stats"""
+        stats = self._slug_resolver.stats()
+        lines = []
+        for name, key, description in (
+            ("slug_resolver_companies_total", "companies", "Companies looked up by guessing their url."),
+            ("slug_resolver_hits_total", "hits", "Companies resolved without a Google query."),
+            ("slug_resolver_requests_total", "requests", "LinkedIn requests of the url guesses."),
+        ):
+            lines.append(f"# HELP linkedin_scraper_{name} {description}")
+            lines.append(f"# TYPE linkedin_scraper_{name} counter")
+            lines.append(f"linkedin_scraper_{name} {stats[key]}")
+        return lines
+
+    def _proxies_to_prometheus(self) -> list:
+        """Returns the Prometheus text format lines of the proxy pool stats"""
+        proxies_stats = self._proxy_pool.stats()
+        lines = [
+            "# HELP linkedin_scraper_proxy_requests_total Requests through each proxy, by outcome.",
+            "# TYPE linkedin_scraper_proxy_requests_total counter",
+        ]
+        for proxy_stats in proxies_stats:
+            for outcome in ("successes", "throttled", "timeouts", "errors"):
+                lines.append(
+                    f'linkedin_scraper_proxy_requests_total{{proxy="{proxy_stats["proxy"]}",'
+                    f'outcome="{outcome}"}} {proxy_stats[outcome]}'
+                )
+
+        for name, key, description in (
+            ("proxy_success_rate", "success_rate", "Moving average of the proxy success rate."),
+            ("proxy_latency_seconds", "latency_seconds", "Moving average of the proxy request latency."),
+            ("proxy_cooldown_seconds", "cooldown_seconds", "Seconds until the proxy is used again."),
+        ):
+            lines.append(f"# HELP linkedin_scraper_{name} {description}")
+            lines.append(f"# TYPE linkedin_scraper_{name} gauge")
+            for proxy_stats in proxies_stats:
+                lines.append(f'linkedin_scraper_{name}{{proxy="{proxy_stats["proxy"]}"}} {proxy_stats[key]}')
+        return lines
+
+
+class MetricsServer:
+    """
+    HTTP server exposing the session metrics in the Prometheus text format, at /metrics.
+    It runs in a daemon thread of the controller process.
+    """
+
+    def __init__(
+        self, metrics: ScraperMetrics, port: int, host: str = LINKEDIN_SCRAPER_METRICS_HOST
+    ):
+        """
+        :param metrics: Metrics to expose.
+        :param port: Port to listen on, 0 picks a free port (see `get_port`).
+        :param host: Address to listen on, only local connections are accepted by default.
+        """
+        # Imported on first use, most sessions don't serve their metrics
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+
+                body = metrics.to_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(f"Metrics request: {format % args}")
+
+        self._host = host
+        self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    def get_port(self) -> int:
+        return self._server.server_address[1]
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Serving metrics at http://{self._host}:{self.get_port()}/metrics")
+
+    def stop(self):
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
@@ -0,0 +1,167 @@
+import logging
+from typing import Type
+
+from linkedin_scraper.processes import get_context
+from linkedin_scraper.queues import TaskQueue
+from linkedin_scraper.scrapers.base import BaseScraperWorker
+from linkedin_scraper.config import LOGGER_NAME
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class WorkerPool:
+    """
+    Group of workers of the same class, listening on the same input queue.
+    The pool can be resized while running, between `min_size` and `max_size` workers.
+    """
+
+    def __init__(
+        self,
+        stage: str,
+        worker_class: Type[BaseScraperWorker],
+        input_queue: TaskQueue,
+        results_queue: TaskQueue,
+        min_size: int,
+        max_size: int,
+        worker_kwargs: dict = None,
+        tasks_per_worker: int = 1,
+    ):
+        """
+        :param stage: Name of the scraping stage served by the pool, i.e. "google" or "linkedin"
+        :param worker_class: Worker Class to instantiate
+        :param input_queue: Queue the workers will use to listen for tasks
+        :param results_queue: Queue the workers will use to send the tasks results
+        :param min_size: Minimum number of workers
+        :param max_size: Maximum number of workers
+        :param worker_kwargs: Additional keyword arguments for the `worker_class` constructor
+        :param tasks_per_worker: Number of tasks each worker processes concurrently
+        """
+        self._stage = stage
+        self._worker_class = worker_class
+        self._input_queue = input_queue
+        self._results_queue = results_queue
+        self._min_size = min_size
+        self._max_size = max(min_size, max_size)
+        self._worker_kwargs = worker_kwargs or {}
+        self._tasks_per_worker = tasks_per_worker
+
+        self._workers = []
+        self._next_worker_id = 0
+        # Workers asked to exit to shrink the pool, not taken by a worker yet (see
+        # `BaseScraperWorker.stop_requests`). Unlike stop messages, they don't wait for the
+        # queued tasks.
+        self._stop_requests = get_context().Value("i", 0)
+
+    def get_stage(self) -> str:
+        return self._stage
+
+    def get_workers(self) -> list:
+        return self._workers
+
+    def get_min_size(self) -> int:
+        return self._min_size
+
+    def get_max_size(self) -> int:
+        return self._max_size
+
+    def get_tasks_per_worker(self) -> int:
+        return self._tasks_per_worker
+
+    def size(self) -> int:
+        """Returns the number of workers, not counting the ones asked to exit"""
+        running_workers = sum(1 for worker in self._workers if not worker.was_stopped())
+        return running_workers - self._stop_requests.value
+
+    def spawn_worker(self) -> BaseScraperWorker:
+        """
+        Spawns a new worker and keep track of the instance.
+        """
+        worker = self._worker_class(
+            worker_id=self._next_worker_id,
+            input_queue=self._input_queue,
+            results_queue=self._results_queue,
+            stop_requests=self._stop_requests,
+            **self._worker_kwargs,
+        )
+        self._next_worker_id += 1
+        self._workers.append(worker)
+        worker.run_in_thread()
+        return worker
+
+    def replace_worker(self, worker: BaseScraperWorker, timeout: float = None) -> BaseScraperWorker:
+        """
+        Terminates `worker` right away, without waiting for its in-flight task (see
+        `BaseScraperWorker.terminate`), and spawns a new worker in its place.
+        :param timeout: Seconds to wait for the worker to exit before killing it, by default
+            LINKEDIN_SCRAPER_WORKER_STOP_TIMEOUT.
+        """
+        if timeout is None:
+            worker.terminate()
+        else:
+            worker.terminate(timeout)
+        self._workers.remove(worker)
+        return self.spawn_worker()
+
+    def resize(self, size: int):
+        """
+        Grows or shrinks the pool to `size` workers (bounded by `min_size` and `max_size`).
+        Shrinking asks the workers to exit through the pool stop requests, which the first workers
+        to finish their in-flight message take, before any queued task.
+        :param size: Target number of workers.
+        """
+        size = min(self._max_size, max(self._min_size, size))
+        current_size = self.size()
+        if size == current_size:
+            return
+
+        logger.info(f"Resizing {self._stage} workers pool: {current_size} -> {size}")
+        if size > current_size:
+            missing_workers = size - current_size
+            # Cancel the stop requests not taken yet first
+            with self._stop_requests.get_lock():
+                cancelled = min(missing_workers, self._stop_requests.value)
+                self._stop_requests.value -= cancelled
+            for _ in range(missing_workers - cancelled):
+                self.spawn_worker()
+        else:
+            with self._stop_requests.get_lock():
+                self._stop_requests.value += current_size - size
+
+    def reap(self) -> list:
+        """
+        Forgets the workers whose process exited.
+        :return: List of the workers that exited without being asked to.
+        """
+        exited_unexpectedly = []
+        for worker in list(self._workers):
+            process = worker.get_process()
+            if process is None or process.is_alive():
+                continue
+
+            process.join()
+            self._workers.remove(worker)
+            if not worker.was_stopped():
+                exited_unexpectedly.append(worker)
+
+        return exited_unexpectedly
+
+    def request_stop(self):
+        """Asks all the workers to exit, see `BaseScraperWorker.request_stop`"""
+        for worker in self._workers:
+            worker.request_stop()
+
+    def stop(self):
+        """Stops all the workers, see `BaseScraperWorker.stop`"""
+        for worker in self._workers:
+            worker.stop()
+
+        self._workers = []
+        self._stop_requests.value = 0
+
+    def terminate(self):
+        """Terminates all the workers, see `BaseScraperWorker.terminate`"""
+        for worker in self._workers:
+            worker.terminate()
+
+        self._workers = []
+        self._stop_requests.value = 0
@@ -0,0 +1,84 @@
+import os
+import multiprocessing
+from multiprocessing.context import BaseContext
+from typing import Optional
+
+from linkedin_scraper.config import LINKEDIN_SCRAPER_START_METHOD
+
+# Modules imported by the forkserver process before forking the workers, so every worker starts
+# with the heavy scraping dependencies already loaded, while the controller process never imports them.
+FORKSERVER_PRELOAD = [
+    "__main__",
+    "linkedin_scraper.scrapers",
+    "requests",
+    "yagooglesearch",
+    "playwright.sync_api",
+    "playwright.async_api",
+    "playwright_stealth",
+]
+
+_context = None
+
+
+def get_context() -> BaseContext:
+    """
+    Returns the multiprocessing context the workers are started with (see LINKEDIN_SCRAPER_START_METHOD).
+    Queues, locks and shared memory passed to the workers must be created from this context too.
+    """
+    global _context
+    if _context is None:
+        start_method = LINKEDIN_SCRAPER_START_METHOD
+        if start_method not in multiprocessing.get_all_start_methods():
+            start_method = None
+        context = multiprocessing.get_context(start_method)
+        if context.get_start_method() == "forkserver":
+            context.set_forkserver_preload(FORKSERVER_PRELOAD)
+        _context = context
+    return _context
+
+
+def get_children_by_pid() -> Optional[dict]:
+    """
+    Returns the child pids of every process, read from /proc, or None if it can't be read.
+    """
+    children = {}
+    try:
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    # The process name may contain spaces, the fields after it are fixed.
+                    ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+            children.setdefault(ppid, []).append(int(entry))
+    except OSError:
+        return None
+    return children
+
+
+def get_rss_mb(pid: int, children: dict = None) -> float:
+    """
+    Returns the resident memory in MB of process `pid` and all its descendants
+    (e.g. the browser processes of a LinkedIn worker), read from /proc. 0 if it can't be read.
+    :param children: Child pids by pid (see `get_children_by_pid`), to measure many processes
+        from a single scan of /proc. By default /proc is scanned.
+    """
+    if children is None:
+        children = get_children_by_pid()
+        if children is None:
+            return 0.0
+
+    rss_pages = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        pending.extend(children.get(current, []))
+        try:
+            with open(f"/proc/{current}/statm") as f:
+                rss_pages += int(f.read().split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+
+    return rss_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
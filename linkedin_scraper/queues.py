@@ -0,0 +1,327 @@
+import os
+import json
+import time
+import sqlite3
+import logging
+import multiprocessing
+from queue import Empty
+
+from linkedin_scraper.config import (
+    LINKEDIN_SCRAPER_QUEUE_BACKEND,
+    LINKEDIN_SCRAPER_QUEUE_PATH,
+    LINKEDIN_SCRAPER_QUEUE_VISIBILITY_TIMEOUT,
+    LINKEDIN_SCRAPER_QUEUE_POLL_INTERVAL,
+    LINKEDIN_SCRAPER_QUEUE_SESSION,
+    LOGGER_NAME,
+)
+from linkedin_scraper.processes import get_context
+
+logger = logging.getLogger(LOGGER_NAME)
+
+MULTIPROCESSING_BACKEND = "multiprocessing"
+SQLITE_BACKEND = "sqlite"
+
+
+class QueueShutDown(Exception):
+    """Raised by `TaskQueue.get` once the queue was shut down, see `TaskQueue.shutdown`"""
+
+
+class TaskQueue:
+    """
+    Interface of the queues connecting the `ScraperController` and the scraper workers.
+
+    Messages are tuples of JSON serializable values. Consumers must `ack` every message they get
+    once it is fully processed: on the reliable backends, messages not acknowledged within the
+    visibility timeout (e.g. held by a dead worker, or node) are delivered again, so each message
+    is processed at least once.
+    """
+
+    def put(self, message: tuple):
+        raise NotImplementedError
+
+    def get(self, block: bool = True, timeout: float = None) -> tuple:
+        """
+        Returns the next message.
+        :param block: If False, don't wait for a message.
+        :param timeout: Maximum seconds to wait for a message, by default it waits forever.
+        :raises queue.Empty: If there is no message.
+        :raises QueueShutDown: If the queue was shut down.
+        """
+        raise NotImplementedError
+
+    def get_nowait(self) -> tuple:
+        return self.get(block=False)
+
+    def ack(self, message: tuple):
+        """
+        Acknowledges a message returned by `get`, it won't be delivered again.
+        """
+        raise NotImplementedError
+
+    def extend_lease(self, message: tuple):
+        """
+        Restarts the visibility timeout of a message returned by `get` and not acknowledged yet,
+        i.e. when the next task of a batch message starts.
+        """
+        raise NotImplementedError
+
+    def purge(self):
+        """
+        Removes all the messages of the queue, including the ones not acknowledged yet.
+        """
+        raise NotImplementedError
+
+    def shutdown(self):
+        """
+        Marks the queue as shut down, its consumers get `QueueShutDown` instead of waiting for
+        messages, until it is reopened. Consumers the producer can't reach (i.e. workers of other
+        hosts) know the session ended this way.
+        """
+        raise NotImplementedError
+
+    def reopen(self):
+        """Undoes `shutdown`, for a new session on the same queue"""
+        raise NotImplementedError
+
+
+class QueueMessage(tuple):
+    """
+    Message delivered by a `SqliteTaskQueue`, a tuple carrying the id of its database row, so it
+    can be acknowledged.
+    """
+
+    message_id = None
+
+    @classmethod
+    def create(cls, values, message_id: int) -> "QueueMessage":
+        message = cls(values)
+        message.message_id = message_id
+        return message
+
+
+class LocalTaskQueue(TaskQueue):
+    """
+    Single host queue, built on `multiprocessing.Queue`. Messages are removed on delivery, so a
+    message held by a worker that dies is lost.
+    """
+
+    def __init__(self, queue: multiprocessing.Queue = None):
+        """
+        :param queue: multiprocessing.Queue to use, by default a new one is created from the
+            workers multiprocessing context (see `processes.get_context`).
+        """
+        self._queue = queue if queue is not None else get_context().Queue()
+
+    def put(self, message: tuple):
+        self._queue.put(message)
+
+    def get(self, block: bool = True, timeout: float = None) -> tuple:
+        return self._queue.get(block=block, timeout=timeout)
+
+    def ack(self, message: tuple):
+        pass
+
+    def extend_lease(self, message: tuple):
+        pass
+
+    def purge(self):
+        try:
+            while True:
+                self._queue.get_nowait()
+        except Empty:
+            pass
+
+    def shutdown(self):
+        # The consumers are the local workers, the controller sends them stop messages
+        pass
+
+    def reopen(self):
+        pass
+
+
+class SqliteTaskQueue(TaskQueue):
+    """
+    Queue stored in a SQLite database, which can be shared by the controller and workers of
+    several hosts through a shared volume (the database uses the rollback journal, since WAL
+    mode does not work over network file systems).
+
+    Delivered messages stay in the database, invisible for `visibility_timeout` seconds, and
+    are deleted when acknowledged. If the consumer dies before acknowledging a message, it is
+    delivered again once the visibility timeout expires. Host clocks must be in sync.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        path: str = LINKEDIN_SCRAPER_QUEUE_PATH,
+        visibility_timeout: float = LINKEDIN_SCRAPER_QUEUE_VISIBILITY_TIMEOUT,
+        poll_interval: float = LINKEDIN_SCRAPER_QUEUE_POLL_INTERVAL,
+    ):
+        """
+        :param name: Queue name, many queues can be stored in the same database.
+        :param path: Path to the SQLite database file, it is created if it does not exist.
+        :param visibility_timeout: Seconds a delivered message has to be acknowledged before
+            being delivered again. It must be longer than the processing time of a message.
+        :param poll_interval: Seconds between checks for new messages, while waiting.
+        """
+        self._name = name
+        self._path = path
+        self._visibility_timeout = visibility_timeout
+        self._poll_interval = poll_interval
+
+        # Connections can't be shared with forked processes, each process opens its own.
+        self._connection = None
+        self._connection_pid = None
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._get_connection()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        state["_connection_pid"] = None
+        return state
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None or self._connection_pid != os.getpid():
+            # Transactions are handled explicitly, see `_lease_next_message`
+            self._connection = sqlite3.connect(self._path, timeout=30, isolation_level=None)
+            self._connection.execute("PRAGMA journal_mode=DELETE")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS queue_messages ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, queue TEXT NOT NULL, payload TEXT NOT NULL, "
+                "visible_at REAL NOT NULL, deliveries INTEGER NOT NULL DEFAULT 0)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS queue_messages_visible "
+                "ON queue_messages (queue, visible_at, id)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS queue_shutdowns (queue TEXT PRIMARY KEY)"
+            )
+            self._connection_pid = os.getpid()
+        return self._connection
+
+    def put(self, message: tuple):
+        self._get_connection().execute(
+            "INSERT INTO queue_messages (queue, payload, visible_at) VALUES (?, ?, ?)",
+            (self._name, json.dumps(message), time.time()),
+        )
+
+    def _lease_next_message(self):
+        """
+        Takes the oldest visible message, hiding it for the visibility timeout.
+        :return: The message, or None if there is no visible message.
+        :raises QueueShutDown: If the queue was shut down.
+        """
+        connection = self._get_connection()
+        now = time.time()
+        # The write lock is taken before reading, so two consumers never lease the same message
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            shut_down = connection.execute(
+                "SELECT 1 FROM queue_shutdowns WHERE queue = ?", (self._name,)
+            ).fetchone()
+            row = None
+            if shut_down is None:
+                row = connection.execute(
+                    "SELECT id, payload, deliveries FROM queue_messages "
+                    "WHERE queue = ? AND visible_at <= ? ORDER BY id LIMIT 1",
+                    (self._name, now),
+                ).fetchone()
+            if row is not None:
+                connection.execute(
+                    "UPDATE queue_messages SET visible_at = ?, deliveries = deliveries + 1 "
+                    "WHERE id = ?",
+                    (now + self._visibility_timeout, row[0]),
+                )
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+        if shut_down is not None:
+            raise QueueShutDown(self._name)
+        if row is None:
+            return None
+
+        message_id, payload, deliveries = row
+        if deliveries:
+            logger.warning(
+                f"Redelivering message {message_id} of queue {self._name} "
+                f"(delivery {deliveries + 1}), its visibility timeout expired."
+            )
+        return QueueMessage.create(json.loads(payload), message_id)
+
+    def get(self, block: bool = True, timeout: float = None) -> tuple:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            message = self._lease_next_message()
+            if message is not None:
+                return message
+
+            if not block:
+                raise Empty
+            wait = self._poll_interval
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+                if wait <= 0:
+                    raise Empty
+            time.sleep(wait)
+
+    def ack(self, message: tuple):
+        message_id = getattr(message, "message_id", None)
+        if message_id is not None:
+            self._get_connection().execute(
+                "DELETE FROM queue_messages WHERE id = ?", (message_id,)
+            )
+
+    def extend_lease(self, message: tuple):
+        message_id = getattr(message, "message_id", None)
+        if message_id is not None:
+            self._get_connection().execute(
+                "UPDATE queue_messages SET visible_at = ? WHERE id = ?",
+                (time.time() + self._visibility_timeout, message_id),
+            )
+
+    def purge(self):
+        self._get_connection().execute(
+            "DELETE FROM queue_messages WHERE queue = ?", (self._name,)
+        )
+
+    def shutdown(self):
+        self._get_connection().execute(
+            "INSERT OR IGNORE INTO queue_shutdowns (queue) VALUES (?)", (self._name,)
+        )
+
+    def reopen(self):
+        self._get_connection().execute(
+            "DELETE FROM queue_shutdowns WHERE queue = ?", (self._name,)
+        )
+
+    def close(self):
+        if self._connection is not None and self._connection_pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+
+
+def create_queue(
+    name: str,
+    backend: str = LINKEDIN_SCRAPER_QUEUE_BACKEND,
+    session: str = LINKEDIN_SCRAPER_QUEUE_SESSION,
+) -> TaskQueue:
+    """
+    Creates a queue of the configured backend (see LINKEDIN_SCRAPER_QUEUE_BACKEND).
+    :param name: Queue name, queues with the same name and session on the same (shared) backend
+        are the same queue.
+    :param backend: "multiprocessing" (single host) or "sqlite" (hosts sharing the database).
+    :param session: Scraping session the queue belongs to, so the sessions sharing a database
+        don't consume each other's messages (see LINKEDIN_SCRAPER_QUEUE_SESSION).
+    """
+    if backend == MULTIPROCESSING_BACKEND:
+        return LocalTaskQueue()
+    if backend == SQLITE_BACKEND:
+        return SqliteTaskQueue(name=f"{session}/{name}" if session else name)
+    raise ValueError(f"Unknown queue backend: {backend}")
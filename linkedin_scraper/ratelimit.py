@@ -0,0 +1,106 @@
+import time
+import logging
+
+from linkedin_scraper.config import (
+    LINKEDIN_SCRAPER_GOOGLE_RATE,
+    LINKEDIN_SCRAPER_GOOGLE_MIN_RATE,
+    LINKEDIN_SCRAPER_GOOGLE_MAX_RATE,
+    LINKEDIN_SCRAPER_GOOGLE_RATE_INCREASE,
+    LINKEDIN_SCRAPER_GOOGLE_RATE_DECREASE,
+    LOGGER_NAME,
+)
+from linkedin_scraper.processes import get_context
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket rate limiter shared between processes, with an AIMD (additive increase,
+    multiplicative decrease) rate: every successful request raises the rate by `increase`
+    requests per second, and a throttled request (HTTP 429) multiplies it by `decrease`.
+
+    The limiter state lives in shared memory, so a single instance created by the controller
+    is respected by all the worker processes it is passed to.
+    """
+
+    def __init__(
+        self,
+        rate: float = LINKEDIN_SCRAPER_GOOGLE_RATE,
+        min_rate: float = LINKEDIN_SCRAPER_GOOGLE_MIN_RATE,
+        max_rate: float = LINKEDIN_SCRAPER_GOOGLE_MAX_RATE,
+        increase: float = LINKEDIN_SCRAPER_GOOGLE_RATE_INCREASE,
+        decrease: float = LINKEDIN_SCRAPER_GOOGLE_RATE_DECREASE,
+        burst: float = 1.0,
+    ):
+        """
+        :param rate: Initial rate, in requests per second.
+        :param min_rate: The rate is never decreased below this value.
+        :param max_rate: The rate is never increased above this value.
+        :param increase: Requests per second added to the rate on every successful request.
+        :param decrease: Factor applied to the rate when a request is throttled.
+        :param burst: Maximum number of tokens accumulated while idle.
+        """
+        self._min_rate = min_rate
+        self._max_rate = max_rate
+        self._increase = increase
+        self._decrease = decrease
+        self._burst = burst
+
+        context = get_context()
+        self._lock = context.Lock()
+        self._rate = context.Value("d", rate, lock=False)
+        self._tokens = context.Value("d", burst, lock=False)
+        self._updated_at = context.Value("d", time.monotonic(), lock=False)
+        self._decreased_at = context.Value("d", 0.0, lock=False)
+
+    def get_rate(self) -> float:
+        """Returns the current rate, in requests per second"""
+        return self._rate.value
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated_at.value
+        self._tokens.value = min(
+            self._burst, self._tokens.value + elapsed * self._rate.value
+        )
+        self._updated_at.value = now
+
+    def acquire(self):
+        """
+        Blocks until a request is allowed by the current rate.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens.value >= 1:
+                    self._tokens.value -= 1
+                    return
+                wait = (1 - self._tokens.value) / self._rate.value
+            time.sleep(wait)
+
+    def on_success(self):
+        """Additive increase of the rate, after a successful request"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._rate.value = min(self._max_rate, self._rate.value + self._increase)
+
+    def on_throttle(self):
+        """
+        Multiplicative decrease of the rate, after a throttled request.
+        Requests in flight when the throttling started usually fail together, so the rate
+        is decreased at most once per second.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now - self._decreased_at.value < 1:
+                return
+
+            self._decreased_at.value = now
+            self._rate.value = max(self._min_rate, self._rate.value * self._decrease)
+            # Drop the accumulated tokens, the next request waits for the new rate
+            self._tokens.value = 0
+            rate = self._rate.value
+
+        logger.info(f"Throttled, decreasing the request rate to {rate:.2f}/s")
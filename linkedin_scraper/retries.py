@@ -0,0 +1,105 @@
+import time
+import heapq
+import random
+import itertools
+from typing import Optional
+
+from linkedin_scraper.exceptions import INVALID_RESULT_ERROR, NOT_FOUND_ERROR, classify_error
+from linkedin_scraper.config import (
+    LINKEDIN_SCRAPER_RETRY_BASE_DELAY,
+    LINKEDIN_SCRAPER_RETRY_MAX_DELAY,
+    LINKEDIN_SCRAPER_RETRY_JITTER,
+)
+
+# Error classes (see `exceptions.classify_error`) of the failures that would fail again if retried
+PERMANENT_ERRORS = (NOT_FOUND_ERROR, INVALID_RESULT_ERROR)
+
+
+class RetryPolicy:
+    """
+    Retry budget and backoff of the failed tasks of a stage: a task is retried at most
+    `max_retries` times, after an exponential delay with random jitter, unless its failure is
+    permanent (see `PERMANENT_ERRORS`).
+    """
+
+    def __init__(
+        self,
+        max_retries: int,
+        base_delay: float = LINKEDIN_SCRAPER_RETRY_BASE_DELAY,
+        max_delay: float = LINKEDIN_SCRAPER_RETRY_MAX_DELAY,
+        jitter: float = LINKEDIN_SCRAPER_RETRY_JITTER,
+    ):
+        """
+        :param max_retries: Maximum number of retries of a task.
+        :param base_delay: Seconds before the first retry, doubled on every retry.
+        :param max_delay: Maximum seconds before a retry.
+        :param jitter: Random variation of the delays, as a fraction of them, so the tasks
+            failed together (i.e. throttled) are not retried together.
+        """
+        self._max_retries = max_retries
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._jitter = jitter
+
+    def get_max_retries(self) -> int:
+        return self._max_retries
+
+    def should_retry(self, error: str, retries: int) -> bool:
+        """
+        :param error: Error message of the failed task result.
+        :param retries: Number of times the task was already retried.
+        :return: True if the task must be retried.
+        """
+        return retries < self._max_retries and classify_error(error) not in PERMANENT_ERRORS
+
+    def get_delay(self, retries: int) -> float:
+        """
+        Returns the seconds to wait before retrying a task, already retried `retries` times.
+        """
+        delay = min(self._max_delay, self._base_delay * 2 ** retries)
+        return delay * random.uniform(1 - self._jitter, 1 + self._jitter)
+
+
+class RetryScheduler:
+    """
+    Time ordered heap of the tasks waiting for their retry, in the controller process.
+    """
+
+    def __init__(self):
+        self._heap = []
+        # Tie breaker, the entries with the same due time are returned in scheduling order
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def schedule(self, delay: float, stage: str, task_id: str, input_data: str):
+        """
+        Schedules the retry of a task in `delay` seconds.
+        :param stage: Stage the task is retried in.
+        """
+        heapq.heappush(
+            self._heap, (time.monotonic() + delay, next(self._counter), stage, task_id, input_data)
+        )
+
+    def seconds_until_next(self) -> Optional[float]:
+        """Returns the seconds until the next retry is due, or None if there are none"""
+        if not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - time.monotonic())
+
+    def pop_due(self) -> list:
+        """
+        Removes the retries that are due from the heap.
+        :return: List of (stage, task_id, input_data), in due time order.
+        """
+        now = time.monotonic()
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, stage, task_id, input_data = heapq.heappop(self._heap)
+            due.append((stage, task_id, input_data))
+        return due
+
+    def clear(self):
+        """Discards all the scheduled retries"""
+        self._heap = []
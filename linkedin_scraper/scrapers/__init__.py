@@ -1,3 +1,4 @@
 from .base import BaseScraperWorker
 from .google import GoogleScrapeWorker
 from .linkedin import LinkedinScrapeWorker
+from .linkedin_async import AsyncLinkedinScrapeWorker
@@ -1,25 +1,117 @@
+import os
+import json
+import time
 import logging
+import signal
+import sys
 from multiprocessing import Process, Queue
 from queue import Empty
+from typing import Optional, Union
 
-from linkedin_scraper.config import LOGGER_NAME
+from linkedin_scraper.metrics import Histogram
+from linkedin_scraper.processes import get_context, get_rss_mb
+from linkedin_scraper.queues import LocalTaskQueue, QueueShutDown, TaskQueue
+from linkedin_scraper.config import (
+    LINKEDIN_SCRAPER_RESULT_BATCH_SIZE,
+    LINKEDIN_SCRAPER_BATCH_FLUSH_INTERVAL,
+    LINKEDIN_SCRAPER_WORKER_STOP_TIMEOUT,
+    LINKEDIN_SCRAPER_WORKER_MAX_TASKS,
+    LINKEDIN_SCRAPER_WORKER_MAX_RSS_MB,
+    LOGGER_NAME,
+)
 
 logger = logging.getLogger(LOGGER_NAME)
 
+# Input queue message asking the worker that receives it to finish its main loop.
+STOP_MESSAGE = "stop"
+# Input queue message with a single task: (SCRAPE_TASK_MESSAGE, task_id, input_data)
+SCRAPE_TASK_MESSAGE = "scrape_task"
+# Input queue message with many tasks: (SCRAPE_BATCH_MESSAGE, None, [(task_id, input_data), ...])
+SCRAPE_BATCH_MESSAGE = "scrape_batch"
+# Status of a results queue message with many results:
+# (worker_type, None, [(task_id, data, status), ...], RESULTS_BATCH_STATUS)
+RESULTS_BATCH_STATUS = "batch"
+
+# Maximum length of the task id of the running task, as seen by the controller (see `get_running_task`)
+TASK_ID_MAX_BYTES = 1024
+# Maximum length of the JSON encoded ids of the tasks held by the worker (see `get_held_tasks`)
+HELD_TASKS_MAX_BYTES = 64 * 1024
+# Minimum seconds between checks of the worker memory, reading it from /proc is not free
+RSS_CHECK_INTERVAL = 5.0
+# Seconds between checks of the pool stop requests, while waiting for a message
+STOP_CHECK_INTERVAL = 0.5
+
 
 class BaseScraperWorker:
-    def __init__(self, worker_id: int, input_queue: Queue, results_queue: Queue):
+    def __init__(
+        self,
+        worker_id: int,
+        input_queue: Union[TaskQueue, Queue],
+        results_queue: Union[TaskQueue, Queue],
+        result_batch_size: int = LINKEDIN_SCRAPER_RESULT_BATCH_SIZE,
+        result_flush_interval: float = LINKEDIN_SCRAPER_BATCH_FLUSH_INTERVAL,
+        service_time_histogram: Histogram = None,
+        max_tasks: int = LINKEDIN_SCRAPER_WORKER_MAX_TASKS,
+        max_rss_mb: float = LINKEDIN_SCRAPER_WORKER_MAX_RSS_MB,
+        stop_requests=None,
+    ):
         """
         This is the base Class that defines the interface for the different Scraper workers.
         :param worker_id: Identifier for the worker instance.
-        :param input_queue: Queue where the worker will listen for input tasks.
+        :param input_queue: Queue where the worker will listen for input tasks, a `TaskQueue`
+            or a `multiprocessing.Queue` created from the workers context (see `processes.get_context`).
         :param results_queue: Queue for sending the tasks results.
+        :param result_batch_size: Maximum number of task results sent in a single results queue message.
+        :param result_flush_interval: Maximum seconds a task result waits for its batch to fill up.
+        :param service_time_histogram: Optional (shared) histogram where the duration of every task is recorded.
+        :param max_tasks: The worker exits after running this number of tasks, to be replaced by a
+            fresh process (see `supervisor.WorkerSupervisor`), 0 for no limit.
+        :param max_rss_mb: The worker exits once its memory, child processes included, goes over
+            this number of MB, 0 for no limit.
+        :param stop_requests: Optional shared counter (multiprocessing Value) of the workers a pool
+            asked to exit, see `pool.WorkerPool.resize`. Workers consume the requests between messages,
+            ahead of the queued tasks.
         """
         self._worker_type = self.__class__.__name__
         self._worker_id = worker_id
-        self._input_queue: Queue = input_queue
-        self._results_queue: Queue = results_queue
+        if input_queue is not None and not isinstance(input_queue, TaskQueue):
+            input_queue = LocalTaskQueue(queue=input_queue)
+        if results_queue is not None and not isinstance(results_queue, TaskQueue):
+            results_queue = LocalTaskQueue(queue=results_queue)
+        self._input_queue: TaskQueue = input_queue
+        self._results_queue: TaskQueue = results_queue
         self._process = None
+        self._stop_requested = False
+        self._result_batch_size = result_batch_size
+        self._result_flush_interval = result_flush_interval
+        self._results_buffer = []
+        self._results_buffer_deadline = 0.0
+        # Processed input messages, acknowledged once their buffered results are sent
+        self._pending_acks = []
+        self._service_time_histogram = service_time_histogram
+        self._max_tasks = max_tasks
+        self._max_rss_mb = max_rss_mb
+        self._tasks_processed = 0
+        self._rss_checked_at = 0.0
+        # The task the worker is running, and since when (time.monotonic(), 0 while idle), shared
+        # with the controller process, which kills the workers stuck on a task.
+        context = get_context()
+        self._task_started_at = context.Value("d", 0.0, lock=False)
+        self._running_task_id = context.Array("c", TASK_ID_MAX_BYTES, lock=False)
+        # The tasks received and whose result was not sent yet, so the controller knows every task
+        # lost when the worker dies: the rest of a batch message, or the buffered results.
+        self._held_task_ids = []
+        self._held_tasks = context.Array("c", HELD_TASKS_MAX_BYTES, lock=False)
+        self._stop_requests = stop_requests
+        # Set once the worker exits because it was asked to, shared with the worker pool
+        self._stopped = context.Value("b", 0, lock=False)
+
+    def __getstate__(self):
+        # The worker is pickled into its child process by the "forkserver" and "spawn" start
+        # methods, the parent side process handle can't be pickled.
+        state = self.__dict__.copy()
+        state["_process"] = None
+        return state
 
     def get_worker_type(self):
         """Returns the worker class type"""
@@ -29,52 +121,325 @@ class BaseScraperWorker:
         """Useful for testing"""
         return self._process
 
+    def get_running_task(self) -> Optional[tuple]:
+        """
+        Returns the (task id, seconds running) of the task the worker is running, or None if it is idle.
+        Task ids longer than TASK_ID_MAX_BYTES are truncated.
+        """
+        started_at = self._task_started_at.value
+        if not started_at:
+            return None
+        task_id = self._running_task_id.value.decode("utf-8", errors="ignore")
+        return task_id, time.monotonic() - started_at
+
+    def was_stopped(self) -> bool:
+        """Returns True if the worker exited, or is exiting, because it was asked to"""
+        return bool(self._stopped.value)
+
+    def _consume_stop_request(self) -> bool:
+        """Takes one of the pool stop requests, if there is any left"""
+        if self._stop_requests is None:
+            return False
+        with self._stop_requests.get_lock():
+            if self._stop_requests.value <= 0:
+                return False
+            self._stop_requests.value -= 1
+            # Set while holding the lock, so the pool never counts the request twice
+            self._stopped.value = 1
+        return True
+
+    def get_held_tasks(self) -> list:
+        """
+        Returns the ids of the tasks the worker received and whose result it did not send yet, the
+        running ones included. Only consistent once the worker process exited.
+        """
+        held_tasks = self._held_tasks.value
+        if not held_tasks:
+            return []
+        try:
+            return json.loads(held_tasks.decode("utf-8"))
+        except ValueError:
+            logger.warning(f"{self.get_worker_type()} {self._worker_id} held tasks are corrupted")
+            return []
+
+    def _hold_tasks(self, task_ids: list):
+        self._held_task_ids.extend(task_ids)
+        self._publish_held_tasks()
+
+    def _release_tasks(self, task_ids: list):
+        for task_id in task_ids:
+            # A task can be held twice, if it was hedged to the same worker
+            if task_id in self._held_task_ids:
+                self._held_task_ids.remove(task_id)
+        self._publish_held_tasks()
+
+    def _publish_held_tasks(self):
+        task_ids = self._held_task_ids
+        held_tasks = json.dumps(task_ids).encode("utf-8")
+        while len(held_tasks) >= HELD_TASKS_MAX_BYTES:
+            task_ids = task_ids[: len(task_ids) // 2]
+            held_tasks = json.dumps(task_ids).encode("utf-8")
+        if len(task_ids) < len(self._held_task_ids):
+            logger.warning(
+                f"{self.get_worker_type()} {self._worker_id} holds too many tasks to share them, "
+                f"{len(self._held_task_ids) - len(task_ids)} would be lost if it dies."
+            )
+        self._held_tasks.value = held_tasks
+
+    def _set_running_task(self, task_id: Optional[str]):
+        if task_id is None:
+            self._task_started_at.value = 0.0
+            return
+        # The id is set first, the controller only reads it once the start time is set
+        self._running_task_id.value = str(task_id).encode("utf-8")[: TASK_ID_MAX_BYTES - 1]
+        self._task_started_at.value = time.monotonic()
+
+    def should_recycle(self) -> bool:
+        """
+        Returns True if the worker must exit to be replaced by a fresh process, after running
+        `max_tasks` tasks or if its memory went over `max_rss_mb`. Long-lived browsers leak memory.
+        """
+        if self._max_tasks and self._tasks_processed >= self._max_tasks:
+            logger.info(
+                f"Recycling {self.get_worker_type()} {self._worker_id} after {self._tasks_processed} tasks"
+            )
+            return True
+
+        now = time.monotonic()
+        if self._max_rss_mb and now - self._rss_checked_at >= RSS_CHECK_INTERVAL:
+            self._rss_checked_at = now
+            rss = get_rss_mb(os.getpid())
+            if rss > self._max_rss_mb:
+                logger.info(
+                    f"Recycling {self.get_worker_type()} {self._worker_id}, using {rss:.0f} MB"
+                )
+                return True
+        return False
+
     def run_in_thread(self):
         """
         Starts the worker main loop in a child Thread
         """
-        self._process: Process = Process(target=self.run)
+        self._process: Process = get_context().Process(target=self.run)
+        self._stop_requested = False
         self._process.start()
 
-    def stop(self):
+    def request_stop(self):
+        """
+        Asks the worker to exit once it finishes the task it is processing, by sending it a stop message.
+        The input queue may be shared between workers, it's the first idle worker the one that stops.
+        """
+        if self._process and not self._stop_requested:
+            self._input_queue.put((STOP_MESSAGE, None, None))
+            self._stop_requested = True
+
+    def is_alive(self) -> bool:
+        """Returns True if the worker child process is running"""
+        return self._process is not None and self._process.is_alive()
+
+    def stop(self, timeout: float = LINKEDIN_SCRAPER_WORKER_STOP_TIMEOUT):
         """
-        Gracefully stops the worker child process
+        Gracefully stops the worker child process, waiting up to `timeout` seconds for it to finish
+        its in-flight task before terminating it.
+        When stopping many workers that share a queue, call `request_stop` on all of them first.
         :return:
         """
         logger.debug(f"closing worker {self._worker_id}")
+        if self._process:
+            self.request_stop()
+            self._process.join(timeout)
+            if self._process.is_alive():
+                logger.warning(
+                    f"{self.get_worker_type()} {self._worker_id} did not stop in time, terminating it."
+                )
+                self._process.terminate()
+                self._process.join(timeout)
+                if self._process.is_alive():
+                    self._process.kill()
+                    self._process.join()
+            self._process = None
+
+    def terminate(self, timeout: float = LINKEDIN_SCRAPER_WORKER_STOP_TIMEOUT):
+        """
+        Stops the worker child process right away, without waiting for its in-flight tasks.
+        On reliable queues, the unacknowledged tasks are delivered to another worker later.
+        :param timeout: Seconds to wait for the worker to exit (and run `teardown`) before killing it.
+        """
         if self._process:
             self._process.terminate()
+            self._process.join(timeout)
+            if self._process.is_alive():
+                self._process.kill()
+                self._process.join()
             self._process = None
 
+    def setup(self):
+        """
+        Hook executed once in the child process, before the worker starts listening for tasks.
+        To be optionally implemented by the implementor class, to allocate long-lived resources.
+        """
+        pass
+
+    def teardown(self):
+        """
+        Hook executed once in the child process, when the worker main loop exits.
+        To be optionally implemented by the implementor class, to release the resources
+        allocated in `setup`.
+        """
+        pass
+
     def submit_task_result(self, task_id: str, data: tuple, status: str = "success"):
-        self._results_queue.put((self.get_worker_type(), task_id, data, status))
+        """
+        Sends a task result to the controller. With a `result_batch_size` greater than 1, results
+        are buffered and sent in batches, see `flush_task_results`.
+        """
+        if self._result_batch_size <= 1:
+            self._results_queue.put((self.get_worker_type(), task_id, data, status))
+            self._release_tasks([task_id])
+            return
+
+        if not self._results_buffer:
+            self._results_buffer_deadline = time.monotonic() + self._result_flush_interval
+        self._results_buffer.append((task_id, data, status))
+
+        if (
+            len(self._results_buffer) >= self._result_batch_size
+            or time.monotonic() >= self._results_buffer_deadline
+        ):
+            self.flush_task_results()
+
+    def flush_task_results(self):
+        """
+        Sends the buffered task results to the controller, in a single message.
+        """
+        if self._results_buffer:
+            self._results_queue.put(
+                (self.get_worker_type(), None, self._results_buffer, RESULTS_BATCH_STATUS)
+            )
+            self._release_tasks([task_id for task_id, data, status in self._results_buffer])
+            self._results_buffer = []
+
+        for message in self._pending_acks:
+            self._input_queue.ack(message)
+        self._pending_acks = []
+
+    def acknowledge_message(self, message: tuple):
+        """
+        Acknowledges a processed input message, once the results of its tasks were sent.
+        Until then, a crash of the worker makes reliable queues deliver the message again.
+        """
+        if self._results_buffer:
+            self._pending_acks.append(message)
+        else:
+            self._input_queue.ack(message)
 
     def run(self):
         """
         Start the worker main loop, which handles task data input, processing, and results return.
         """
         logger.debug(f"started {self.get_worker_type()} worker {self._worker_id}")
+        # `Process.terminate()` sends SIGTERM, turn it into a regular exit so `teardown` still runs.
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        self.setup()
+        try:
+            self._main_loop()
+        finally:
+            self.flush_task_results()
+            self.teardown()
+
+    def _get_next_message(self, flush_results: bool = True, timeout: float = None) -> Optional[tuple]:
+        """
+        Blocks until there is a new input queue message, or until the pool asks the worker to
+        stop (see `stop_requests`) or the input queue is shut down.
+        :param flush_results: Flush the buffered task results when their flush interval expires
+            while waiting.
+        :param timeout: Maximum seconds to wait, by default it waits forever.
+        :return: The message, or None if the worker must stop.
+        :raises queue.Empty: If there was no message within `timeout`.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
         while True:
+            if self._consume_stop_request():
+                return None
+
+            wait = None
+            if flush_results and self._results_buffer:
+                wait = max(0.0, self._results_buffer_deadline - time.monotonic())
+            if self._stop_requests is not None:
+                wait = STOP_CHECK_INTERVAL if wait is None else min(wait, STOP_CHECK_INTERVAL)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise Empty
+                wait = remaining if wait is None else min(wait, remaining)
             try:
-                message, task_id, input_data = self._input_queue.get(
-                    block=True, timeout=0.2
-                )
+                return self._input_queue.get(timeout=wait)
+            except QueueShutDown:
+                logger.debug(f"{self.get_worker_type()} {self._worker_id} input queue shut down")
+                return None
             except Empty:
-                continue
+                if (
+                    flush_results
+                    and self._results_buffer
+                    and time.monotonic() >= self._results_buffer_deadline
+                ):
+                    self.flush_task_results()
+
+    def _main_loop(self):
+        """
+        Listen for input tasks and process them, until a stop message is received.
+        """
+        while True:
+            # Block until there is a new task or a stop message
+            queue_message = self._get_next_message()
+            if queue_message is None or queue_message[0] == STOP_MESSAGE:
+                logger.debug(f"stopping {self.get_worker_type()} worker {self._worker_id}")
+                self._stopped.value = 1
+                if queue_message is not None:
+                    self._input_queue.ack(queue_message)
+                break
+
+            message, task_id, input_data = queue_message
 
             logger.debug(f"Got new task: {message}, {input_data}")
-            if message == "scrape_task":
-                try:
-                    data = self.run_task(input_data)
-                    self.submit_task_result(
-                        task_id=task_id, data=(input_data, data), status="success"
-                    )
-                except Exception as e:
-                    self.submit_task_result(
-                        task_id=task_id,
-                        data=(input_data, f"scrape_error: {str(e)}"),
-                        status="failed",
-                    )
+            if message == SCRAPE_TASK_MESSAGE:
+                self._hold_tasks([task_id])
+                self._process_task(task_id, input_data)
+            elif message == SCRAPE_BATCH_MESSAGE:
+                self._hold_tasks([task_id for task_id, task_input_data in input_data])
+                for i, (task_id, task_input_data) in enumerate(input_data):
+                    if i:
+                        # Each task has the whole visibility timeout of reliable queues
+                        self._input_queue.extend_lease(queue_message)
+                    self._process_task(task_id, task_input_data)
+            self.acknowledge_message(queue_message)
+
+            if self.should_recycle():
+                break
+
+    def _process_task(self, task_id: str, input_data):
+        """
+        Runs a single task and submits its result.
+        """
+        start = time.perf_counter()
+        self._set_running_task(task_id)
+        try:
+            data = self.run_task(input_data)
+            status = "success"
+        except Exception as e:
+            data = f"scrape_error: {str(e)}"
+            status = "failed"
+        finally:
+            self._set_running_task(None)
+            self._tasks_processed += 1
+
+        self.record_service_time(time.perf_counter() - start)
+        self.submit_task_result(task_id=task_id, data=(input_data, data), status=status)
+
+    def record_service_time(self, seconds: float):
+        """Records the duration of a task, if the worker has a service time histogram"""
+        if self._service_time_histogram is not None:
+            self._service_time_histogram.observe(seconds)
 
     def run_task(self, input_data):
         """To be implemented by the implementor class"""
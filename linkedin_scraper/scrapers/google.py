@@ -1,14 +1,35 @@
-import yagooglesearch
-
+import time
+import logging
 
 from linkedin_scraper.scrapers.base import BaseScraperWorker
-from linkedin_scraper.config import LINKEDIN_SCRAPER_PROXY
+from linkedin_scraper.scrapers.slug_resolver import SlugResolver
+from linkedin_scraper.config import (
+    LINKEDIN_SCRAPER_GOOGLE_BASE_URL,
+    LINKEDIN_SCRAPER_LINKEDIN_BASE_URL,
+    LINKEDIN_SCRAPER_PROXY,
+    LOGGER_NAME,
+)
 from linkedin_scraper.exceptions import ScrapingError
+from linkedin_scraper.proxies import ProxyPool
+from linkedin_scraper.ratelimit import AdaptiveRateLimiter
+
+logger = logging.getLogger(LOGGER_NAME)
+
+# Google search URL prefix used by yagooglesearch, for the default "com" tld
+YAGOOGLESEARCH_BASE_URL = "https://www.google.com"
+
 
+def run_google_query(company_name, proxy: str = LINKEDIN_SCRAPER_PROXY):
+    """
+    This method performs the actual google query
+    :param proxy: Proxy url the query goes through, if any.
+    :raises ScrapingError: If Google answered without a result, or throttled the query. Transport
+        errors (proxy, timeout, DNS...) are raised as is.
+    """
+    # Imported on first use, only the Google workers need it
+    import yagooglesearch
 
-def run_google_query(company_name):
-    """This method performs the actual google query"""
-    query = f"{company_name} site:https://www.linkedin.com/company/"
+    query = f"{company_name} site:{LINKEDIN_SCRAPER_LINKEDIN_BASE_URL}/company/"
     client = yagooglesearch.SearchClient(
         query,
         tbs="li:1",
@@ -16,30 +37,83 @@ def run_google_query(company_name):
         yagooglesearch_manages_http_429s=False,
         verbosity=0,
         verbose_output=False,
-        proxy=LINKEDIN_SCRAPER_PROXY,
+        proxy=proxy,
     )
     client.assign_random_user_agent()
+    if LINKEDIN_SCRAPER_GOOGLE_BASE_URL != YAGOOGLESEARCH_BASE_URL:
+        # yagooglesearch has no base url setting, point its first page urls to the configured one
+        for attribute in ("url_home", "url_search", "url_search_num"):
+            url = getattr(client, attribute)
+            setattr(
+                client,
+                attribute,
+                url.replace(YAGOOGLESEARCH_BASE_URL, LINKEDIN_SCRAPER_GOOGLE_BASE_URL, 1),
+            )
 
     urls = client.search()
     if not len(urls):
-        raise Exception("Page not found")
+        raise ScrapingError("Page not found")
     else:
         data = urls[0]
         # Validate this is an actual linkedin url
         # @TODO
         if data == "HTTP_429_DETECTED":
-            raise Exception("HTTP_429_DETECTED")
+            raise ScrapingError("HTTP_429_DETECTED")
         else:
             return data
 
 
 class GoogleScrapeWorker(BaseScraperWorker):
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self,
+        *args,
+        rate_limiter: AdaptiveRateLimiter = None,
+        proxy_pool: ProxyPool = None,
+        proxy_rate_limiters: dict = None,
+        slug_resolver: SlugResolver = None,
+        **kwargs,
+    ):
+        """
+        :param rate_limiter: Optional rate limiter, shared by all the Google workers.
+        :param proxy_pool: Optional proxy pool, each query goes through the best scored proxy.
+        :param proxy_rate_limiters: Optional rate limiters by proxy url, used instead of
+            `rate_limiter` for the queries through those proxies, since Google throttles each
+            proxy address on its own.
+        :param slug_resolver: Optional resolver, shared by all the Google workers, that tries to
+            guess the company page url before searching it in Google.
+        """
         super().__init__(*args, **kwargs)
+        self._rate_limiter = rate_limiter
+        self._proxy_pool = proxy_pool
+        self._proxy_rate_limiters = proxy_rate_limiters or {}
+        self._slug_resolver = slug_resolver
+
+    def teardown(self):
+        if self._slug_resolver:
+            self._slug_resolver.close()
+
+    def _run_slug_resolver(self, company_name: str):
+        """
+        Guesses the company page url, with the requests going through the next proxy of the pool.
+        :return: The LinkedIn company page, or None if it must be searched in Google.
+        """
+        proxy = self._proxy_pool.acquire() if self._proxy_pool else LINKEDIN_SCRAPER_PROXY
+        start = time.perf_counter()
+        linkedin_url = None
+        error = None
+        try:
+            linkedin_url = self._slug_resolver.resolve(company_name, proxy=proxy)
+        except Exception as e:
+            error = str(e)
+            logger.debug(f"Slug resolver failed for {company_name}: {e}")
+
+        if self._proxy_pool:
+            self._proxy_pool.release(proxy, time.perf_counter() - start, error=error)
+        return linkedin_url
 
     def validate_linkedin_url_or_raise(self, input: str):
         """This methods validates that the google extracted data is an actual linkedin company page"""
-        if not input.startswith("https://www.linkedin.com/company/"):
+        if not input.startswith(f"{LINKEDIN_SCRAPER_LINKEDIN_BASE_URL}/company/"):
             raise ScrapingError(f"Invalid extracted linkeding page: {input}")
 
     def run_task(self, company_name: str):
@@ -48,8 +122,39 @@ class GoogleScrapeWorker(BaseScraperWorker):
         :param company_name: A company name
         :return: a valid LinkedIn company page
         """
-        # First run the google search query
-        result = run_google_query(company_name)
+        if self._slug_resolver:
+            linkedin_url = self._run_slug_resolver(company_name)
+            if linkedin_url is not None:
+                return linkedin_url
+
+        proxy = LINKEDIN_SCRAPER_PROXY
+        if self._proxy_pool:
+            proxy = self._proxy_pool.acquire()
+        rate_limiter = self._proxy_rate_limiters.get(proxy, self._rate_limiter)
+
+        # First run the google search query, respecting the shared rate limit
+        if rate_limiter:
+            rate_limiter.acquire()
+
+        start = time.perf_counter()
+        try:
+            result = run_google_query(company_name, proxy=proxy)
+        except Exception as e:
+            if self._proxy_pool:
+                self._proxy_pool.release(proxy, time.perf_counter() - start, error=str(e))
+            if rate_limiter:
+                if str(e) == "HTTP_429_DETECTED":
+                    rate_limiter.on_throttle()
+                elif isinstance(e, ScrapingError):
+                    # Google answered (i.e. "Page not found"), the rate is fine. Transport
+                    # errors say nothing about the rate.
+                    rate_limiter.on_success()
+            raise
+
+        if self._proxy_pool:
+            self._proxy_pool.release(proxy, time.perf_counter() - start)
+        if rate_limiter:
+            rate_limiter.on_success()
 
         # make sure is an actual linkedin page
         self.validate_linkedin_url_or_raise(input=result)
@@ -1,14 +1,62 @@
 import re
+import time
+import logging
+from urllib.parse import urlsplit
 
 from linkedin_scraper.scrapers.base import BaseScraperWorker
+from linkedin_scraper.scrapers.linkedin_http import HttpTopCardFetcher
+from linkedin_scraper.scrapers.page_policy import TOP_CARD_SELECTOR, PageLoadPolicy
+from linkedin_scraper.exceptions import TopCardNotFoundError
+from linkedin_scraper.proxies import ProxyPool, to_playwright_proxy
+from linkedin_scraper.config import LINKEDIN_SCRAPER_HTTP_FAST_PATH, LOGGER_NAME
 
-from playwright.sync_api import sync_playwright
-from playwright_stealth import stealth_sync
+logger = logging.getLogger(LOGGER_NAME)
+
+
+# playwright and playwright_stealth are imported on first use, only the LinkedIn workers need them.
+def sync_playwright():
+    from playwright.sync_api import sync_playwright
+
+    return sync_playwright()
+
+
+def stealth_sync(page):
+    from playwright_stealth import stealth_sync
+
+    stealth_sync(page)
 
 
 class LinkedinScrapeWorker(BaseScraperWorker):
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self,
+        *args,
+        http_fast_path: bool = LINKEDIN_SCRAPER_HTTP_FAST_PATH,
+        page_policy: PageLoadPolicy = None,
+        proxy_pool: ProxyPool = None,
+        **kwargs,
+    ):
+        """
+        :param http_fast_path: If enabled, try a plain HTTP request before using the browser.
+        :param page_policy: Requests blocking and waiting policy of the browser page loads,
+            by default it is configured from the environment (see `PageLoadPolicy`).
+        :param proxy_pool: Optional proxy pool, each page request goes through the best scored proxy.
+        """
         super().__init__(*args, **kwargs)
+        # Playwright driver and browser are owned by the worker child process, they are
+        # started lazily on the first task and kept alive for the worker lifetime.
+        self._playwright = None
+        self._browser = None
+        self._http_fast_path = http_fast_path
+        self._http_fetcher = None
+        # Extraction attempts, hits and total seconds, per extraction path
+        self._path_stats = {
+            "http": {"attempts": 0, "hits": 0, "seconds": 0.0},
+            "browser": {"attempts": 0, "hits": 0, "seconds": 0.0},
+        }
+        self._page_policy = page_policy if page_policy is not None else PageLoadPolicy()
+        # Responses, aborted requests and downloaded bytes of all the browser page loads
+        self._page_stats = {"responses": 0, "blocked_requests": 0, "bytes": 0}
+        self._proxy_pool = proxy_pool
 
     @staticmethod
     def get_employee_count_regex(text):
@@ -24,28 +72,242 @@ class LinkedinScrapeWorker(BaseScraperWorker):
         if match:
             return int(match.group(3).replace(",", ""))
 
+    def teardown(self):
+        """
+        Closes the browser and the playwright driver, if they were started.
+        """
+        self._close_browser()
+        if self._http_fetcher is not None:
+            self._http_fetcher.close()
+        self.log_path_stats()
+
+    def get_path_stats(self) -> dict:
+        """Returns the extraction attempts, hits and total seconds of each extraction path"""
+        return self._path_stats
+
+    def get_page_stats(self) -> dict:
+        """
+        Returns the responses, aborted requests and downloaded bytes (as declared by the
+        Content-Length headers) of all the browser page loads.
+        """
+        return self._page_stats
+
+    def log_path_stats(self):
+        """Logs the hit rate and average latency of each extraction path, and the page loads cost"""
+        for path, stats in self._path_stats.items():
+            if stats["attempts"]:
+                logger.info(
+                    f"{self.get_worker_type()} {self._worker_id} {path} path: "
+                    f"{stats['hits']}/{stats['attempts']} hits, "
+                    f"{stats['seconds'] / stats['attempts'] * 1000:.0f} ms average"
+                )
+
+        pages = self._path_stats["browser"]["attempts"]
+        if pages:
+            logger.info(
+                f"{self.get_worker_type()} {self._worker_id} browser pages: "
+                f"{self._page_stats['responses'] / pages:.1f} responses, "
+                f"{self._page_stats['blocked_requests'] / pages:.1f} blocked requests, "
+                f"{self._page_stats['bytes'] / pages / 1024:.0f} KB per page"
+            )
+
+    def _should_block_request(self, request, page_host: str) -> bool:
+        """Applies the page policy to a browser request, counting the aborted ones"""
+        blocked = self._page_policy.should_block(request.resource_type, request.url, page_host)
+        if blocked:
+            self._page_stats["blocked_requests"] += 1
+        return blocked
+
+    def _record_response(self, response):
+        """Browser page "response" event listener, counts the downloaded bytes"""
+        self._page_stats["responses"] += 1
+        try:
+            self._page_stats["bytes"] += int(response.headers.get("content-length", 0))
+        except ValueError:
+            pass
+
+    def _record_path_attempt(self, path: str, seconds: float, hit: bool):
+        stats = self._path_stats[path]
+        stats["attempts"] += 1
+        stats["hits"] += int(hit)
+        stats["seconds"] += seconds
+
+    def _acquire_proxy(self):
+        """Returns the proxy for the next page request, or None without proxy pool"""
+        if self._proxy_pool is None:
+            return None
+        return self._proxy_pool.acquire()
+
+    def _release_proxy(self, proxy, start: float, error: Exception = None):
+        """Reports the outcome of a page request to the proxy pool, if it went through a proxy"""
+        if proxy is not None:
+            self._proxy_pool.release(
+                proxy, time.perf_counter() - start, error=None if error is None else str(error)
+            )
+
+    def _get_launch_options(self) -> dict:
+        """Keyword arguments of the browser launch"""
+        if self._proxy_pool is None:
+            return {}
+        # Chromium needs a global proxy setting to allow a different proxy per context
+        return {"proxy": {"server": "per-context"}}
+
+    @staticmethod
+    def _get_context_options(proxy) -> dict:
+        """Keyword arguments of the browser context of a page request"""
+        if proxy is None:
+            return {}
+        return {"proxy": to_playwright_proxy(proxy)}
+
+    def _run_http_fast_path(self, page_url: str):
+        """
+        Extracts the employee count from the server rendered page, without a browser.
+        :param page_url: Linkedin company page
+        :return: Employee count, or None if the fast path failed and the browser is needed.
+        """
+        if self._http_fetcher is None:
+            self._http_fetcher = HttpTopCardFetcher()
+
+        employee_count, seconds = self._fetch_http_fast_path(page_url)
+        self._record_path_attempt("http", seconds, hit=employee_count is not None)
+        return employee_count
+
+    def _fetch_http_fast_path(self, page_url: str) -> tuple:
+        """
+        Fetches the employee count of the HTTP fast path with the worker `HttpTopCardFetcher`,
+        without recording the path stats, so it can run in other threads.
+        :param page_url: Linkedin company page
+        :return: (Employee count or None, seconds the request took)
+        """
+        proxy = self._acquire_proxy()
+        start = time.perf_counter()
+        employee_count = None
+        error = None
+        try:
+            employee_count = self.get_employee_count_regex(
+                self._http_fetcher.fetch_top_card_text(page_url, proxy=proxy)
+            )
+        except TopCardNotFoundError as e:
+            # The page was served, the proxy worked
+            logger.debug(f"HTTP fast path failed for {page_url}: {e}")
+        except Exception as e:
+            error = e
+            logger.debug(f"HTTP fast path failed for {page_url}: {e}")
+
+        self._release_proxy(proxy, start, error)
+        return employee_count, time.perf_counter() - start
+
+    def _get_browser(self):
+        """
+        Returns the worker Chromium instance, launching it if it was never started or if it crashed.
+        :return: playwright Browser
+        """
+        if self._browser is not None and self._browser.is_connected():
+            return self._browser
+
+        if self._browser is not None:
+            logger.warning(
+                f"{self.get_worker_type()} {self._worker_id}: browser disconnected, relaunching."
+            )
+            self._close_browser()
+
+        self._playwright = sync_playwright().start()
+        self._browser = self._playwright.chromium.launch(**self._get_launch_options())
+        return self._browser
+
+    def _close_browser(self):
+        """
+        Releases the browser and playwright driver, ignoring errors from an already dead browser.
+        """
+        if self._browser is not None:
+            try:
+                self._browser.close()
+            except Exception as e:
+                logger.debug(f"Error closing browser: {e}")
+            self._browser = None
+
+        if self._playwright is not None:
+            try:
+                self._playwright.stop()
+            except Exception as e:
+                logger.debug(f"Error stopping playwright: {e}")
+            self._playwright = None
+
     def run_task(self, page_url: str) -> int:
         """
         This task will extract the Employee count from the Company linkedin page.
         The value can be extracted from the `.top-card-layout__card` html field, without authentication.
+        The HTTP fast path is tried first (if enabled), the browser is only used when it fails.
         :param page_url: Linkedin company page
         :return: Employee count
         """
-        with sync_playwright() as p:
-            browser = p.chromium.launch()
+        if self._http_fast_path:
+            employee_count = self._run_http_fast_path(page_url)
+            if employee_count is not None:
+                return employee_count
 
-            page = browser.new_page()
-            stealth_sync(page)
+        start = time.perf_counter()
+        employee_count = None
+        try:
+            employee_count = self._run_browser_task(page_url)
+            return employee_count
+        finally:
+            self._record_path_attempt(
+                "browser", time.perf_counter() - start, hit=employee_count is not None
+            )
 
-            page.goto(page_url)
+    def _run_browser_task(self, page_url: str) -> int:
+        """
+        Extracts the Employee count loading the page in the browser, through the next proxy of the pool.
+        :param page_url: Linkedin company page
+        :return: Employee count
+        """
+        proxy = self._acquire_proxy()
+        start = time.perf_counter()
+        try:
+            employee_count = self._load_page_employee_count(page_url, proxy)
+        except Exception as e:
+            self._release_proxy(proxy, start, e)
+            raise
 
-            top_card_element = page.locator(".top-card-layout__card").first
+        self._release_proxy(proxy, start)
+        return employee_count
 
-            employee_count = self.get_employee_count_regex(
-                top_card_element.inner_text()
-            )
+    def _load_page_employee_count(self, page_url: str, proxy: str = None) -> int:
+        """
+        Extracts the Employee count loading the page in the browser.
+        The browser is shared between tasks, each task gets its own isolated context.
+        :param page_url: Linkedin company page
+        :param proxy: Proxy url of the page browser context, if any.
+        :return: Employee count
+        """
+        browser = self._get_browser()
+
+        context = browser.new_context(**self._get_context_options(proxy))
+        try:
+            if self._page_policy.blocks_requests():
+                page_host = urlsplit(page_url).hostname
+                context.route("**/*", lambda route: self._handle_route(route, page_host))
+            page = context.new_page()
+            page.on("response", self._record_response)
+            stealth_sync(page)
 
-            page.close()
-            browser.close()
+            page.goto(page_url, wait_until=self._page_policy.get_goto_wait_until())
 
+            top_card_element = page.locator(TOP_CARD_SELECTOR).first
+            top_card_element.wait_for(state="attached")
+            employee_count = self.get_employee_count_regex(top_card_element.inner_text())
+            if employee_count is None and self._page_policy.waits_for_top_card():
+                # The card can be attached before all its content is parsed
+                page.wait_for_load_state("domcontentloaded")
+                employee_count = self.get_employee_count_regex(top_card_element.inner_text())
             return employee_count
+        finally:
+            context.close()
+
+    def _handle_route(self, route, page_host: str):
+        """Route handler of the browser contexts, aborts the requests blocked by the page policy"""
+        if self._should_block_request(route.request, page_host):
+            route.abort()
+        else:
+            route.continue_()
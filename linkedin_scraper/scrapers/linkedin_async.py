@@ -0,0 +1,327 @@
+import time
+import signal
+import asyncio
+import functools
+import logging
+from queue import Empty
+from typing import Optional
+from urllib.parse import urlsplit
+
+from linkedin_scraper.scrapers.base import (
+    SCRAPE_BATCH_MESSAGE,
+    SCRAPE_TASK_MESSAGE,
+    STOP_CHECK_INTERVAL,
+    STOP_MESSAGE,
+)
+from linkedin_scraper.exceptions import ScrapingError
+from linkedin_scraper.scrapers.linkedin import LinkedinScrapeWorker
+from linkedin_scraper.scrapers.linkedin_http import HttpTopCardFetcher
+from linkedin_scraper.scrapers.page_policy import TOP_CARD_SELECTOR
+from linkedin_scraper.config import (
+    LINKEDIN_SCRAPER_ASYNC_MAX_PAGES,
+    LINKEDIN_SCRAPER_LINKEDIN_TASK_TIMEOUT,
+    LOGGER_NAME,
+)
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+# playwright and playwright_stealth are imported on first use, only the LinkedIn workers need them.
+def async_playwright():
+    from playwright.async_api import async_playwright
+
+    return async_playwright()
+
+
+async def stealth_async(page):
+    from playwright_stealth import stealth_async
+
+    await stealth_async(page)
+
+
+class AsyncLinkedinScrapeWorker(LinkedinScrapeWorker):
+    """
+    LinkedIn scraper worker built on the playwright asyncio API.
+    A single worker process drives one browser, with up to `max_pages` pages loading concurrently.
+    It uses the same `input_queue`/`results_queue` contract as the rest of the workers.
+
+    Its tasks run concurrently, so the controller can't tell which one a stuck worker is running:
+    each task has its own deadline instead, and fails with a timeout when it expires.
+    """
+
+    def __init__(
+        self,
+        *args,
+        max_pages: int = LINKEDIN_SCRAPER_ASYNC_MAX_PAGES,
+        task_timeout: float = LINKEDIN_SCRAPER_LINKEDIN_TASK_TIMEOUT,
+        **kwargs,
+    ):
+        """
+        :param max_pages: Maximum number of pages (browser contexts) open at the same time.
+        :param task_timeout: Maximum seconds a task can run, 0 for no limit.
+        """
+        super().__init__(*args, **kwargs)
+        self._max_pages = max_pages
+        self._task_timeout = task_timeout
+        self._browser_lock = None
+
+    def run(self):
+        """
+        Start the worker asyncio event loop, which handles task data input, processing, and results return.
+        """
+        logger.debug(f"started {self.get_worker_type()} worker {self._worker_id}")
+        try:
+            asyncio.run(self._async_run())
+        except asyncio.CancelledError:
+            # Terminated, see `_async_run`
+            pass
+
+    async def _async_run(self):
+        # `Process.terminate()` sends SIGTERM, cancel the main task so the cleanup below still runs
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGTERM, asyncio.current_task().cancel
+        )
+        if self._http_fast_path:
+            # Created before the tasks start, their fast path requests share it from many threads
+            self._http_fetcher = HttpTopCardFetcher()
+        flusher = asyncio.create_task(self._flush_task_results_periodically())
+        try:
+            await self._async_main_loop()
+        finally:
+            flusher.cancel()
+            self.flush_task_results()
+            await self._close_browser_async()
+            if self._http_fetcher is not None:
+                self._http_fetcher.close()
+            self.log_path_stats()
+
+    async def _async_main_loop(self):
+        """
+        Listen for input tasks and schedule them, never running more than `max_pages` at the same time.
+        When a stop message is received, the in-flight tasks are completed before returning.
+        """
+        semaphore = asyncio.Semaphore(self._max_pages)
+        running_tasks = set()
+
+        while not self.should_recycle():
+            # Only pull a new task from the queue once there is room for it, so the rest of
+            # the tasks stay available in the queue for the other workers.
+            await semaphore.acquire()
+
+            queue_message = await self._get_next_message_async()
+            if queue_message is None or queue_message[0] == STOP_MESSAGE:
+                logger.debug(f"stopping {self.get_worker_type()} worker {self._worker_id}")
+                self._stopped.value = 1
+                if queue_message is not None:
+                    self._input_queue.ack(queue_message)
+                break
+
+            message, task_id, input_data = queue_message
+
+            logger.debug(f"Got new task: {message}, {input_data}")
+            if message == SCRAPE_TASK_MESSAGE:
+                tasks = [(task_id, input_data)]
+            elif message == SCRAPE_BATCH_MESSAGE:
+                tasks = input_data
+            else:
+                semaphore.release()
+                self.acknowledge_message(queue_message)
+                continue
+
+            self._hold_tasks([task_id for task_id, task_input_data in tasks])
+            message_tasks = []
+            for i, (task_id, task_input_data) in enumerate(tasks):
+                if i:
+                    # The first task of the message already holds a slot
+                    await semaphore.acquire()
+                    # Each task has the whole visibility timeout of reliable queues
+                    self._input_queue.extend_lease(queue_message)
+                task = asyncio.create_task(
+                    self._process_task_async(task_id, task_input_data, semaphore)
+                )
+                message_tasks.append(task)
+
+            # The message is acknowledged once all its tasks are finished
+            task = asyncio.create_task(self._acknowledge_when_done(queue_message, message_tasks))
+            running_tasks.add(task)
+            task.add_done_callback(running_tasks.discard)
+
+        await asyncio.gather(*running_tasks)
+
+    async def _get_next_message_async(self) -> Optional[tuple]:
+        """
+        Waits for the next input queue message, see `_get_next_message`. The blocking reads run in a
+        thread, to keep the event loop free, and last STOP_CHECK_INTERVAL seconds at most, so a
+        cancelled worker doesn't wait for the next message to exit. The results are flushed by
+        the event loop, see `_flush_task_results_periodically`.
+        """
+        loop = asyncio.get_running_loop()
+        read = functools.partial(
+            self._get_next_message, flush_results=False, timeout=STOP_CHECK_INTERVAL
+        )
+        while True:
+            try:
+                return await loop.run_in_executor(None, read)
+            except Empty:
+                pass
+
+    async def _acknowledge_when_done(self, queue_message: tuple, tasks: list):
+        await asyncio.gather(*tasks)
+        self.acknowledge_message(queue_message)
+
+    async def _flush_task_results_periodically(self):
+        """
+        Sends the buffered task results every `result_flush_interval` seconds, even if their batch is not full.
+        """
+        while True:
+            await asyncio.sleep(self._result_flush_interval)
+            self.flush_task_results()
+
+    async def _process_task_async(self, task_id: str, input_data: str, semaphore: asyncio.Semaphore):
+        """
+        Runs a single task and submits its result, releasing its `semaphore` slot when finished.
+        """
+        start = time.perf_counter()
+        try:
+            if self._task_timeout:
+                try:
+                    data = await asyncio.wait_for(self.run_task_async(input_data), self._task_timeout)
+                except asyncio.TimeoutError:
+                    raise ScrapingError(f"Timeout: task exceeded {self._task_timeout:g}s")
+            else:
+                data = await self.run_task_async(input_data)
+            status = "success"
+        except Exception as e:
+            data = f"scrape_error: {str(e)}"
+            status = "failed"
+        finally:
+            semaphore.release()
+            self._tasks_processed += 1
+
+        self.record_service_time(time.perf_counter() - start)
+        self.submit_task_result(task_id=task_id, data=(input_data, data), status=status)
+
+    async def _get_browser_async(self):
+        """
+        Returns the worker Chromium instance, launching it if it was never started or if it crashed.
+        :return: playwright async Browser
+        """
+        if self._browser_lock is None:
+            self._browser_lock = asyncio.Lock()
+
+        async with self._browser_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._browser
+
+            if self._browser is not None:
+                logger.warning(
+                    f"{self.get_worker_type()} {self._worker_id}: browser disconnected, relaunching."
+                )
+                await self._close_browser_async()
+
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(**self._get_launch_options())
+            return self._browser
+
+    async def _close_browser_async(self):
+        """
+        Releases the browser and playwright driver, ignoring errors from an already dead browser.
+        """
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                logger.debug(f"Error closing browser: {e}")
+            self._browser = None
+
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception as e:
+                logger.debug(f"Error stopping playwright: {e}")
+            self._playwright = None
+
+    async def run_task_async(self, page_url: str) -> int:
+        """
+        This task will extract the Employee count from the Company linkedin page.
+        The HTTP fast path is tried first (if enabled), the browser is only used when it fails.
+        :param page_url: Linkedin company page
+        :return: Employee count
+        """
+        if self._http_fast_path:
+            # The request runs in a thread, the path stats are only updated by the event loop
+            employee_count, seconds = await asyncio.get_running_loop().run_in_executor(
+                None, self._fetch_http_fast_path, page_url
+            )
+            self._record_path_attempt("http", seconds, hit=employee_count is not None)
+            if employee_count is not None:
+                return employee_count
+
+        start = time.perf_counter()
+        employee_count = None
+        try:
+            employee_count = await self._run_browser_task_async(page_url)
+            return employee_count
+        finally:
+            self._record_path_attempt(
+                "browser", time.perf_counter() - start, hit=employee_count is not None
+            )
+
+    async def _run_browser_task_async(self, page_url: str) -> int:
+        """
+        Extracts the Employee count loading the page in its own browser context, through the
+        next proxy of the pool.
+        :param page_url: Linkedin company page
+        :return: Employee count
+        """
+        # Waiting for a proxy blocks, keep the event loop free
+        proxy = await asyncio.get_running_loop().run_in_executor(None, self._acquire_proxy)
+        start = time.perf_counter()
+        try:
+            employee_count = await self._load_page_employee_count_async(page_url, proxy)
+        except Exception as e:
+            self._release_proxy(proxy, start, e)
+            raise
+
+        self._release_proxy(proxy, start)
+        return employee_count
+
+    async def _load_page_employee_count_async(self, page_url: str, proxy: str = None) -> int:
+        """
+        Extracts the Employee count loading the page in its own browser context.
+        :param page_url: Linkedin company page
+        :param proxy: Proxy url of the page browser context, if any.
+        :return: Employee count
+        """
+        browser = await self._get_browser_async()
+
+        context = await browser.new_context(**self._get_context_options(proxy))
+        try:
+            if self._page_policy.blocks_requests():
+                page_host = urlsplit(page_url).hostname
+                await context.route(
+                    "**/*", lambda route: self._handle_route_async(route, page_host)
+                )
+            page = await context.new_page()
+            page.on("response", self._record_response)
+            await stealth_async(page)
+
+            await page.goto(page_url, wait_until=self._page_policy.get_goto_wait_until())
+
+            top_card_element = page.locator(TOP_CARD_SELECTOR).first
+            await top_card_element.wait_for(state="attached")
+            employee_count = self.get_employee_count_regex(await top_card_element.inner_text())
+            if employee_count is None and self._page_policy.waits_for_top_card():
+                # The card can be attached before all its content is parsed
+                await page.wait_for_load_state("domcontentloaded")
+                employee_count = self.get_employee_count_regex(await top_card_element.inner_text())
+            return employee_count
+        finally:
+            await context.close()
+
+    async def _handle_route_async(self, route, page_host: str):
+        """Route handler of the browser contexts, aborts the requests blocked by the page policy"""
+        if self._should_block_request(route.request, page_host):
+            await route.abort()
+        else:
+            await route.continue_()
@@ -0,0 +1,151 @@
+import re
+import html
+from html.parser import HTMLParser
+from typing import Optional
+
+from linkedin_scraper.config import (
+    LINKEDIN_SCRAPER_HTTP_POOL_SIZE,
+    LINKEDIN_SCRAPER_HTTP_TIMEOUT,
+)
+from linkedin_scraper.exceptions import ScrapingError, TopCardNotFoundError
+
+TOP_CARD_CLASS = "top-card-layout__card"
+
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+# Elements without a closing tag, they must not change the nesting depth
+VOID_ELEMENTS = {
+    "area",
+    "base",
+    "br",
+    "col",
+    "embed",
+    "hr",
+    "img",
+    "input",
+    "link",
+    "meta",
+    "source",
+    "track",
+    "wbr",
+}
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+class TopCardTextParser(HTMLParser):
+    """
+    Streaming HTML parser that collects the text of the first `.top-card-layout__card` element.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._depth = 0
+        self._done = False
+        self._text_parts = []
+
+    def handle_starttag(self, tag, attrs):
+        if self._done or tag in VOID_ELEMENTS:
+            return
+
+        if self._depth:
+            self._depth += 1
+        elif TOP_CARD_CLASS in (dict(attrs).get("class") or "").split():
+            self._depth = 1
+
+    def handle_endtag(self, tag):
+        if self._depth and tag not in VOID_ELEMENTS:
+            self._depth -= 1
+            if not self._depth:
+                self._done = True
+
+    def handle_data(self, data):
+        if self._depth:
+            data = " ".join(data.split())
+            if data:
+                self._text_parts.append(data)
+
+    def get_text(self) -> Optional[str]:
+        """
+        Returns the top card text, one line per text node, or None if the element was not found.
+        """
+        if not self._text_parts:
+            return None
+        return "\n".join(self._text_parts)
+
+
+def parse_top_card_text(html: str) -> Optional[str]:
+    """
+    Extracts the `.top-card-layout__card` text from a LinkedIn company page html.
+    :param html: Page html
+    :return: The top card text, or None if not present.
+    """
+    parser = TopCardTextParser()
+    parser.feed(html)
+    parser.close()
+    return parser.get_text()
+
+
+def parse_page_title(page_html: str) -> Optional[str]:
+    """
+    Extracts the `<title>` text from a page html, i.e. "Walmart | LinkedIn".
+    :return: The page title, or None if not present.
+    """
+    match = _TITLE_RE.search(page_html)
+    if match is None:
+        return None
+    return " ".join(html.unescape(match.group(1)).split())
+
+
+class HttpTopCardFetcher:
+    """
+    Fetches the server rendered LinkedIn company pages with a pooled HTTP client, without a browser.
+    """
+
+    def __init__(
+        self,
+        timeout: float = LINKEDIN_SCRAPER_HTTP_TIMEOUT,
+        pool_size: int = LINKEDIN_SCRAPER_HTTP_POOL_SIZE,
+    ):
+        """
+        :param timeout: Seconds to wait for the page.
+        :param pool_size: Maximum number of kept-alive connections per host.
+        """
+        # Imported on first use, only the LinkedIn workers need it
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self._timeout = timeout
+        self._session = requests.Session()
+        self._session.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def fetch_top_card_text(self, page_url: str, proxy: str = None) -> str:
+        """
+        :param page_url: Linkedin company page
+        :param proxy: Proxy url the request goes through, if any.
+        :return: The `.top-card-layout__card` text.
+        :raises ScrapingError: If the page could not be fetched.
+        :raises TopCardNotFoundError: If the page has no top card (e.g. an auth wall).
+        """
+        proxies = {"http": proxy, "https": proxy} if proxy else None
+        response = self._session.get(page_url, timeout=self._timeout, proxies=proxies)
+        if response.status_code != 200:
+            raise ScrapingError(f"HTTP {response.status_code} fetching {page_url}")
+
+        text = parse_top_card_text(response.text)
+        if text is None:
+            raise TopCardNotFoundError(f"No top card found in {page_url}")
+        return text
+
+    def close(self):
+        self._session.close()
@@ -0,0 +1,72 @@
+from typing import Optional
+from urllib.parse import urlsplit
+
+from linkedin_scraper.config import (
+    LINKEDIN_SCRAPER_ALLOWED_DOMAINS,
+    LINKEDIN_SCRAPER_BLOCK_RESOURCE_TYPES,
+    LINKEDIN_SCRAPER_BLOCK_THIRD_PARTY,
+    LINKEDIN_SCRAPER_WAIT_FOR_TOP_CARD,
+)
+
+TOP_CARD_SELECTOR = ".top-card-layout__card"
+
+
+def is_domain_allowed(host: str, domains: tuple) -> bool:
+    """Returns True if `host` is one of `domains`, or a subdomain of them"""
+    return any(host == domain or host.endswith(f".{domain}") for domain in domains)
+
+
+class PageLoadPolicy:
+    """
+    How the LinkedIn workers load company pages in the browser: the requests to abort (see
+    `should_block`, used from a `page.route` handler), and how long to wait before reading the
+    `.top-card-layout__card` text (see `get_goto_wait_until`).
+    """
+
+    def __init__(
+        self,
+        blocked_resource_types: tuple = LINKEDIN_SCRAPER_BLOCK_RESOURCE_TYPES,
+        block_third_party: bool = LINKEDIN_SCRAPER_BLOCK_THIRD_PARTY,
+        allowed_domains: tuple = LINKEDIN_SCRAPER_ALLOWED_DOMAINS,
+        wait_for_top_card: bool = LINKEDIN_SCRAPER_WAIT_FOR_TOP_CARD,
+    ):
+        """
+        :param blocked_resource_types: Playwright resource types to abort, e.g. "image", "font".
+        :param block_third_party: Abort the requests to domains other than the page and `allowed_domains` ones.
+        :param allowed_domains: Domains (and their subdomains) never considered third-party.
+        :param wait_for_top_card: Read the top card as soon as it is attached, instead of waiting
+            for the page load event.
+        """
+        self._blocked_resource_types = frozenset(blocked_resource_types)
+        self._block_third_party = block_third_party
+        self._allowed_domains = tuple(allowed_domains)
+        self._wait_for_top_card = wait_for_top_card
+
+    def blocks_requests(self) -> bool:
+        """Returns True if some requests may be aborted, so the pages need a route handler"""
+        return bool(self._blocked_resource_types) or self._block_third_party
+
+    def waits_for_top_card(self) -> bool:
+        return self._wait_for_top_card
+
+    def get_goto_wait_until(self) -> str:
+        """Returns the `page.goto` wait_until option"""
+        # The top card is waited for explicitly, the navigation only needs to be committed
+        return "commit" if self._wait_for_top_card else "load"
+
+    def should_block(self, resource_type: str, url: str, page_host: Optional[str]) -> bool:
+        """
+        Returns True if a request of the page loaded from `page_host` must be aborted.
+        :param resource_type: Playwright resource type of the request, e.g. "image".
+        :param url: Requested url.
+        :param page_host: Host of the loaded company page, its requests are never third-party.
+        """
+        if resource_type in self._blocked_resource_types:
+            return True
+
+        if self._block_third_party:
+            host = urlsplit(url).hostname
+            # Urls without host (data:, blob:) don't hit the network
+            if host and host != page_host and not is_domain_allowed(host, self._allowed_domains):
+                return True
+        return False
@@ -0,0 +1,210 @@
+import time
+import logging
+import unicodedata
+from typing import Optional
+from urllib.parse import urlsplit
+
+from linkedin_scraper.config import (
+    LINKEDIN_SCRAPER_HTTP_TIMEOUT,
+    LINKEDIN_SCRAPER_LINKEDIN_BASE_URL,
+    LINKEDIN_SCRAPER_SLUG_MAX_CANDIDATES,
+    LOGGER_NAME,
+)
+from linkedin_scraper.exceptions import ScrapingError
+from linkedin_scraper.processes import get_context
+from linkedin_scraper.scrapers.linkedin_http import (
+    DEFAULT_HEADERS,
+    parse_page_title,
+    parse_top_card_text,
+)
+from linkedin_scraper.utils import get_company_name_words, normalize_company_name
+
+logger = logging.getLogger(LOGGER_NAME)
+
+# Suffix of the LinkedIn company page titles, i.e. "Walmart | LinkedIn"
+LINKEDIN_TITLE_SUFFIX = "| LinkedIn"
+# Statuses of the pages that don't exist, no need to GET them
+MISSING_PAGE_STATUSES = (404, 410)
+
+# Shared stats, by position
+COMPANIES, HITS, REQUESTS, SECONDS = range(4)
+
+
+def _to_ascii(word: str) -> str:
+    """Removes the accents of a word, and any other non ascii character, as LinkedIn slugs do"""
+    return unicodedata.normalize("NFKD", word).encode("ascii", "ignore").decode("ascii")
+
+
+def get_slug_candidates(
+    company_name: str, max_candidates: int = LINKEDIN_SCRAPER_SLUG_MAX_CANDIDATES
+) -> list:
+    """
+    Returns the most likely LinkedIn company page slugs of a company, most likely first.
+    e.g. "Ford Motor Co." is ["ford-motor", "fordmotor", "ford-motor-co"].
+    """
+    words = [_to_ascii(word) for word in get_company_name_words(company_name)]
+    full_words = [
+        _to_ascii(word) for word in get_company_name_words(company_name, strip_legal_suffixes=False)
+    ]
+    candidates = []
+    for slug in ("-".join(filter(None, words)), "".join(words), "-".join(filter(None, full_words))):
+        if slug and slug not in candidates:
+            candidates.append(slug)
+    return candidates[:max_candidates]
+
+
+def page_matches_company(
+    company_name: str, title: Optional[str], top_card_text: Optional[str]
+) -> bool:
+    """
+    Checks that a LinkedIn page is the company one: the company name in its title, or in the first
+    line of its top card, must be equivalent to `company_name` (see `utils.normalize_company_name`).
+    """
+    page_names = []
+    if title:
+        page_names.append(title.rsplit(LINKEDIN_TITLE_SUFFIX, 1)[0])
+    if top_card_text:
+        page_names.append(top_card_text.split("\n", 1)[0])
+
+    company_key = normalize_company_name(company_name)
+    return any(normalize_company_name(page_name) == company_key for page_name in page_names)
+
+
+class SlugResolver:
+    """
+    Finds the LinkedIn company page of a company without searching it in Google, by guessing its
+    url from the company name (see `get_slug_candidates`). Each candidate url is checked with a
+    HEAD request, and only the existing ones are loaded, to compare the page title and top card
+    with the company name. Companies with no matching candidate are left to the Google search.
+
+    The hit rate stats live in shared memory, so a single instance created by the controller
+    counts the companies resolved by all the worker processes it is passed to.
+    """
+
+    def __init__(
+        self,
+        base_url: str = LINKEDIN_SCRAPER_LINKEDIN_BASE_URL,
+        max_candidates: int = LINKEDIN_SCRAPER_SLUG_MAX_CANDIDATES,
+        timeout: float = LINKEDIN_SCRAPER_HTTP_TIMEOUT,
+    ):
+        """
+        :param base_url: Base URL of the LinkedIn company pages.
+        :param max_candidates: Maximum number of urls checked per company.
+        :param timeout: Seconds to wait for each response.
+        """
+        self._base_url = base_url
+        self._max_candidates = max_candidates
+        self._timeout = timeout
+        # HTTP session of the worker process, created on first use
+        self._session = None
+
+        context = get_context()
+        self._lock = context.Lock()
+        self._stats = context.Array("d", 4, lock=False)
+
+    def __getstate__(self):
+        # Every worker process uses its own HTTP session
+        state = self.__dict__.copy()
+        state["_session"] = None
+        return state
+
+    def _get_session(self):
+        if self._session is None:
+            # Imported on first use, only the Google workers need it
+            import requests
+
+            self._session = requests.Session()
+            self._session.headers.update(DEFAULT_HEADERS)
+        return self._session
+
+    def resolve(self, company_name: str, proxy: str = None) -> Optional[str]:
+        """
+        :param company_name: A company name
+        :param proxy: Proxy url the requests go through, if any.
+        :return: The LinkedIn company page, or None if no candidate url matches the company.
+        :raises ScrapingError: If LinkedIn throttles the requests (HTTP 429).
+        """
+        start = time.perf_counter()
+        requests_count = 0
+        linkedin_url = None
+        try:
+            for slug in get_slug_candidates(company_name, self._max_candidates):
+                linkedin_url, candidate_requests = self._check_candidate(
+                    company_name, f"{self._base_url}/company/{slug}", proxy
+                )
+                requests_count += candidate_requests
+                if linkedin_url is not None:
+                    break
+        finally:
+            with self._lock:
+                self._stats[COMPANIES] += 1
+                self._stats[HITS] += linkedin_url is not None
+                self._stats[REQUESTS] += requests_count
+                self._stats[SECONDS] += time.perf_counter() - start
+
+        return linkedin_url
+
+    def _check_candidate(self, company_name: str, candidate_url: str, proxy: str = None) -> tuple:
+        """
+        Checks if a candidate url is the company page.
+        :return: (company page url or None, number of requests)
+        """
+        session = self._get_session()
+        proxies = {"http": proxy, "https": proxy} if proxy else None
+
+        response = session.head(
+            candidate_url, timeout=self._timeout, proxies=proxies, allow_redirects=True
+        )
+        self._raise_if_throttled(response, candidate_url)
+        if response.status_code in MISSING_PAGE_STATUSES:
+            return None, 1
+
+        response = session.get(candidate_url, timeout=self._timeout, proxies=proxies)
+        self._raise_if_throttled(response, candidate_url)
+        # Renamed companies redirect to their current page, anything else is not a company page
+        page_path = urlsplit(response.url).path.rstrip("/")
+        if response.status_code != 200 or not page_path.startswith("/company/"):
+            return None, 2
+
+        if not page_matches_company(
+            company_name, parse_page_title(response.text), parse_top_card_text(response.text)
+        ):
+            logger.debug(f"{candidate_url} is not the {company_name} company page")
+            return None, 2
+        return f"{self._base_url}{page_path}", 2
+
+    @staticmethod
+    def _raise_if_throttled(response, url: str):
+        if response.status_code == 429:
+            raise ScrapingError(f"HTTP 429 fetching {url}")
+
+    def stats(self) -> dict:
+        """
+        Returns the companies resolved, and the Google queries saved, since it was created.
+        """
+        with self._lock:
+            companies, hits, requests_count, seconds = self._stats
+        return {
+            "companies": int(companies),
+            "hits": int(hits),
+            "hit_rate": hits / companies if companies else 0.0,
+            "google_queries_saved": int(hits),
+            "requests": int(requests_count),
+            "seconds": seconds,
+        }
+
+    def log_stats(self):
+        """Logs the hit rate and cost of the resolver"""
+        stats = self.stats()
+        if stats["companies"]:
+            logger.info(
+                f"Slug resolver: {stats['hits']}/{stats['companies']} companies resolved "
+                f"({stats['hit_rate']:.0%}), {stats['google_queries_saved']} Google queries saved, "
+                f"{stats['requests'] / stats['companies']:.1f} requests and "
+                f"{stats['seconds'] / stats['companies'] * 1000:.0f} ms per company"
+            )
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
@@ -0,0 +1,242 @@
+import csv
+import json
+import time
+import sqlite3
+
+from linkedin_scraper.config import (
+    LINKEDIN_SCRAPER_OUTPUT_FLUSH_ROWS,
+    LINKEDIN_SCRAPER_OUTPUT_FLUSH_INTERVAL,
+    LINKEDIN_SCRAPER_PARQUET_ROW_GROUP_SIZE,
+)
+
+# Columns of the output rows, failed results have an empty employee count (and linkedin url,
+# if the company page was not found).
+OUTPUT_FIELDS = ("company_name", "status", "linkedin_url", "employee_count")
+
+
+class ResultsSink:
+    """
+    Output file of a scraping session, with a row per company result, successful or not.
+
+    Rows are buffered, and written in bulk every `flush_rows` rows or `flush_interval` seconds,
+    so results can be written as they arrive without slowing down the results loop.
+    Implementors write the buffered rows to their format in `_write_rows`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        flush_rows: int = LINKEDIN_SCRAPER_OUTPUT_FLUSH_ROWS,
+        flush_interval: float = LINKEDIN_SCRAPER_OUTPUT_FLUSH_INTERVAL,
+    ):
+        """
+        :param path: Path to the output file, it is overwritten if it exists.
+        :param flush_rows: Maximum number of rows buffered in memory.
+        :param flush_interval: Maximum seconds a row stays buffered in memory, None to only
+            flush full buffers.
+        """
+        self._path = path
+        self._flush_rows = flush_rows
+        self._flush_interval = flush_interval
+        self._rows = []
+        self._last_flush = time.monotonic()
+        self._closed = False
+        self._open()
+
+    def __enter__(self) -> "ResultsSink":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def get_path(self) -> str:
+        return self._path
+
+    def write(self, company_name: str, result: dict):
+        """
+        Adds a company result to the output.
+        :param company_name: Company name, as read from the input.
+        :param result: Result data, as returned by `ScraperController.get_results_data`.
+        """
+        self._rows.append(
+            (company_name, result["status"], result["linkedin_url"], result["employee_count"])
+        )
+        if len(self._rows) >= self._flush_rows or (
+            self._flush_interval is not None
+            and time.monotonic() - self._last_flush >= self._flush_interval
+        ):
+            self.flush()
+
+    def write_results(self, results: dict):
+        """
+        Adds the results of a dict of company name -> result data to the output.
+        """
+        for company_name, result in results.items():
+            self.write(company_name, result)
+
+    def flush(self):
+        """Writes the buffered rows to the output file."""
+        if self._rows:
+            self._write_rows(self._rows)
+            self._rows = []
+        self._last_flush = time.monotonic()
+
+    def close(self):
+        """Writes the buffered rows and closes the output file."""
+        if self._closed:
+            return
+        self.flush()
+        self._close()
+        self._closed = True
+
+    def _open(self):
+        raise NotImplementedError
+
+    def _write_rows(self, rows: list):
+        """
+        Writes rows to the output file.
+        :param rows: List of tuples, with the `OUTPUT_FIELDS` values.
+        """
+        raise NotImplementedError
+
+    def _close(self):
+        raise NotImplementedError
+
+
+class CsvSink(ResultsSink):
+    """
+    CSV output, with a header row. Values are quoted when needed, so company names with commas,
+    quotes or line breaks are read back unchanged.
+    """
+
+    def _open(self):
+        self._file = open(self._path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(OUTPUT_FIELDS)
+        self._file.flush()
+
+    def _write_rows(self, rows: list):
+        self._writer.writerows(rows)
+        self._file.flush()
+
+    def _close(self):
+        self._file.close()
+
+
+class JsonlSink(ResultsSink):
+    """
+    JSON lines output, one object per result, with `OUTPUT_FIELDS` as keys.
+    """
+
+    def _open(self):
+        self._file = open(self._path, "w", encoding="utf-8")
+        # json.dumps with any option builds a new encoder per call
+        self._encode = json.JSONEncoder(ensure_ascii=False).encode
+
+    def _write_rows(self, rows: list):
+        encode = self._encode
+        self._file.writelines(encode(dict(zip(OUTPUT_FIELDS, row))) + "\n" for row in rows)
+        self._file.flush()
+
+    def _close(self):
+        self._file.close()
+
+
+class ParquetSink(ResultsSink):
+    """
+    Parquet output, written in row groups of `row_group_size` rows. It needs pyarrow.
+
+    A Parquet file is only readable once closed (its metadata is written last). Rows are never
+    flushed on time, to avoid writing small row groups.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        row_group_size: int = LINKEDIN_SCRAPER_PARQUET_ROW_GROUP_SIZE,
+    ):
+        """
+        :param row_group_size: Number of rows of each row group.
+        """
+        super().__init__(path, flush_rows=row_group_size, flush_interval=None)
+
+    def _open(self):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("The parquet output format needs pyarrow, run: pip install pyarrow")
+
+        self._pyarrow = pyarrow
+        self._schema = pyarrow.schema(
+            [
+                ("company_name", pyarrow.string()),
+                ("status", pyarrow.string()),
+                ("linkedin_url", pyarrow.string()),
+                ("employee_count", pyarrow.int64()),
+            ]
+        )
+        self._writer = pyarrow.parquet.ParquetWriter(self._path, self._schema)
+
+    def _write_rows(self, rows: list):
+        arrays = [
+            self._pyarrow.array(column, type=field.type)
+            for column, field in zip(zip(*rows), self._schema)
+        ]
+        self._writer.write_table(self._pyarrow.Table.from_arrays(arrays, schema=self._schema))
+
+    def _close(self):
+        self._writer.close()
+
+
+class SqliteSink(ResultsSink):
+    """
+    SQLite database output, with the results in the `results` table, keyed by company name.
+    Each flush inserts the buffered rows in a single transaction.
+    """
+
+    TABLE_NAME = "results"
+
+    def _open(self):
+        self._connection = sqlite3.connect(self._path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.execute(f"DROP TABLE IF EXISTS {self.TABLE_NAME}")
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} ("
+                "company_name TEXT PRIMARY KEY, status TEXT, linkedin_url TEXT, "
+                "employee_count INTEGER)"
+            )
+
+    def _write_rows(self, rows: list):
+        with self._connection:
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO {self.TABLE_NAME} "
+                "(company_name, status, linkedin_url, employee_count) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+    def _close(self):
+        self._connection.close()
+
+
+# Output format name -> sink class
+SINK_CLASSES = {
+    "csv": CsvSink,
+    "jsonl": JsonlSink,
+    "parquet": ParquetSink,
+    "sqlite": SqliteSink,
+}
+OUTPUT_FORMATS = tuple(SINK_CLASSES)
+
+
+def open_sink(output_format: str, path: str) -> ResultsSink:
+    """
+    Opens the output file of a scraping session.
+    :param output_format: One of `OUTPUT_FORMATS`.
+    :param path: Path to the output file.
+    """
+    if output_format not in SINK_CLASSES:
+        raise ValueError(f"Unknown output format: {output_format}")
+    return SINK_CLASSES[output_format](path)
@@ -0,0 +1,134 @@
+import time
+import logging
+from typing import Callable
+
+from linkedin_scraper.metrics import ScraperMetrics
+from linkedin_scraper.config import (
+    LINKEDIN_SCRAPER_SUPERVISOR_INTERVAL,
+    LOGGER_NAME,
+)
+
+logger = logging.getLogger(LOGGER_NAME)
+
+# Reasons of the worker restarts
+TASK_TIMEOUT_RESTART = "task_timeout"
+RECYCLED_RESTART = "recycled"
+CRASHED_RESTART = "crashed"
+# Seconds a stuck worker has to exit once terminated, before it is killed. It is stuck, so there
+# is no point in waiting long, and the controller waits for it.
+STUCK_WORKER_EXIT_TIMEOUT = 5.0
+
+
+class WorkerSupervisor:
+    """
+    Keeps the worker pools of a scraping session at full strength:
+
+    - A worker running a task for longer than the task timeout of its stage is killed and replaced,
+      a hung search or page load would otherwise take its slot until the end of the session.
+    - Workers that exited on their own are replaced, either recycled (see
+      `BaseScraperWorker.should_recycle`) or crashed.
+
+    The tasks those workers held, the running one and the rest of their input message or buffered
+    results (see `BaseScraperWorker.get_held_tasks`), are handed to `on_task_lost`, so the
+    controller can fail (and retry) them, since no worker will send their result.
+    """
+
+    def __init__(
+        self,
+        pools: list,
+        task_timeouts: dict,
+        on_task_lost: Callable[[str, str, str], None],
+        metrics: ScraperMetrics = None,
+        interval: float = LINKEDIN_SCRAPER_SUPERVISOR_INTERVAL,
+    ):
+        """
+        :param pools: List of `WorkerPool`, one per stage.
+        :param task_timeouts: Dict of stage -> maximum seconds a task can run, 0 or missing for no limit.
+        :param on_task_lost: Callable receiving the (stage, task id, error message) of every task
+            whose worker was killed, or exited, before sending its result.
+        :param metrics: Optional session metrics, where the worker restarts are recorded.
+        :param interval: Seconds between checks of the workers.
+        """
+        self._pools = pools
+        self._task_timeouts = task_timeouts
+        self._on_task_lost = on_task_lost
+        self._metrics = metrics
+        self._interval = interval
+        self._last_tick = time.monotonic()
+
+    def seconds_until_next_tick(self) -> float:
+        return max(0.0, self._last_tick + self._interval - time.monotonic())
+
+    def tick(self, force: bool = False):
+        """
+        Checks the workers, if the interval elapsed since the last check.
+        :param force: Check the workers even if the interval did not elapse yet.
+        """
+        now = time.monotonic()
+        if not force and now - self._last_tick < self._interval:
+            return
+        self._last_tick = now
+
+        for pool in self._pools:
+            self._restart_stuck_workers(pool)
+            self._replace_exited_workers(pool)
+
+    def _restart_stuck_workers(self, pool):
+        stage = pool.get_stage()
+        timeout = self._task_timeouts.get(stage)
+        if not timeout:
+            return
+
+        for worker in list(pool.get_workers()):
+            running_task = worker.get_running_task()
+            if running_task is None or running_task[1] < timeout or not worker.is_alive():
+                continue
+
+            task_id, seconds = running_task
+            logger.warning(
+                f"{worker.get_worker_type()} running {task_id} for {seconds:.0f}s, restarting it."
+            )
+            pool.replace_worker(worker, timeout=STUCK_WORKER_EXIT_TIMEOUT)
+            self._record_restart(stage, TASK_TIMEOUT_RESTART)
+            self._fail_held_tasks(stage, worker, task_id, f"Timeout: task exceeded {timeout:g}s")
+
+    def _replace_exited_workers(self, pool):
+        stage = pool.get_stage()
+        for worker in pool.reap():
+            if worker.get_process().exitcode == 0:
+                logger.debug(f"Replacing recycled {worker.get_worker_type()}")
+                self._record_restart(stage, RECYCLED_RESTART)
+            else:
+                logger.warning(
+                    f"{worker.get_worker_type()} exited with code {worker.get_process().exitcode}, "
+                    f"replacing it."
+                )
+                self._record_restart(stage, CRASHED_RESTART)
+            pool.spawn_worker()
+
+            running_task = worker.get_running_task()
+            self._fail_held_tasks(
+                stage,
+                worker,
+                running_task[0] if running_task is not None else None,
+                "Worker exited while running the task",
+            )
+
+    def _fail_held_tasks(self, stage: str, worker, running_task_id: str, error: str):
+        """
+        Hands the tasks held by an exited `worker` to `on_task_lost`, the running one fails with
+        `error`. A worker killed before sending a task result never sends it.
+        """
+        task_ids = [str(task_id) for task_id in worker.get_held_tasks()]
+        if running_task_id is not None and running_task_id not in task_ids:
+            task_ids.append(running_task_id)
+
+        for task_id in dict.fromkeys(task_ids):
+            if task_id == running_task_id:
+                self._on_task_lost(stage, task_id, error)
+            else:
+                self._on_task_lost(stage, task_id, "Worker exited before sending the task result")
+
+    def _record_restart(self, stage: str, reason: str):
+        if self._metrics:
+            self._metrics.record_worker_restart(stage, reason)
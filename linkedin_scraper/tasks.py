@@ -0,0 +1,135 @@
+from collections import Counter
+from typing import Iterator, Optional
+
+# Task states, a task moves from QUEUED_GOOGLE to QUEUED_LINKEDIN, and ends in DONE or FAILED.
+QUEUED_GOOGLE = "queued_google"
+QUEUED_LINKEDIN = "queued_linkedin"
+DONE = "done"
+FAILED = "failed"
+
+FINAL_STATES = (DONE, FAILED)
+
+# Scraping stages, each one served by its own pool of workers.
+GOOGLE_STAGE = "google"
+LINKEDIN_STAGE = "linkedin"
+
+
+class TaskRecord:
+    """
+    Compact record holding the state and result data of a single scrape task.
+    """
+
+    __slots__ = (
+        "task_id",
+        "input_data",
+        "state",
+        "status",
+        "linkedin_url",
+        "employee_count",
+        "google_retries",
+        "linkedin_retries",
+        "queued_at",
+        "hedged",
+    )
+
+    def __init__(self, task_id: str, input_data: str, state: str):
+        self.task_id = task_id
+        self.input_data = input_data
+        self.state = state
+        self.status = None
+        self.linkedin_url = None
+        self.employee_count = None
+        # Number of retries of the task in each stage
+        self.google_retries = 0
+        self.linkedin_retries = 0
+        # time.monotonic() of the last dispatch of the task to a stage queue
+        self.queued_at = None
+        # True while a hedge (a second dispatch) of the last dispatch may be in flight
+        self.hedged = False
+
+    def is_final(self) -> bool:
+        return self.state in FINAL_STATES
+
+    def to_dict(self) -> dict:
+        """
+        Returns the task result data, in the format exposed by `ScraperController.get_results_data`.
+        """
+        return {
+            "status": self.status,
+            "linkedin_url": self.linkedin_url,
+            "employee_count": self.employee_count,
+        }
+
+    @classmethod
+    def from_dict(cls, task_id: str, data: dict) -> "TaskRecord":
+        """
+        Builds a finished task record from its result data, for example a journal record.
+        """
+        status = data.get("status")
+        record = cls(task_id, task_id, DONE if status == "success" else FAILED)
+        record.status = status
+        record.linkedin_url = data.get("linkedin_url")
+        record.employee_count = data.get("employee_count")
+        return record
+
+
+class TaskTable:
+    """
+    Index of the scrape session tasks, by task id.
+    State transitions and per-state counts are O(1), so the table scales to millions of tasks.
+    """
+
+    def __init__(self):
+        self._tasks = {}
+        self._state_counts = Counter()
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._tasks
+
+    def __iter__(self) -> Iterator[TaskRecord]:
+        return iter(self._tasks.values())
+
+    def add(self, record: TaskRecord) -> TaskRecord:
+        """
+        Adds a task record to the table, replacing any previous record with the same task id.
+        """
+        self.pop(record.task_id)
+        self._tasks[record.task_id] = record
+        self._state_counts[record.state] += 1
+        return record
+
+    def get(self, task_id: str) -> Optional[TaskRecord]:
+        return self._tasks.get(task_id)
+
+    def pop(self, task_id: str) -> Optional[TaskRecord]:
+        """
+        Removes a task record from the table.
+        :return: The removed record, or None if there was no task with that id.
+        """
+        record = self._tasks.pop(task_id, None)
+        if record is not None:
+            self._state_counts[record.state] -= 1
+        return record
+
+    def set_state(self, record: TaskRecord, state: str):
+        """
+        Moves a task record to a new state.
+        """
+        self._state_counts[record.state] -= 1
+        self._state_counts[state] += 1
+        record.state = state
+
+    def count(self, state: str) -> int:
+        """Returns the number of tasks in `state`"""
+        return self._state_counts[state]
+
+    def counts(self) -> dict:
+        """Returns the number of tasks in each state"""
+        return {state: count for state, count in self._state_counts.items() if count}
+
+    def pending_count(self) -> int:
+        """Returns the number of tasks that did not reach a final state yet"""
+        return len(self._tasks) - self.count(DONE) - self.count(FAILED)
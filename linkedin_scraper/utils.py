@@ -1,4 +1,18 @@
+import re
 import csv
+import unicodedata
+from urllib.parse import unquote, urlsplit
+
+# Legal entity suffixes ignored when comparing company names, e.g. "Walmart Inc." is "Walmart"
+COMPANY_LEGAL_SUFFIXES = frozenset(
+    (
+        "inc", "incorporated", "corp", "corporation", "co", "company", "cos", "llc", "llp",
+        "lp", "ltd", "limited", "plc", "sa", "ag", "nv", "bv", "gmbh",
+    )
+)
+# Removed without splitting words: "L.L.C." is "llc", "Lowe's" is "lowes"
+_JOINING_PUNCTUATION_RE = re.compile(r"[.'\u2019`]")
+_NON_WORD_RE = re.compile(r"[\W_]+")
 
 
 def get_rows_from_csv(fname):
@@ -19,3 +33,50 @@ def write_csv(fname, header, data):
 
         writer.writerow(header)
         writer.writerows(data)
+
+
+def get_company_name_words(company_name: str, strip_legal_suffixes: bool = True) -> list:
+    """
+    Returns the case folded words of a company name, without punctuation and, optionally,
+    trailing legal suffixes. e.g. "Procter & Gamble Co." is ["procter", "and", "gamble"].
+    """
+    name = unicodedata.normalize("NFKC", company_name).casefold()
+    name = _JOINING_PUNCTUATION_RE.sub("", name).replace("&", " and ")
+    words = _NON_WORD_RE.sub(" ", name).split()
+    if strip_legal_suffixes:
+        # Never strip the whole name, "Co" alone is still a company name
+        while len(words) > 1 and words[-1] in COMPANY_LEGAL_SUFFIXES:
+            words.pop()
+            # "& Co." is a single suffix, "JPMorgan Chase & Co." is ["jpmorgan", "chase"]
+            if len(words) > 1 and words[-1] == "and":
+                words.pop()
+    return words
+
+
+def normalize_company_name(company_name: str) -> str:
+    """
+    Returns the canonical form of a company name, used to detect duplicated companies:
+    case folded, without punctuation, extra whitespace or trailing legal suffixes.
+    e.g. "Walmart", " walmart " and "Walmart, Inc." are all "walmart".
+    """
+    words = get_company_name_words(company_name)
+    if not words:
+        # Only punctuation, keep it as is so it doesn't match other such names
+        return company_name.strip()
+    return " ".join(words)
+
+
+def normalize_linkedin_url(linkedin_url: str) -> str:
+    """
+    Returns the canonical form of a LinkedIn company url, used to detect urls of the same page:
+    without scheme, "www." or country subdomain, query string, fragment or trailing slash, and lower case.
+    e.g. "https://uk.linkedin.com/company/Walmart/?trk=x" is "linkedin.com/company/walmart".
+    """
+    parts = urlsplit(linkedin_url.strip())
+    host = parts.netloc.lower()
+    if host == "linkedin.com" or host.endswith(".linkedin.com"):
+        host = "linkedin.com"
+    elif host.startswith("www."):
+        host = host[len("www."):]
+    path = unquote(parts.path).rstrip("/").lower()
+    return f"{host}{path}"
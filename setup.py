@@ -17,6 +17,7 @@ install_requires = [
     "yagooglesearch @ git+ssh://git@github.com/pguridi/yagooglesearch.git#egg=some-pkg",
     "playwright",
     "playwright-stealth",
+    "requests",
     "tqdm"
 ]
 
@@ -30,11 +31,13 @@ setup(
     install_requires=install_requires,
     test_suite="tests",
     tests_require=test_requirements,
+    extras_require={"parquet": ["pyarrow"]},
     url="",
     setup_requires=setup_requirements,
     entry_points={
         'console_scripts': [
             'linkedin_scraper = linkedin_scraper.cli:scrape_companies_csv',
+            'linkedin_scraper_worker = linkedin_scraper.cli:run_workers',
         ],
     },
     include_package_data=False,
@@ -1,8 +1,9 @@
 import time
 import unittest
 
-from multiprocessing import Queue, Process
+from multiprocessing.process import BaseProcess
 
+from linkedin_scraper.processes import get_context
 from linkedin_scraper.scrapers.base import BaseScraperWorker
 
 
@@ -18,8 +19,8 @@ class DummyScraper(BaseScraperWorker):
 
 class TestBaseScraperWorker(unittest.TestCase):
     def setUp(self):
-        self.input_queue = Queue()
-        self.results_queue = Queue()
+        self.input_queue = get_context().Queue()
+        self.results_queue = get_context().Queue()
         self.scraper = DummyScraper(
             worker_id=1, input_queue=self.input_queue, results_queue=self.results_queue
         )
@@ -36,7 +37,7 @@ class TestBaseScraperWorker(unittest.TestCase):
     def test_base_scraper_process_check(self):
         """This test checks for the process handling, making sure there are no zombie processes left"""
         # Make sure the process is alive
-        self.assertIsInstance(self.scraper.get_process(), Process)
+        self.assertIsInstance(self.scraper.get_process(), BaseProcess)
 
         # Stop the process
         self.scraper.stop()
@@ -78,3 +79,64 @@ class TestBaseScraperWorker(unittest.TestCase):
 
         # Make sure the results queue is empty
         self.assertEqual(self.results_queue.empty(), True)
+
+    def test_base_scraper_graceful_stop(self):
+        """Stopping the worker must not lose the results of the tasks it already received"""
+        self.input_queue.put(("scrape_task", 1, "sample_data"))
+
+        start = time.time()
+        self.scraper.stop()
+        # An idle worker must exit on the stop message, without waiting for the terminate timeout
+        self.assertLess(time.time() - start, 5)
+
+        type, task_id, data, status = self.results_queue.get(timeout=1)
+        self.assertEqual(data, ("sample_data", "atad_elpmas"))
+        self.assertEqual(self.scraper.get_process(), None)
+
+
+class TestBaseScraperWorkerBatching(unittest.TestCase):
+    def setUp(self):
+        self.input_queue = get_context().Queue()
+        self.results_queue = get_context().Queue()
+        self.scraper = DummyScraper(
+            worker_id=1,
+            input_queue=self.input_queue,
+            results_queue=self.results_queue,
+            result_batch_size=3,
+            result_flush_interval=0.2,
+        )
+        self.scraper.run_in_thread()
+
+    def tearDown(self):
+        self.scraper.stop()
+        self.scraper = None
+
+    def test_batched_tasks_and_results(self):
+        """A batch of tasks must produce batched results, flushed by size and by time"""
+        self.input_queue.put(
+            ("scrape_batch", None, [(i, f"data{i}") for i in range(4)])
+        )
+
+        # The first 3 results fill a batch
+        type, task_id, data, status = self.results_queue.get(timeout=1)
+        self.assertEqual(status, "batch")
+        self.assertEqual(
+            data,
+            [(i, (f"data{i}", f"{i}atad"), "success") for i in range(3)],
+        )
+
+        # The last one is flushed after the flush interval
+        type, task_id, data, status = self.results_queue.get(timeout=1)
+        self.assertEqual(data, [(3, ("data3", "3atad"), "success")])
+
+    def test_held_tasks_of_killed_worker(self):
+        """The tasks whose results were not sent yet are known once the worker is killed"""
+        self.input_queue.put(
+            ("scrape_batch", None, [(i, f"data{i}") for i in range(4)])
+        )
+        self.results_queue.get(timeout=1)
+
+        # The last result waits for the flush interval
+        self.scraper.get_process().kill()
+        self.scraper.get_process().join()
+        self.assertEqual(self.scraper.get_held_tasks(), [3])
@@ -24,3 +24,91 @@ class TestGoogleScrapeWorker(unittest.TestCase):
             str(cm.exception),
             "Invalid extracted linkeding page: https://www.microsoft.com",
         )
+
+    @mock.patch("linkedin_scraper.scrapers.google.run_google_query")
+    def test_google_rate_limiter_feedback(self, run_google_query):
+        """HTTP 429 responses must slow down the shared rate limiter"""
+        rate_limiter = mock.Mock()
+        google_worker = GoogleScrapeWorker(
+            worker_id=1, input_queue=None, results_queue=None, rate_limiter=rate_limiter
+        )
+
+        run_google_query.side_effect = Exception("HTTP_429_DETECTED")
+        with self.assertRaises(Exception):
+            google_worker.run_task("Microsoft")
+        rate_limiter.acquire.assert_called_once()
+        rate_limiter.on_throttle.assert_called_once()
+
+        # Transport errors are not a Google answer, the rate limiter is left as is
+        run_google_query.side_effect = ConnectionError("Cannot connect to proxy")
+        with self.assertRaises(ConnectionError):
+            google_worker.run_task("Microsoft")
+        rate_limiter.on_throttle.assert_called_once()
+        rate_limiter.on_success.assert_not_called()
+
+        run_google_query.side_effect = ScrapingError("Page not found")
+        with self.assertRaises(ScrapingError):
+            google_worker.run_task("Microsoft")
+        rate_limiter.on_success.assert_called_once()
+
+        run_google_query.side_effect = None
+        run_google_query.return_value = "https://www.linkedin.com/company/microsoft"
+        google_worker.run_task("Microsoft")
+        self.assertEqual(rate_limiter.on_success.call_count, 2)
+
+    @mock.patch("linkedin_scraper.scrapers.google.run_google_query")
+    def test_google_proxy_pool_feedback(self, run_google_query):
+        """Queries go through the pool proxies, rate limited per proxy, and report their outcome"""
+        proxy_pool = mock.Mock()
+        proxy_pool.acquire.return_value = "http://10.0.0.1:8080"
+        rate_limiters = {"http://10.0.0.1:8080": mock.Mock()}
+        google_worker = GoogleScrapeWorker(
+            worker_id=1,
+            input_queue=None,
+            results_queue=None,
+            rate_limiter=mock.Mock(),
+            proxy_pool=proxy_pool,
+            proxy_rate_limiters=rate_limiters,
+        )
+
+        run_google_query.side_effect = Exception("HTTP_429_DETECTED")
+        with self.assertRaises(Exception):
+            google_worker.run_task("Microsoft")
+        run_google_query.assert_called_once_with("Microsoft", proxy="http://10.0.0.1:8080")
+        self.assertEqual(proxy_pool.release.call_args.kwargs["error"], "HTTP_429_DETECTED")
+        rate_limiters["http://10.0.0.1:8080"].on_throttle.assert_called_once()
+
+        run_google_query.side_effect = None
+        run_google_query.return_value = "https://www.linkedin.com/company/microsoft"
+        google_worker.run_task("Microsoft")
+        self.assertNotIn("error", proxy_pool.release.call_args.kwargs)
+        self.assertEqual(proxy_pool.release.call_count, 2)
+
+    @mock.patch("linkedin_scraper.scrapers.google.run_google_query")
+    def test_slug_resolver_before_google(self, run_google_query):
+        """Google is only queried for the companies the slug resolver can't guess"""
+        slug_resolver = mock.Mock()
+        slug_resolver.resolve.return_value = "https://www.linkedin.com/company/walmart"
+        rate_limiter = mock.Mock()
+        google_worker = GoogleScrapeWorker(
+            worker_id=1,
+            input_queue=None,
+            results_queue=None,
+            rate_limiter=rate_limiter,
+            slug_resolver=slug_resolver,
+        )
+
+        self.assertEqual(
+            google_worker.run_task("Walmart"), "https://www.linkedin.com/company/walmart"
+        )
+        run_google_query.assert_not_called()
+        rate_limiter.acquire.assert_not_called()
+
+        slug_resolver.resolve.return_value = None
+        run_google_query.return_value = "https://www.linkedin.com/company/microsoft"
+        google_worker.run_task("Microsoft")
+
+        # Resolver errors (i.e. throttled) fall back to Google as well
+        slug_resolver.resolve.side_effect = ScrapingError("HTTP 429 fetching page")
+        google_worker.run_task("Microsoft")
+        self.assertEqual(run_google_query.call_count, 2)
@@ -1,6 +1,42 @@
+import os
+import mock
 import unittest
+import threading
 
+from urllib.parse import urlsplit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from linkedin_scraper.proxies import ProxyPool
 from linkedin_scraper.scrapers.linkedin import LinkedinScrapeWorker
+from linkedin_scraper.scrapers.linkedin_http import parse_top_card_text
+from linkedin_scraper.scrapers.page_policy import PageLoadPolicy
+
+SAMPLE_PAGE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "data", "linkedin_company_page.html"
+)
+
+
+class SavedPageHandler(BaseHTTPRequestHandler):
+    """
+    Serves the saved LinkedIn company page on /company/walmart, and 404 otherwise.
+    It also works as an HTTP proxy of any host, serving the same pages.
+    """
+
+    def do_GET(self):
+        if urlsplit(self.path).path != "/company/walmart":
+            self.send_error(404)
+            return
+
+        with open(SAMPLE_PAGE_PATH, "rb") as f:
+            body = f.read()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
 
 
 class TestEmployeeCountRegex(unittest.TestCase):
@@ -13,3 +49,162 @@ class TestEmployeeCountRegex(unittest.TestCase):
         input_text = " "
         result = LinkedinScrapeWorker.get_employee_count_regex(text=input_text)
         self.assertEqual(result, None)
+
+
+class TestLinkedinBrowserLifecycle(unittest.TestCase):
+    @mock.patch("linkedin_scraper.scrapers.linkedin.stealth_sync")
+    @mock.patch("linkedin_scraper.scrapers.linkedin.sync_playwright")
+    def test_browser_is_reused_and_relaunched(self, sync_playwright, stealth_sync):
+        """The browser must be launched once for many tasks, and relaunched after a crash"""
+        launch = sync_playwright.return_value.start.return_value.chromium.launch
+        browser = launch.return_value
+        browser.is_connected.return_value = True
+        page = browser.new_context.return_value.new_page.return_value
+        page.locator.return_value.first.inner_text.return_value = " View all 11 employees"
+
+        linkedin_worker = LinkedinScrapeWorker(
+            worker_id=1, input_queue=None, results_queue=None, http_fast_path=False
+        )
+
+        for _ in range(3):
+            self.assertEqual(linkedin_worker.run_task("https://www.linkedin.com/company/x"), 11)
+
+        self.assertEqual(launch.call_count, 1)
+        # each task must get its own context, closed after the task
+        self.assertEqual(browser.new_context.return_value.close.call_count, 3)
+
+        # simulate a browser crash
+        browser.is_connected.return_value = False
+        linkedin_worker.run_task("https://www.linkedin.com/company/x")
+        self.assertEqual(launch.call_count, 2)
+
+        linkedin_worker.teardown()
+        sync_playwright.return_value.start.return_value.stop.assert_called()
+
+
+class TestPageLoadPolicy(unittest.TestCase):
+    def test_should_block(self):
+        policy = PageLoadPolicy(
+            blocked_resource_types=("image", "font"),
+            block_third_party=True,
+            allowed_domains=("licdn.com",),
+        )
+        host = "www.linkedin.com"
+        self.assertFalse(policy.should_block("document", "https://www.linkedin.com/company/x", host))
+        self.assertFalse(policy.should_block("script", "https://static.licdn.com/app.js", host))
+        self.assertTrue(policy.should_block("image", "https://media.licdn.com/logo.png", host))
+        self.assertTrue(policy.should_block("script", "https://www.google-analytics.com/a.js", host))
+        # Urls without host are never third-party
+        self.assertFalse(policy.should_block("other", "data:text/plain,x", host))
+
+        policy = PageLoadPolicy(blocked_resource_types=(), block_third_party=False)
+        self.assertFalse(policy.blocks_requests())
+        self.assertFalse(policy.should_block("image", "https://tracker.example.com/a.gif", host))
+
+    @mock.patch("linkedin_scraper.scrapers.linkedin.stealth_sync")
+    @mock.patch("linkedin_scraper.scrapers.linkedin.sync_playwright")
+    def test_browser_page_load_policy(self, sync_playwright, stealth_sync):
+        browser = sync_playwright.return_value.start.return_value.chromium.launch.return_value
+        browser.is_connected.return_value = True
+        context = browser.new_context.return_value
+        page = context.new_page.return_value
+        page.locator.return_value.first.inner_text.return_value = " View all 11 employees"
+
+        linkedin_worker = LinkedinScrapeWorker(
+            worker_id=1,
+            input_queue=None,
+            results_queue=None,
+            http_fast_path=False,
+            page_policy=PageLoadPolicy(blocked_resource_types=("image",), wait_for_top_card=True),
+        )
+        self.assertEqual(linkedin_worker.run_task("https://www.linkedin.com/company/x"), 11)
+
+        # The page is read as soon as the top card is attached
+        page.goto.assert_called_once_with("https://www.linkedin.com/company/x", wait_until="commit")
+        page.locator.return_value.first.wait_for.assert_called_once_with(state="attached")
+
+        # The route handler aborts the blocked requests
+        route_handler = context.route.call_args[0][1]
+        image_route = mock.Mock()
+        image_route.request.resource_type = "image"
+        image_route.request.url = "https://www.linkedin.com/logo.png"
+        route_handler(image_route)
+        image_route.abort.assert_called_once()
+
+        script_route = mock.Mock()
+        script_route.request.resource_type = "script"
+        script_route.request.url = "https://www.linkedin.com/app.js"
+        route_handler(script_route)
+        script_route.continue_.assert_called_once()
+        self.assertEqual(linkedin_worker.get_page_stats()["blocked_requests"], 1)
+
+
+class TestLinkedinHttpFastPath(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), SavedPageHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = "http://%s:%s" % self.server.server_address
+
+        self.linkedin_worker = LinkedinScrapeWorker(
+            worker_id=1, input_queue=None, results_queue=None, http_fast_path=True
+        )
+
+    def tearDown(self):
+        self.linkedin_worker.teardown()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_parse_top_card_text(self):
+        with open(SAMPLE_PAGE_PATH) as f:
+            text = parse_top_card_text(f.read())
+
+        self.assertTrue(text.startswith("Walmart\nRetail"))
+        # Text outside of the top card must be ignored
+        self.assertNotIn("employees of the month", text)
+        self.assertEqual(LinkedinScrapeWorker.get_employee_count_regex(text), 2300000)
+
+    def test_parse_top_card_text_missing(self):
+        self.assertIsNone(parse_top_card_text("<html><body>Sign in</body></html>"))
+
+    def test_fast_path_hit(self):
+        with mock.patch.object(self.linkedin_worker, "_run_browser_task") as browser_task:
+            employee_count = self.linkedin_worker.run_task(f"{self.base_url}/company/walmart")
+
+        self.assertEqual(employee_count, 2300000)
+        browser_task.assert_not_called()
+        self.assertEqual(self.linkedin_worker.get_path_stats()["http"]["hits"], 1)
+
+    def test_fast_path_falls_back_to_browser(self):
+        with mock.patch.object(
+            self.linkedin_worker, "_run_browser_task", return_value=11
+        ) as browser_task:
+            employee_count = self.linkedin_worker.run_task(f"{self.base_url}/company/authwall")
+
+        self.assertEqual(employee_count, 11)
+        browser_task.assert_called_once()
+        path_stats = self.linkedin_worker.get_path_stats()
+        self.assertEqual(path_stats["http"]["attempts"], 1)
+        self.assertEqual(path_stats["http"]["hits"], 0)
+        self.assertEqual(path_stats["browser"]["hits"], 1)
+
+    def test_fast_path_through_proxy(self):
+        proxy_pool = ProxyPool([self.base_url])
+        linkedin_worker = LinkedinScrapeWorker(
+            worker_id=2,
+            input_queue=None,
+            results_queue=None,
+            http_fast_path=True,
+            proxy_pool=proxy_pool,
+        )
+        try:
+            employee_count = linkedin_worker.run_task("http://linkedin.invalid/company/walmart")
+            with mock.patch.object(linkedin_worker, "_run_browser_task", return_value=11):
+                linkedin_worker.run_task("http://linkedin.invalid/company/missing")
+        finally:
+            linkedin_worker.teardown()
+
+        self.assertEqual(employee_count, 2300000)
+        # The proxy answered both requests, a missing page is not a proxy failure
+        proxy_stats = proxy_pool.stats()[0]
+        self.assertEqual((proxy_stats["requests"], proxy_stats["successes"]), (2, 2))
+        self.assertEqual(proxy_stats["in_flight"], 0)
@@ -0,0 +1,107 @@
+import asyncio
+import time
+import unittest
+
+from linkedin_scraper.processes import get_context
+from linkedin_scraper.scrapers.linkedin_async import AsyncLinkedinScrapeWorker
+
+
+class DummyAsyncScraper(AsyncLinkedinScrapeWorker):
+    """
+    Async scraper that simulates a slow page load, without a browser.
+    """
+
+    async def run_task_async(self, page_url):
+        await asyncio.sleep(0.5)
+        if page_url == "broken":
+            raise ValueError("broken page")
+        return len(page_url)
+
+    async def _close_browser_async(self):
+        self._results_queue.put(("closed", self._worker_id, None, None))
+
+
+class TestAsyncLinkedinScrapeWorker(unittest.TestCase):
+    def setUp(self):
+        self.input_queue = get_context().Queue()
+        self.results_queue = get_context().Queue()
+        self.scraper = DummyAsyncScraper(
+            worker_id=1,
+            input_queue=self.input_queue,
+            results_queue=self.results_queue,
+            max_pages=20,
+        )
+        self.scraper.run_in_thread()
+
+    def tearDown(self):
+        self.scraper.stop()
+        self.scraper = None
+
+    def test_async_scraper_runs_tasks_concurrently(self):
+        """20 tasks of 0.5s each must complete in about the time of a single one"""
+        start = time.time()
+        for i in range(20):
+            self.input_queue.put(("scrape_task", i, "x" * i))
+
+        results = [self.results_queue.get(timeout=5) for _ in range(20)]
+        self.assertLess(time.time() - start, 3)
+
+        for worker_type, task_id, data, status in results:
+            self.assertEqual(worker_type, "DummyAsyncScraper")
+            self.assertEqual(status, "success")
+            self.assertEqual(data, ("x" * task_id, task_id))
+
+    def test_async_scraper_failed_task(self):
+        """A failing page must be reported as a failed task result"""
+        self.input_queue.put(("scrape_task", 1, "broken"))
+
+        worker_type, task_id, data, status = self.results_queue.get(timeout=5)
+        self.assertEqual(status, "failed")
+        self.assertEqual(data, ("broken", "scrape_error: broken page"))
+
+    def test_async_scraper_terminate_runs_cleanup(self):
+        """A terminated worker still sends its buffered results and closes its browser"""
+        self.input_queue.put(("scrape_task", 1, "x"))
+        time.sleep(0.2)
+
+        start = time.time()
+        self.scraper.terminate()
+        self.assertLess(time.time() - start, 5)
+        self.assertEqual(self.results_queue.get(timeout=5), ("closed", 1, None, None))
+
+
+class HttpDummyAsyncScraper(AsyncLinkedinScrapeWorker):
+    """
+    Async scraper whose HTTP fast path always finds the employee count, without a server.
+    """
+
+    def _fetch_http_fast_path(self, page_url):
+        time.sleep(0.1)
+        return len(page_url), 0.1
+
+    def log_path_stats(self):
+        self._results_queue.put(("path_stats", None, self.get_path_stats(), None))
+
+
+class TestAsyncLinkedinScrapeWorkerHttpFastPath(unittest.TestCase):
+    def test_http_fast_path_stats(self):
+        """The fast path requests run in threads, and every one of them is counted"""
+        input_queue = get_context().Queue()
+        results_queue = get_context().Queue()
+        scraper = HttpDummyAsyncScraper(
+            worker_id=1, input_queue=input_queue, results_queue=results_queue, max_pages=10
+        )
+        scraper.run_in_thread()
+        try:
+            for i in range(20):
+                input_queue.put(("scrape_task", i, "x" * i))
+            results = [results_queue.get(timeout=5) for _ in range(20)]
+            self.assertEqual({status for _, _, _, status in results}, {"success"})
+        finally:
+            scraper.stop()
+
+        worker_type, task_id, path_stats, status = results_queue.get(timeout=5)
+        self.assertEqual(worker_type, "path_stats")
+        self.assertEqual(path_stats["http"]["attempts"], 20)
+        self.assertEqual(path_stats["http"]["hits"], 20)
+        self.assertEqual(path_stats["browser"]["attempts"], 0)
@@ -0,0 +1,119 @@
+import unittest
+import threading
+
+from urllib.parse import urlsplit
+from http.server import ThreadingHTTPServer
+
+from linkedin_scraper.exceptions import ScrapingError
+from linkedin_scraper.scrapers.slug_resolver import (
+    SlugResolver,
+    get_slug_candidates,
+    page_matches_company,
+)
+from tests.scrapers.test_linkedin import SavedPageHandler
+
+OTHER_COMPANY_PAGE = (
+    b"<html><head><title>Acme Rockets | LinkedIn</title></head><body></body></html>"
+)
+
+
+class StubLinkedinHandler(SavedPageHandler):
+    """
+    Serves the saved Walmart page on /company/walmart, another company page on /company/acme,
+    HTTP 429 on /company/throttled and 404 otherwise. Requests are recorded in `server.requests`.
+    """
+
+    def do_HEAD(self):
+        self.server.requests.append(("HEAD", self.path))
+        path = urlsplit(self.path).path
+        if path in ("/company/walmart", "/company/acme"):
+            self.send_response(200)
+            self.end_headers()
+        else:
+            self.send_error(429 if path == "/company/throttled" else 404)
+
+    def do_GET(self):
+        self.server.requests.append(("GET", self.path))
+        if urlsplit(self.path).path == "/company/acme":
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(OTHER_COMPANY_PAGE)))
+            self.end_headers()
+            self.wfile.write(OTHER_COMPANY_PAGE)
+            return
+        super().do_GET()
+
+
+class TestSlugCandidates(unittest.TestCase):
+    def test_get_slug_candidates(self):
+        self.assertEqual(get_slug_candidates("Walmart, Inc."), ["walmart", "walmart-inc"])
+        self.assertEqual(
+            get_slug_candidates("Ford Motor Co."), ["ford-motor", "fordmotor", "ford-motor-co"]
+        )
+        self.assertEqual(
+            get_slug_candidates("Procter & Gamble", max_candidates=1), ["procter-and-gamble"]
+        )
+        self.assertEqual(get_slug_candidates("Nestlé"), ["nestle"])
+        self.assertEqual(get_slug_candidates("!!!"), [])
+
+    def test_page_matches_company(self):
+        self.assertTrue(page_matches_company("Walmart Inc.", "Walmart | LinkedIn", None))
+        self.assertTrue(page_matches_company("walmart", None, "Walmart\nRetail"))
+        self.assertFalse(page_matches_company("Acme", "Acme Rockets | LinkedIn", "Acme Rockets"))
+        self.assertFalse(page_matches_company("Acme", None, None))
+
+
+class TestSlugResolver(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubLinkedinHandler)
+        cls.server.requests = []
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.requests.clear()
+        self.resolver = SlugResolver(base_url=self.base_url, timeout=5)
+
+    def tearDown(self):
+        self.resolver.close()
+
+    def test_resolved(self):
+        self.assertEqual(self.resolver.resolve("Walmart Inc."), f"{self.base_url}/company/walmart")
+        self.assertEqual(
+            self.server.requests, [("HEAD", "/company/walmart"), ("GET", "/company/walmart")]
+        )
+
+        stats = self.resolver.stats()
+        self.assertEqual(stats["companies"], 1)
+        self.assertEqual(stats["google_queries_saved"], 1)
+        self.assertEqual(stats["requests"], 2)
+
+    def test_missing_pages_are_not_loaded(self):
+        self.assertIsNone(self.resolver.resolve("Unknown Widgets Ltd"))
+        self.assertEqual(
+            self.server.requests,
+            [
+                ("HEAD", "/company/unknown-widgets"),
+                ("HEAD", "/company/unknownwidgets"),
+                ("HEAD", "/company/unknown-widgets-ltd"),
+            ],
+        )
+
+    def test_other_company_page(self):
+        self.assertIsNone(self.resolver.resolve("Acme"))
+
+        stats = self.resolver.stats()
+        self.assertEqual(stats["hits"], 0)
+        self.assertEqual(stats["hit_rate"], 0.0)
+
+    def test_throttled(self):
+        with self.assertRaises(ScrapingError):
+            self.resolver.resolve("Throttled")
+        self.assertEqual(self.resolver.stats()["companies"], 1)
@@ -0,0 +1,88 @@
+import os
+import time
+import tempfile
+import unittest
+
+from linkedin_scraper import ScraperController
+from linkedin_scraper.cache import LinkedinUrlCache
+
+
+class TestLinkedinUrlCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmp_dir.name, "cache", "urls.sqlite3")
+        self.cache = LinkedinUrlCache(path=self.cache_path, ttl=60, negative_ttl=60)
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp_dir.cleanup()
+
+    def test_cache_miss_hit_and_not_found(self):
+        self.assertIsNone(self.cache.get("Walmart"))
+
+        self.cache.set("Walmart", "https://www.linkedin.com/company/walmart")
+        self.cache.set_not_found("Nonexistent Co")
+
+        self.assertEqual(
+            self.cache.get("Walmart"),
+            (True, "https://www.linkedin.com/company/walmart"),
+        )
+        self.assertEqual(self.cache.get("Nonexistent Co"), (False, None))
+
+    def test_cache_persistence(self):
+        """Entries must survive reopening the database"""
+        self.cache.set("Walmart", "https://www.linkedin.com/company/walmart")
+        self.cache.close()
+
+        self.cache = LinkedinUrlCache(path=self.cache_path)
+        self.assertEqual(
+            self.cache.get("Walmart"),
+            (True, "https://www.linkedin.com/company/walmart"),
+        )
+
+    def test_cache_expiration_and_prune(self):
+        short_cache = LinkedinUrlCache(path=self.cache_path, ttl=0.1, negative_ttl=60)
+        short_cache.set("Walmart", "https://www.linkedin.com/company/walmart")
+        short_cache.set_not_found("Nonexistent Co")
+        time.sleep(0.2)
+
+        # The positive entry expired, the negative one is still valid
+        self.assertIsNone(short_cache.get("Walmart"))
+        self.assertEqual(short_cache.prune(), 1)
+        self.assertEqual(short_cache.get("Nonexistent Co"), (False, None))
+        short_cache.close()
+
+
+class TestScraperControllerCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = LinkedinUrlCache(
+            path=os.path.join(self.tmp_dir.name, "urls.sqlite3")
+        )
+        self.cache.set("Walmart", "https://www.linkedin.com/company/walmart")
+        self.cache.set_not_found("Nonexistent Co")
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp_dir.cleanup()
+
+    def test_cached_tasks_skip_google_stage(self):
+        controller = ScraperController(show_progress=False, url_cache=self.cache)
+
+        self.assertTrue(controller.queue_cached_scrape("Walmart", "Walmart"))
+        self.assertTrue(controller.queue_cached_scrape("Nonexistent Co", "Nonexistent Co"))
+        self.assertFalse(controller.queue_cached_scrape("Apple", "Apple"))
+
+        # cache hits go straight to the LinkedIn stage
+        self.assertEqual(
+            controller._linkedin_scrape_queue.get(timeout=1),
+            ("scrape_task", "Walmart", "https://www.linkedin.com/company/walmart"),
+        )
+        results = controller.get_results_data()
+        self.assertEqual(results["Nonexistent Co"]["status"], "failed")
+
+    def test_refresh_cache_ignores_cached_entries(self):
+        controller = ScraperController(
+            show_progress=False, url_cache=self.cache, refresh_cache=True
+        )
+        self.assertFalse(controller.queue_cached_scrape("Walmart", "Walmart"))
@@ -0,0 +1,410 @@
+import time
+import mock
+import asyncio
+import unittest
+
+from linkedin_scraper import ScraperController
+from linkedin_scraper.hedging import HedgingPolicy
+from linkedin_scraper.processes import get_context
+from linkedin_scraper.retries import RetryPolicy
+from linkedin_scraper.tasks import GOOGLE_STAGE, LINKEDIN_STAGE
+from linkedin_scraper.scrapers.base import BaseScraperWorker
+
+
+class DummyGoogleScraper(BaseScraperWorker):
+    """Dummy Google stage, builds the LinkedIn url from the company name"""
+
+    def run_task(self, input_data):
+        return f"https://www.linkedin.com/company/{input_data.lower()}"
+
+
+class DummyLinkedinScraper(BaseScraperWorker):
+    """Dummy LinkedIn stage, the employee count is the url length"""
+
+    def run_task(self, input_data):
+        return len(input_data)
+
+
+class TestScraperControllerStream(unittest.TestCase):
+    def setUp(self):
+        self.controller = ScraperController(
+            show_progress=False,
+            google_worker_class=DummyGoogleScraper,
+            linkedin_worker_class=DummyLinkedinScraper,
+        )
+
+    def tearDown(self):
+        self.controller.stop()
+
+    def test_scrape_stream_bounded_in_flight(self):
+        """Every result must be streamed, without ever exceeding `max_in_flight` pending tasks"""
+        streamed = {}
+        max_pending = []
+
+        def company_names():
+            for i in range(50):
+                yield f"Company{i}"
+
+        def on_result(company_name, result):
+            max_pending.append(len(self.controller._tasks))
+            streamed[company_name] = result
+
+        self.controller.scrape_stream(
+            company_names=company_names(), on_result=on_result, max_in_flight=5
+        )
+
+        self.assertEqual(len(streamed), 50)
+        self.assertLessEqual(max(max_pending), 5)
+        self.assertEqual(
+            streamed["Company7"],
+            {
+                "status": "success",
+                "linkedin_url": "https://www.linkedin.com/company/company7",
+                "employee_count": len("https://www.linkedin.com/company/company7"),
+            },
+        )
+        # Streamed results are not kept in memory
+        self.assertEqual(self.controller.get_results_data(), {})
+
+    def test_scrape_stream_skips_completed(self):
+        streamed = []
+        self.controller.scrape_stream(
+            company_names=["Walmart", "Apple"],
+            on_result=lambda company_name, result: streamed.append(company_name),
+            completed_results={"Walmart": {"status": "success"}},
+        )
+        self.assertEqual(streamed, ["Apple"])
+
+
+class TestScraperControllerIter(unittest.TestCase):
+    def setUp(self):
+        self.controller = ScraperController(
+            show_progress=False,
+            google_worker_class=DummyGoogleScraper,
+            linkedin_worker_class=DummyLinkedinScraper,
+        )
+
+    def tearDown(self):
+        self.controller.stop()
+
+    def test_scrape_iter(self):
+        company_names = [f"Company{i}" for i in range(20)]
+        results = dict(self.controller.scrape_iter(company_names, max_in_flight=5))
+
+        self.assertEqual(set(results), set(company_names))
+        self.assertEqual(
+            results["Company3"]["linkedin_url"], "https://www.linkedin.com/company/company3"
+        )
+        self.assertEqual(self.controller.get_workers(), [])
+
+    def test_scrape_iter_stop_early(self):
+        company_names = [f"Company{i}" for i in range(1000)]
+        results = self.controller.scrape_iter(company_names, max_in_flight=10)
+        company_name, result = next(results)
+        self.assertEqual(result["status"], "success")
+
+        # Closing the generator stops the workers, without scraping the rest of the input
+        results.close()
+        self.assertEqual(self.controller.get_workers(), [])
+        self.assertLess(self.controller.get_metrics().summary()["finished_tasks"], 100)
+
+    def test_scrape_aiter(self):
+        async def collect():
+            return [
+                company_name
+                async for company_name, result in self.controller.scrape_aiter(
+                    ["Walmart", "Apple", "Walmart Inc."]
+                )
+            ]
+
+        self.assertEqual(sorted(asyncio.run(collect())), ["Apple", "Walmart", "Walmart Inc."])
+        self.assertEqual(self.controller.get_workers(), [])
+
+
+class FirstWordDummyGoogleScraper(BaseScraperWorker):
+    """Dummy Google stage, companies with the same first word share the LinkedIn url"""
+
+    def run_task(self, input_data):
+        return f"https://www.linkedin.com/company/{input_data.split()[0].lower()}/"
+
+
+class BatchedDummyGoogleScraper(DummyGoogleScraper):
+    """Dummy Google stage sending its results in batches"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, result_batch_size=4, **kwargs)
+
+
+class TestScraperControllerBatching(unittest.TestCase):
+    @mock.patch("linkedin_scraper.LINKEDIN_SCRAPER_TASK_BATCH_SIZE", 4)
+    def test_scrape_with_batches(self):
+        controller = ScraperController(
+            show_progress=False,
+            google_worker_class=BatchedDummyGoogleScraper,
+            linkedin_worker_class=DummyLinkedinScraper,
+        )
+        company_names = [f"Company{i}" for i in range(30)]
+
+        results = controller.scrape(company_names_list=company_names)
+
+        self.assertEqual(len(results), 30)
+        self.assertEqual(
+            {result["status"] for result in results.values()}, {"success"}
+        )
+
+
+class TestScraperControllerDeduplication(unittest.TestCase):
+    def setUp(self):
+        self.controller = ScraperController(
+            show_progress=False,
+            google_worker_class=DummyGoogleScraper,
+            linkedin_worker_class=DummyLinkedinScraper,
+        )
+
+    def tearDown(self):
+        self.controller.stop()
+
+    def test_scrape_equivalent_names_once(self):
+        company_names = ["Walmart", "Walmart Inc.", " walmart ", "Walmart", "Apple"]
+
+        results = self.controller.scrape(company_names_list=company_names)
+
+        # Every input name gets the result of the first equivalent name
+        self.assertEqual(set(results), {"Walmart", "Walmart Inc.", " walmart ", "Apple"})
+        for company_name in ("Walmart Inc.", " walmart "):
+            self.assertEqual(results[company_name], results["Walmart"])
+        self.assertEqual(
+            results["Walmart"]["linkedin_url"], "https://www.linkedin.com/company/walmart"
+        )
+        self.assertEqual(self.controller.get_task_counts()["done"], 2)
+        self.assertEqual(self.controller.get_metrics().summary()["deduplicated_inputs"], 3)
+
+    def test_scrape_without_normalization(self):
+        controller = ScraperController(
+            show_progress=False,
+            google_worker_class=DummyGoogleScraper,
+            linkedin_worker_class=DummyLinkedinScraper,
+            normalize_names=False,
+        )
+        results = controller.scrape(company_names_list=["Walmart", "Walmart Inc.", "Walmart"])
+
+        self.assertEqual(controller.get_task_counts()["done"], 2)
+        self.assertEqual(
+            results["Walmart Inc."]["linkedin_url"], "https://www.linkedin.com/company/walmart inc."
+        )
+
+    def test_scrape_stream_fans_out_results(self):
+        streamed = {}
+        self.controller.scrape_stream(
+            company_names=["Walmart", "Walmart, Inc", "Apple"],
+            on_result=lambda company_name, result: streamed.setdefault(company_name, result),
+        )
+
+        self.assertEqual(set(streamed), {"Walmart", "Walmart, Inc", "Apple"})
+        self.assertEqual(streamed["Walmart, Inc"], streamed["Walmart"])
+        self.assertEqual(self.controller.get_metrics().get_deduplicated(), 1)
+
+
+class TestScraperControllerCoalescing(unittest.TestCase):
+    def setUp(self):
+        self.controller = ScraperController(
+            show_progress=False,
+            google_worker_class=FirstWordDummyGoogleScraper,
+            linkedin_worker_class=DummyLinkedinScraper,
+        )
+
+    def tearDown(self):
+        self.controller.stop()
+
+    def test_scrape_same_linkedin_url_once(self):
+        results = self.controller.scrape(
+            company_names_list=["Walmart Stores", "Walmart Labs", "Walmart Mexico", "Apple"]
+        )
+
+        self.assertEqual({result["status"] for result in results.values()}, {"success"})
+        self.assertEqual(
+            results["Walmart Labs"]["employee_count"], results["Walmart Stores"]["employee_count"]
+        )
+        summary = self.controller.get_metrics().summary()
+        self.assertEqual(summary["stages"]["linkedin"]["results"], {"success": 2})
+        self.assertEqual(summary["coalesced_linkedin_scrapes"], 2)
+
+    def test_scrape_stream_reuses_extracted_url(self):
+        streamed = {}
+        self.controller.scrape_stream(
+            company_names=["Walmart Stores", "Walmart Labs"],
+            on_result=lambda company_name, result: streamed.setdefault(company_name, result),
+            max_in_flight=1,
+        )
+
+        # The second company url was already extracted when its Google result arrived
+        self.assertEqual(
+            streamed["Walmart Labs"]["employee_count"], streamed["Walmart Stores"]["employee_count"]
+        )
+        summary = self.controller.get_metrics().summary()
+        self.assertEqual(summary["stages"]["linkedin"]["results"], {"success": 1})
+
+
+class FailingDummyLinkedinScraper(BaseScraperWorker):
+    """Dummy LinkedIn stage, pages of companies named "Timeout*" time out, "Missing*" don't exist"""
+
+    def run_task(self, input_data):
+        if "/timeout" in input_data:
+            raise Exception("Timeout 30000ms exceeded")
+        if "/missing" in input_data:
+            raise Exception(f"HTTP 404 fetching {input_data}")
+        return len(input_data)
+
+
+class TestScraperControllerRetries(unittest.TestCase):
+    def setUp(self):
+        self.controller = ScraperController(
+            show_progress=False,
+            google_worker_class=DummyGoogleScraper,
+            linkedin_worker_class=FailingDummyLinkedinScraper,
+        )
+        self.controller._retry_policies[LINKEDIN_STAGE] = RetryPolicy(
+            max_retries=2, base_delay=0.2, jitter=0
+        )
+
+    def tearDown(self):
+        self.controller.stop()
+
+    def test_linkedin_failures_are_retried_with_backoff(self):
+        start = time.monotonic()
+        results = self.controller.scrape(company_names_list=["Timeout Co", "Missing Co", "Apple"])
+
+        self.assertEqual(results["Apple"]["status"], "success")
+        self.assertEqual(results["Timeout Co"]["status"], "failed")
+        self.assertEqual(results["Missing Co"]["status"], "failed")
+        # Only the timed out page is retried, after 0.2 and 0.4 seconds
+        self.assertEqual(self.controller.get_metrics().summary()["stages"][LINKEDIN_STAGE]["retries"], 2)
+        self.assertGreaterEqual(time.monotonic() - start, 0.6)
+
+
+class SlowOnceDummyGoogleScraper(DummyGoogleScraper):
+    """Dummy Google stage, the first search of "Slow Company" takes 2 seconds"""
+
+    def __init__(self, *args, searches=None, **kwargs):
+        """
+        :param searches: Counter of the searches of "Slow Company", shared by the worker processes.
+        """
+        super().__init__(*args, **kwargs)
+        self._searches = searches
+
+    def run_task(self, input_data):
+        if input_data == "Slow Company":
+            with self._searches.get_lock():
+                self._searches.value += 1
+                first_search = self._searches.value == 1
+            if first_search:
+                time.sleep(2)
+        return super().run_task(input_data)
+
+
+class TestScraperControllerHedging(unittest.TestCase):
+    def setUp(self):
+        self.searches = get_context().Value("i", 0)
+        self.controller = ScraperController(
+            show_progress=False,
+            google_worker_class=SlowOnceDummyGoogleScraper,
+            linkedin_worker_class=DummyLinkedinScraper,
+            hedging=True,
+        )
+        self.controller._google_worker_kwargs["searches"] = self.searches
+        self.controller._hedging_policy = HedgingPolicy(
+            {GOOGLE_STAGE: self.controller.get_metrics().get_latency(GOOGLE_STAGE)},
+            min_samples=5,
+            min_delay=0.2,
+            max_ratio=1,
+            refresh_interval=0,
+        )
+
+    def tearDown(self):
+        self.controller.stop()
+
+    def test_slow_task_is_hedged(self):
+        company_names = ["Slow Company"] + [f"Company{i}" for i in range(20)]
+        # Timed from the first result, the workers start up before
+        start = None
+        for company_name, result in self.controller.scrape_iter(company_names):
+            if start is None:
+                start = time.monotonic()
+            if company_name == "Slow Company":
+                # The hedge result wins, without waiting for the slow search
+                self.assertLess(time.monotonic() - start, 1.5)
+                self.assertEqual(
+                    result["linkedin_url"], "https://www.linkedin.com/company/slow company"
+                )
+
+        self.assertEqual(self.searches.value, 2)
+        stages = self.controller.get_metrics().summary()["stages"]
+        self.assertEqual(stages[GOOGLE_STAGE]["hedges"], 1)
+        self.assertEqual(stages[LINKEDIN_STAGE]["hedges"], 0)
+        self.assertEqual(stages[GOOGLE_STAGE]["results"], {"success": 21})
+
+
+class HangingOnceDummyGoogleScraper(DummyGoogleScraper):
+    """Dummy Google stage, the first search of "Hung Company" never finishes"""
+
+    def __init__(self, *args, searches=None, **kwargs):
+        """
+        :param searches: Counter of the searches of "Hung Company", shared by the worker processes.
+        """
+        super().__init__(*args, **kwargs)
+        self._searches = searches
+
+    def run_task(self, input_data):
+        if input_data == "Hung Company":
+            with self._searches.get_lock():
+                self._searches.value += 1
+                first_search = self._searches.value == 1
+            if first_search:
+                time.sleep(60)
+        return super().run_task(input_data)
+
+
+class TestScraperControllerSupervision(unittest.TestCase):
+    def setUp(self):
+        self.searches = get_context().Value("i", 0)
+        self.controller = ScraperController(
+            show_progress=False,
+            google_worker_class=HangingOnceDummyGoogleScraper,
+            linkedin_worker_class=DummyLinkedinScraper,
+        )
+        self.controller._google_worker_kwargs["searches"] = self.searches
+        self.controller._task_timeouts[GOOGLE_STAGE] = 0.5
+        self.controller._retry_policies[GOOGLE_STAGE] = RetryPolicy(
+            max_retries=2, base_delay=0.1, jitter=0
+        )
+
+    def tearDown(self):
+        self.controller.stop()
+
+    def test_hung_task_is_retried_in_a_new_worker(self):
+        start = time.monotonic()
+        results = self.controller.scrape(company_names_list=["Hung Company", "Apple"])
+
+        self.assertLess(time.monotonic() - start, 10)
+        self.assertEqual(results["Hung Company"]["status"], "success")
+        self.assertEqual(results["Apple"]["status"], "success")
+        self.assertEqual(self.searches.value, 2)
+
+        google_stage = self.controller.get_metrics().summary()["stages"][GOOGLE_STAGE]
+        self.assertEqual(google_stage["worker_restarts"], {"task_timeout": 1})
+        self.assertEqual(google_stage["failures"], {"timeout": 1})
+        self.assertEqual(google_stage["retries"], 1)
+
+    def test_hung_task_batch_is_retried(self):
+        """The rest of the batch of a stuck worker is retried as well"""
+        self.controller._task_batch_size = 4
+        company_names = ["Hung Company", "Apple", "Amazon", "Netflix", "Tesla"]
+        results = self.controller.scrape(company_names_list=company_names)
+
+        self.assertEqual({results[name]["status"] for name in company_names}, {"success"})
+        self.assertEqual(self.searches.value, 2)
+
+        google_stage = self.controller.get_metrics().summary()["stages"][GOOGLE_STAGE]
+        self.assertEqual(google_stage["worker_restarts"], {"task_timeout": 1})
+        self.assertEqual(google_stage["failures"], {"timeout": 1, "error": 3})
+        self.assertEqual(google_stage["retries"], 4)
@@ -0,0 +1,72 @@
+import mock
+import unittest
+
+from linkedin_scraper.hedging import HedgingPolicy
+from linkedin_scraper.metrics import Histogram
+
+
+class TestHedgingPolicy(unittest.TestCase):
+    def setUp(self):
+        self.histogram = Histogram(buckets=(0.5, 1, 2, 5, 10))
+
+    def create_policy(self, **kwargs):
+        kwargs = {"min_samples": 10, "min_delay": 0, "refresh_interval": 0, **kwargs}
+        return HedgingPolicy({"google": self.histogram, "linkedin": Histogram()}, **kwargs)
+
+    def test_threshold_is_the_latency_quantile(self):
+        policy = self.create_policy(quantile=0.9)
+        for _ in range(5):
+            self.histogram.observe(0.2)
+        # Too few latencies yet
+        self.assertIsNone(policy.get_threshold("google"))
+
+        for _ in range(14):
+            self.histogram.observe(0.2)
+        self.histogram.observe(4)
+        self.histogram.observe(4)
+        threshold = policy.get_threshold("google")
+        self.assertGreater(threshold, 2)
+        self.assertLessEqual(threshold, 5)
+        self.assertIsNone(policy.get_threshold("linkedin"))
+
+    def test_min_delay(self):
+        policy = self.create_policy(min_delay=3)
+        for _ in range(20):
+            self.histogram.observe(0.2)
+        self.assertEqual(policy.get_threshold("google"), 3)
+
+    def test_only_hedged_stages(self):
+        policy = self.create_policy(stages=("linkedin",))
+        for _ in range(20):
+            self.histogram.observe(0.2)
+        self.assertEqual(policy.get_stages(), ("linkedin",))
+        self.assertIsNone(policy.get_threshold("google"))
+
+    def test_threshold_follows_the_recent_latencies(self):
+        policy = self.create_policy(quantile=0.5, window=60)
+        with mock.patch("linkedin_scraper.hedging.time.monotonic") as monotonic:
+            monotonic.return_value = 1000
+            for _ in range(20):
+                self.histogram.observe(8)
+            self.assertGreater(policy.get_threshold("google"), 5)
+
+            monotonic.return_value = 1100
+            self.assertGreater(policy.get_threshold("google"), 5)
+
+            # The slow latencies are out of the window
+            monotonic.return_value = 1200
+            for _ in range(20):
+                self.histogram.observe(0.2)
+            self.assertLessEqual(policy.get_threshold("google"), 0.5)
+
+    def test_hedges_are_capped(self):
+        policy = self.create_policy(max_ratio=0.1)
+        self.assertFalse(policy.can_hedge())
+
+        for _ in range(25):
+            policy.record_dispatch()
+        for _ in range(2):
+            self.assertTrue(policy.can_hedge())
+            policy.record_hedge()
+        self.assertFalse(policy.can_hedge())
+        self.assertEqual(policy.get_hedges(), 2)
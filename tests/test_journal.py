@@ -0,0 +1,96 @@
+import os
+import time
+import tempfile
+import unittest
+
+from linkedin_scraper import ScraperController
+from linkedin_scraper.journal import ResultsJournal
+from tests.test_controller import DummyGoogleScraper, DummyLinkedinScraper
+
+
+class TestResultsJournal(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.journal_path = os.path.join(self.tmp_dir.name, "output.csv.journal")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_journal_roundtrip(self):
+        journal = ResultsJournal(path=self.journal_path)
+        journal.append("Walmart", {"status": "success", "employee_count": 11})
+        journal.append("Nonexistent Co", {"status": "failed"})
+        journal.close()
+
+        self.assertEqual(
+            ResultsJournal.load(self.journal_path),
+            {
+                "Walmart": {"status": "success", "employee_count": 11},
+                "Nonexistent Co": {"status": "failed"},
+            },
+        )
+
+    def test_journal_load_ignores_partial_line(self):
+        """A crash in the middle of a write must not prevent resuming"""
+        journal = ResultsJournal(path=self.journal_path)
+        journal.append("Walmart", {"status": "success", "employee_count": 11})
+        journal.close()
+        with open(self.journal_path, "a") as f:
+            f.write('{"task_id": "App')
+
+        self.assertEqual(list(ResultsJournal.load(self.journal_path)), ["Walmart"])
+
+    def test_journal_load_ignores_invalid_records(self):
+        """Valid JSON lines that aren't task records must not prevent resuming"""
+        journal = ResultsJournal(path=self.journal_path)
+        journal.append("Walmart", {"status": "success", "employee_count": 11})
+        journal.close()
+        with open(self.journal_path, "a") as f:
+            f.write('["Apple", "success"]\n')
+            f.write('{"status": "failed"}\n')
+            f.write('{"task_id": null, "status": "failed"}\n')
+            f.write("42\n")
+
+        self.assertEqual(list(ResultsJournal.load(self.journal_path)), ["Walmart"])
+
+    def test_journal_flush_if_due(self):
+        """The buffered records are flushed once due, even if no more records are appended"""
+        journal = ResultsJournal(path=self.journal_path, flush_interval=0.1, flush_records=100)
+        self.assertIsNone(journal.seconds_until_flush())
+        journal.flush()
+        journal.append("Walmart", {"status": "success", "employee_count": 11})
+        self.assertEqual(ResultsJournal.load(self.journal_path), {})
+
+        time.sleep(journal.seconds_until_flush())
+        journal.flush_if_due()
+        self.assertEqual(list(ResultsJournal.load(self.journal_path)), ["Walmart"])
+        self.assertIsNone(journal.seconds_until_flush())
+        journal.close()
+
+    def test_journal_load_missing_file(self):
+        self.assertEqual(ResultsJournal.load(self.journal_path), {})
+
+    def test_scrape_resume_skips_completed_tasks(self):
+        journal = ResultsJournal(path=self.journal_path)
+        controller = ScraperController(
+            show_progress=False,
+            google_worker_class=DummyGoogleScraper,
+            linkedin_worker_class=DummyLinkedinScraper,
+            journal=journal,
+        )
+        completed_results = {"Walmart": {"status": "success", "employee_count": 1}}
+
+        results = controller.scrape(
+            company_names_list=["Walmart", "Apple"],
+            completed_results=completed_results,
+        )
+        journal.close()
+
+        self.assertEqual(results["Walmart"]["employee_count"], 1)
+        self.assertEqual(results["Apple"]["status"], "success")
+        self.assertEqual(
+            results["Apple"]["employee_count"],
+            len("https://www.linkedin.com/company/apple"),
+        )
+        # Only the newly completed task is appended to the journal
+        self.assertEqual(list(ResultsJournal.load(self.journal_path)), ["Apple"])
@@ -0,0 +1,254 @@
+import time
+import mock
+import unittest
+
+
+from linkedin_scraper import ScraperController
+from linkedin_scraper.autoscale import Autoscaler
+from linkedin_scraper.pool import WorkerPool
+from linkedin_scraper.processes import get_children_by_pid, get_context
+from linkedin_scraper.tasks import GOOGLE_STAGE, LINKEDIN_STAGE
+from tests.scrapers.test_base import DummyScraper
+from tests.test_controller import DummyGoogleScraper, DummyLinkedinScraper
+
+
+class SleepingDummyScraper(DummyScraper):
+    """Dummy scraper sleeping for `input_data` seconds"""
+
+    def run_task(self, input_data):
+        time.sleep(float(input_data))
+        return super().run_task(input_data)
+
+
+class TestWorkerPool(unittest.TestCase):
+    def setUp(self):
+        self.input_queue = get_context().Queue()
+        self.results_queue = get_context().Queue()
+        self.pool = WorkerPool(
+            stage=GOOGLE_STAGE,
+            worker_class=DummyScraper,
+            input_queue=self.input_queue,
+            results_queue=self.results_queue,
+            min_size=1,
+            max_size=3,
+        )
+
+    def tearDown(self):
+        self.pool.stop()
+
+    def wait_for_size(self, alive_workers: int):
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            self.pool.reap()
+            if len(self.pool.get_workers()) == alive_workers:
+                return
+            time.sleep(0.05)
+        self.fail(f"Expected {alive_workers} workers, got {len(self.pool.get_workers())}")
+
+    def test_pool_resize_bounds(self):
+        self.pool.resize(10)
+        self.assertEqual(self.pool.size(), 3)
+        self.assertEqual(len(self.pool.get_workers()), 3)
+
+        self.pool.resize(0)
+        self.assertEqual(self.pool.size(), 1)
+        # The stopped workers exit on their own, and are forgotten when reaped
+        self.wait_for_size(1)
+        self.assertEqual(self.pool.reap(), [])
+
+        # The remaining worker keeps processing tasks
+        self.input_queue.put(("scrape_task", "t1", "abc"))
+        self.assertEqual(self.results_queue.get(timeout=5)[2], ("abc", "cba"))
+
+    def test_pool_shrink_ahead_of_backlog(self):
+        """Shrinking doesn't wait for the queued tasks to be processed"""
+        self.pool.stop()
+        self.pool = WorkerPool(
+            stage=GOOGLE_STAGE,
+            worker_class=SleepingDummyScraper,
+            input_queue=self.input_queue,
+            results_queue=self.results_queue,
+            min_size=1,
+            max_size=3,
+        )
+        self.pool.resize(3)
+        for i in range(100):
+            self.input_queue.put(("scrape_task", f"t{i}", "0.05"))
+
+        self.pool.resize(1)
+        self.assertEqual(self.pool.size(), 1)
+        self.wait_for_size(1)
+        self.assertEqual(self.pool.reap(), [])
+        # Most of the backlog is still queued
+        self.assertFalse(self.input_queue.empty())
+
+        self.pool.resize(3)
+        self.assertEqual(self.pool.size(), 3)
+        self.pool.terminate()
+
+    def test_pool_reap_unexpected_exit(self):
+        self.pool.resize(2)
+        crashed = self.pool.get_workers()[0]
+        # SIGKILL could leave the shared queue lock held, SIGTERM exits cleanly
+        crashed.get_process().terminate()
+        self.wait_for_size(1)
+        self.assertEqual(self.pool.size(), 1)
+
+
+class FakePool:
+    """Pool stand-in, for testing the Autoscaler decisions without processes"""
+
+    def __init__(self, stage: str, size: int, min_size: int = 1, max_size: int = 10):
+        self._stage = stage
+        self._size = size
+        self._min_size = min_size
+        self._max_size = max_size
+
+    def get_stage(self):
+        return self._stage
+
+    def get_workers(self):
+        return []
+
+    def get_tasks_per_worker(self):
+        return 1
+
+    def size(self):
+        return self._size
+
+    def resize(self, size):
+        self._size = min(self._max_size, max(self._min_size, size))
+
+
+@mock.patch("linkedin_scraper.autoscale.get_cpu_load", return_value=0.1)
+@mock.patch("linkedin_scraper.autoscale.get_available_memory_mb", return_value=8192)
+class TestAutoscaler(unittest.TestCase):
+    def setUp(self):
+        self.backlog = {GOOGLE_STAGE: 0, LINKEDIN_STAGE: 0}
+        self.google_pool = FakePool(GOOGLE_STAGE, size=1)
+        self.linkedin_pool = FakePool(LINKEDIN_STAGE, size=5)
+        self.autoscaler = Autoscaler(
+            pools=[self.google_pool, self.linkedin_pool],
+            get_backlog=self.backlog.get,
+            interval=1,
+            horizon=10,
+        )
+
+    def tick(self, elapsed: float, completions: dict):
+        for stage, count in completions.items():
+            for _ in range(count):
+                self.autoscaler.record_completion(stage)
+        self.autoscaler._last_tick -= elapsed
+        self.autoscaler.tick()
+
+    def test_autoscaler_follows_backlog(self, *mocks):
+        # Google backlogged, LinkedIn idle
+        self.backlog[GOOGLE_STAGE] = 100
+        self.tick(elapsed=1, completions={GOOGLE_STAGE: 1})
+        # 1 task/s per worker, 100 tasks in 10s needs 10 workers, grown gradually
+        self.assertAlmostEqual(self.autoscaler.get_service_time(GOOGLE_STAGE), 1, places=1)
+        self.assertEqual(self.google_pool.size(), 3)
+        self.assertEqual(self.linkedin_pool.size(), 1)
+
+        self.tick(elapsed=1, completions={GOOGLE_STAGE: 3})
+        self.assertEqual(self.google_pool.size(), 7)
+        self.tick(elapsed=1, completions={GOOGLE_STAGE: 7})
+        self.assertEqual(self.google_pool.size(), 10)
+
+        # The work moves to the LinkedIn stage
+        self.backlog[GOOGLE_STAGE] = 0
+        self.backlog[LINKEDIN_STAGE] = 50
+        self.tick(elapsed=1, completions={GOOGLE_STAGE: 10, LINKEDIN_STAGE: 1})
+        self.assertEqual(self.google_pool.size(), 1)
+        self.assertEqual(self.linkedin_pool.size(), 3)
+
+    def test_autoscaler_waits_for_interval(self, *mocks):
+        self.backlog[GOOGLE_STAGE] = 100
+        self.autoscaler.tick()
+        self.assertEqual(self.google_pool.size(), 1)
+        self.assertGreater(self.autoscaler.seconds_until_next_tick(), 0)
+
+    def test_autoscaler_respects_host_resources(self, memory_mock, cpu_mock):
+        self.backlog[GOOGLE_STAGE] = 100
+
+        cpu_mock.return_value = 2.0
+        self.tick(elapsed=1, completions={GOOGLE_STAGE: 1})
+        self.assertEqual(self.google_pool.size(), 1)
+
+        cpu_mock.return_value = 0.1
+        memory_mock.return_value = 100
+        self.tick(elapsed=1, completions={GOOGLE_STAGE: 1})
+        self.assertEqual(self.google_pool.size(), 1)
+
+        memory_mock.return_value = 8192
+        self.tick(elapsed=1, completions={GOOGLE_STAGE: 1})
+        self.assertGreater(self.google_pool.size(), 1)
+
+    def test_autoscaler_memory_budget(self, *mocks):
+        pool = WorkerPool(
+            stage=GOOGLE_STAGE,
+            worker_class=DummyScraper,
+            input_queue=get_context().Queue(),
+            results_queue=get_context().Queue(),
+            min_size=1,
+            max_size=10,
+        )
+        pool.resize(2)
+        try:
+            autoscaler = Autoscaler(
+                pools=[pool], get_backlog=self.backlog.get, memory_budget_mb=1
+            )
+            self.backlog[GOOGLE_STAGE] = 100
+            with mock.patch(
+                "linkedin_scraper.autoscale.get_children_by_pid", wraps=get_children_by_pid
+            ) as children_mock:
+                autoscaler.tick(force=True)
+            # A single worker process already uses more than 1 MB
+            self.assertEqual(pool.size(), 2)
+            # /proc is scanned once for all the workers
+            self.assertEqual(children_mock.call_count, 1)
+        finally:
+            pool.stop()
+
+    def test_autoscaler_leaves_exited_workers(self, *mocks):
+        """Crashed workers are left to the supervisor, with the task they were running"""
+        pool = WorkerPool(
+            stage=GOOGLE_STAGE,
+            worker_class=DummyScraper,
+            input_queue=get_context().Queue(),
+            results_queue=get_context().Queue(),
+            min_size=1,
+            max_size=10,
+        )
+        pool.resize(2)
+        try:
+            crashed = pool.get_workers()[0]
+            crashed.get_process().terminate()
+            crashed.get_process().join(5)
+
+            autoscaler = Autoscaler(pools=[pool], get_backlog=self.backlog.get)
+            autoscaler.tick(force=True)
+            self.assertEqual(pool.reap(), [crashed])
+        finally:
+            pool.stop()
+
+
+class TestScraperControllerAutoscale(unittest.TestCase):
+    @mock.patch("linkedin_scraper.autoscale.get_cpu_load", return_value=0.1)
+    def test_scrape_with_autoscale(self, cpu_mock):
+        controller = ScraperController(
+            show_progress=False,
+            google_worker_class=DummyGoogleScraper,
+            linkedin_worker_class=DummyLinkedinScraper,
+            autoscale=True,
+        )
+        controller.initialize()
+        try:
+            self.assertEqual(len(controller.get_workers()), 2)
+            results = controller.scrape([f"Company{i}" for i in range(100)])
+        finally:
+            controller.stop()
+
+        self.assertEqual(len(results), 100)
+        self.assertTrue(all(result["status"] == "success" for result in results.values()))
+        self.assertEqual(controller.get_workers(), [])
@@ -0,0 +1,205 @@
+import os
+import time
+import shutil
+import tempfile
+import unittest
+from queue import Empty
+
+import mock
+
+from linkedin_scraper import ScraperController
+from linkedin_scraper.pool import WorkerPool
+from linkedin_scraper.queues import (
+    SQLITE_BACKEND,
+    LocalTaskQueue,
+    QueueShutDown,
+    SqliteTaskQueue,
+    create_queue,
+)
+from linkedin_scraper.scrapers.base import BaseScraperWorker
+from linkedin_scraper.tasks import GOOGLE_STAGE
+from tests.test_controller import DummyGoogleScraper, DummyLinkedinScraper
+
+
+class SlowDummyScraper(BaseScraperWorker):
+    """Dummy scraper taking some time per task, so workers can be killed mid-task"""
+
+    def run_task(self, input_data):
+        time.sleep(0.1)
+        return input_data[::-1]
+
+
+class TestSqliteTaskQueue(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "queues.sqlite3")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def create_queue(self, name: str, visibility_timeout: float = 300) -> SqliteTaskQueue:
+        return SqliteTaskQueue(
+            name=name, path=self.path, visibility_timeout=visibility_timeout, poll_interval=0.01
+        )
+
+    def test_put_get_ack(self):
+        queue = self.create_queue("google")
+        other_queue = self.create_queue("linkedin")
+        queue.put(("scrape_task", "Walmart", "Walmart"))
+        queue.put(("scrape_batch", None, [["Apple", "Apple"]]))
+
+        self.assertRaises(Empty, other_queue.get, timeout=0.05)
+
+        message = queue.get()
+        self.assertEqual(message, ("scrape_task", "Walmart", "Walmart"))
+        queue.ack(message)
+        self.assertEqual(queue.get_nowait(), ("scrape_batch", None, [["Apple", "Apple"]]))
+        self.assertRaises(Empty, queue.get_nowait)
+        self.assertRaises(Empty, queue.get, timeout=0.05)
+
+    def test_redelivery_after_visibility_timeout(self):
+        queue = self.create_queue("google", visibility_timeout=0.2)
+        queue.put(("scrape_task", "Walmart", "Walmart"))
+
+        queue.get()
+        # Not acknowledged, it's invisible until the timeout expires
+        self.assertRaises(Empty, queue.get_nowait)
+        message = queue.get(timeout=5)
+        self.assertEqual(message, ("scrape_task", "Walmart", "Walmart"))
+
+        queue.ack(message)
+        time.sleep(0.3)
+        self.assertRaises(Empty, queue.get_nowait)
+
+    def test_extend_lease(self):
+        queue = self.create_queue("google", visibility_timeout=0.3)
+        queue.put(("scrape_batch", None, [["Walmart", "Walmart"], ["Apple", "Apple"]]))
+
+        message = queue.get()
+        time.sleep(0.2)
+        queue.extend_lease(message)
+        time.sleep(0.2)
+        # Still invisible, 0.4s after its delivery
+        self.assertRaises(Empty, queue.get_nowait)
+        self.assertEqual(queue.get(timeout=5), message)
+
+    def test_ack_copied_message(self):
+        """Messages are acknowledged by their row id, not by the identity of the tuple"""
+        queue = self.create_queue("google", visibility_timeout=0.2)
+        queue.put(("scrape_task", "Walmart", "Walmart"))
+        queue.put(("scrape_task", "Apple", "Apple"))
+
+        queue.ack(queue.get())
+        message = queue.get()
+        # A plain tuple equal to the message is not a lease, it's ignored
+        queue.ack(tuple(message))
+        time.sleep(0.3)
+        self.assertEqual(queue.get_nowait(), ("scrape_task", "Apple", "Apple"))
+
+    def test_sessions_are_isolated(self):
+        with mock.patch("linkedin_scraper.queues.SqliteTaskQueue", new=self.create_queue):
+            queue = create_queue("google", backend=SQLITE_BACKEND, session="session1")
+            other_queue = create_queue("google", backend=SQLITE_BACKEND, session="session2")
+        queue.put(("scrape_task", "Walmart", "Walmart"))
+        self.assertRaises(Empty, other_queue.get_nowait)
+        self.assertEqual(queue.get_nowait(), ("scrape_task", "Walmart", "Walmart"))
+
+    def test_purge(self):
+        queue = self.create_queue("google")
+        queue.put(("scrape_task", "Walmart", "Walmart"))
+        queue.put(("scrape_task", "Apple", "Apple"))
+        queue.get()
+        queue.purge()
+        self.assertRaises(Empty, queue.get_nowait)
+
+    def test_shutdown(self):
+        queue = self.create_queue("google")
+        queue.put(("scrape_task", "Walmart", "Walmart"))
+        queue.shutdown()
+        self.assertRaises(QueueShutDown, queue.get_nowait)
+        self.assertRaises(QueueShutDown, self.create_queue("google").get, timeout=1)
+
+        queue.reopen()
+        self.assertEqual(queue.get_nowait(), ("scrape_task", "Walmart", "Walmart"))
+
+    def test_remote_workers_exit_when_session_ends(self):
+        """Workers the controller doesn't manage exit once its session is over"""
+        with mock.patch("linkedin_scraper.queues.SqliteTaskQueue", new=self.create_queue):
+            controller = ScraperController(
+                show_progress=False,
+                google_worker_class=DummyGoogleScraper,
+                linkedin_worker_class=DummyLinkedinScraper,
+                queue_backend=SQLITE_BACKEND,
+                queue_session="session1",
+            )
+            remote_pool = WorkerPool(
+                stage=GOOGLE_STAGE,
+                worker_class=DummyGoogleScraper,
+                input_queue=create_queue(GOOGLE_STAGE, backend=SQLITE_BACKEND, session="session1"),
+                results_queue=create_queue("results", backend=SQLITE_BACKEND, session="session1"),
+                min_size=2,
+                max_size=2,
+            )
+        remote_pool.resize(2)
+        try:
+            results = controller.scrape([f"Company{i}" for i in range(10)])
+            self.assertEqual(len(results), 10)
+
+            deadline = time.monotonic() + 10
+            exited_unexpectedly = []
+            while remote_pool.get_workers() and time.monotonic() < deadline:
+                exited_unexpectedly += remote_pool.reap()
+                time.sleep(0.05)
+            self.assertEqual(remote_pool.get_workers(), [])
+            self.assertEqual(exited_unexpectedly, [])
+        finally:
+            remote_pool.terminate()
+
+    def test_at_least_once_with_dead_worker(self):
+        """Tasks held by a killed worker are redelivered to the others, none is lost"""
+        input_queue = self.create_queue("google", visibility_timeout=1)
+        results_queue = self.create_queue("results")
+        workers = [
+            SlowDummyScraper(worker_id=i, input_queue=input_queue, results_queue=results_queue)
+            for i in range(3)
+        ]
+        task_ids = {f"task{i}" for i in range(30)}
+        for task_id in task_ids:
+            input_queue.put(("scrape_task", task_id, task_id))
+
+        for worker in workers:
+            worker.run_in_thread()
+        try:
+            # Kill a worker while it is processing a task, without acknowledging it
+            time.sleep(0.25)
+            workers[0].get_process().kill()
+
+            results = {}
+            deadline = time.monotonic() + 30
+            while set(results) != task_ids and time.monotonic() < deadline:
+                message = results_queue.get(timeout=1)
+                worker_type, task_id, data, status = message
+                results[task_id] = data
+                results_queue.ack(message)
+        finally:
+            for worker in workers[1:]:
+                worker.request_stop()
+            for worker in workers:
+                worker.stop()
+
+        self.assertEqual(set(results), task_ids)
+        self.assertEqual(results["task7"], ["task7", "7ksat"])
+
+
+class TestLocalTaskQueue(unittest.TestCase):
+    def test_put_get_purge(self):
+        queue = LocalTaskQueue()
+        queue.put(("scrape_task", "Walmart", "Walmart"))
+        message = queue.get(timeout=1)
+        queue.ack(message)
+        self.assertEqual(message, ("scrape_task", "Walmart", "Walmart"))
+
+        queue.put(("scrape_task", "Apple", "Apple"))
+        time.sleep(0.1)
+        queue.purge()
+        self.assertRaises(Empty, queue.get_nowait)
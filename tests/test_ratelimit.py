@@ -0,0 +1,55 @@
+import time
+import unittest
+
+from multiprocessing import Process
+
+from linkedin_scraper.ratelimit import AdaptiveRateLimiter
+
+
+def acquire_many(rate_limiter: AdaptiveRateLimiter, count: int):
+    for _ in range(count):
+        rate_limiter.acquire()
+
+
+class TestAdaptiveRateLimiter(unittest.TestCase):
+    def test_acquire_respects_rate(self):
+        rate_limiter = AdaptiveRateLimiter(rate=20, increase=0)
+
+        start = time.monotonic()
+        acquire_many(rate_limiter, 11)
+        # the first token is available immediately, the next 10 take 1/20s each
+        self.assertGreaterEqual(time.monotonic() - start, 0.45)
+
+    def test_rate_is_shared_between_processes(self):
+        rate_limiter = AdaptiveRateLimiter(rate=20, increase=0)
+
+        start = time.monotonic()
+        processes = [
+            Process(target=acquire_many, args=(rate_limiter, 10)) for _ in range(2)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        # 20 requests between both processes, at 20 requests per second
+        self.assertGreaterEqual(time.monotonic() - start, 0.9)
+
+    def test_aimd(self):
+        rate_limiter = AdaptiveRateLimiter(
+            rate=4, min_rate=1, max_rate=5, increase=0.5, decrease=0.5
+        )
+
+        rate_limiter.on_success()
+        self.assertEqual(rate_limiter.get_rate(), 4.5)
+
+        rate_limiter.on_throttle()
+        self.assertEqual(rate_limiter.get_rate(), 2.25)
+
+        # Throttles right after a decrease are ignored
+        rate_limiter.on_throttle()
+        self.assertEqual(rate_limiter.get_rate(), 2.25)
+
+        for _ in range(10):
+            rate_limiter.on_success()
+        self.assertEqual(rate_limiter.get_rate(), 5)
@@ -0,0 +1,67 @@
+import time
+import unittest
+
+from linkedin_scraper.exceptions import NOT_FOUND_ERROR, OTHER_ERROR, THROTTLED_ERROR, classify_error
+from linkedin_scraper.retries import RetryPolicy, RetryScheduler
+
+
+class TestClassifyError(unittest.TestCase):
+    def test_throttled(self):
+        self.assertEqual(classify_error("scrape_error: HTTP_429_DETECTED"), THROTTLED_ERROR)
+        self.assertEqual(classify_error("HTTP 429 fetching https://www.linkedin.com/company/x"), THROTTLED_ERROR)
+        self.assertEqual(classify_error("429 Client Error: Too Many Requests for url: x"), THROTTLED_ERROR)
+
+    def test_429_outside_status_is_not_throttled(self):
+        self.assertEqual(classify_error("scrape_error: Unexpected token at position 429"), OTHER_ERROR)
+        self.assertEqual(classify_error("scrape_error: Company 14290 page not found"), NOT_FOUND_ERROR)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_should_retry(self):
+        retry_policy = RetryPolicy(max_retries=2)
+
+        self.assertTrue(retry_policy.should_retry("scrape_error: HTTP_429_DETECTED", 0))
+        self.assertTrue(retry_policy.should_retry("scrape_error: Timeout 30000ms exceeded", 1))
+        self.assertTrue(retry_policy.should_retry("scrape_error: Connection reset", 1))
+        # The retry budget is exhausted
+        self.assertFalse(retry_policy.should_retry("scrape_error: HTTP_429_DETECTED", 2))
+        # Permanent failures are never retried
+        self.assertFalse(retry_policy.should_retry("scrape_error: Page not found", 0))
+        self.assertFalse(
+            retry_policy.should_retry("scrape_error: Invalid extracted linkeding page: x", 0)
+        )
+
+    def test_exponential_backoff_with_jitter(self):
+        retry_policy = RetryPolicy(max_retries=10, base_delay=1, max_delay=5, jitter=0.5)
+
+        for retries, delay in ((0, 1), (1, 2), (2, 4), (3, 5), (8, 5)):
+            delays = [retry_policy.get_delay(retries) for _ in range(50)]
+            self.assertTrue(all(delay * 0.5 <= value <= delay * 1.5 for value in delays))
+            # The delays are spread, so the tasks failed together are not retried together
+            self.assertGreater(len(set(delays)), 1)
+
+
+class TestRetryScheduler(unittest.TestCase):
+    def test_retries_are_returned_when_due(self):
+        retry_scheduler = RetryScheduler()
+        self.assertIsNone(retry_scheduler.seconds_until_next())
+
+        retry_scheduler.schedule(0.2, "google", "Walmart", "Walmart")
+        retry_scheduler.schedule(0.1, "linkedin", "Apple", "https://www.linkedin.com/company/apple")
+        retry_scheduler.schedule(10, "google", "Amazon", "Amazon")
+
+        self.assertEqual(retry_scheduler.pop_due(), [])
+        self.assertAlmostEqual(retry_scheduler.seconds_until_next(), 0.1, delta=0.05)
+
+        time.sleep(0.25)
+        self.assertEqual(
+            retry_scheduler.pop_due(),
+            [
+                ("linkedin", "Apple", "https://www.linkedin.com/company/apple"),
+                ("google", "Walmart", "Walmart"),
+            ],
+        )
+        self.assertEqual(len(retry_scheduler), 1)
+
+        retry_scheduler.clear()
+        self.assertEqual(len(retry_scheduler), 0)
@@ -0,0 +1,132 @@
+import os
+import csv
+import json
+import sqlite3
+import unittest
+import tempfile
+
+from linkedin_scraper.sinks import (
+    OUTPUT_FIELDS,
+    CsvSink,
+    JsonlSink,
+    ParquetSink,
+    SqliteSink,
+    open_sink,
+)
+
+try:
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+RESULTS = {
+    "Walmart, Inc.": {
+        "status": "success",
+        "linkedin_url": "https://www.linkedin.com/company/walmart",
+        "employee_count": 2100000,
+    },
+    'The "Quoted" Company': {
+        "status": "failed",
+        "linkedin_url": None,
+        "employee_count": None,
+    },
+}
+
+
+class SinkTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "output")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+
+class TestCsvSink(SinkTestCase):
+    def read_rows(self):
+        with open(self.path, newline="", encoding="utf-8") as f:
+            return list(csv.reader(f))
+
+    def test_quoting_and_failed_rows(self):
+        with CsvSink(self.path) as sink:
+            sink.write_results(RESULTS)
+
+        self.assertEqual(
+            self.read_rows(),
+            [
+                list(OUTPUT_FIELDS),
+                ["Walmart, Inc.", "success", "https://www.linkedin.com/company/walmart", "2100000"],
+                ['The "Quoted" Company', "failed", "", ""],
+            ],
+        )
+
+    def test_buffered_incremental_writes(self):
+        sink = CsvSink(self.path, flush_rows=2, flush_interval=None)
+        sink.write("Walmart, Inc.", RESULTS["Walmart, Inc."])
+        # Only the header was written, the row is buffered
+        self.assertEqual(len(self.read_rows()), 1)
+
+        sink.write("Other", RESULTS["Walmart, Inc."])
+        self.assertEqual(len(self.read_rows()), 3)
+        sink.close()
+
+
+class TestJsonlSink(SinkTestCase):
+    def test_write(self):
+        with JsonlSink(self.path) as sink:
+            sink.write_results(RESULTS)
+
+        with open(self.path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(
+            {record.pop("company_name"): record for record in records},
+            RESULTS,
+        )
+
+
+class TestSqliteSink(SinkTestCase):
+    def read_results(self):
+        connection = sqlite3.connect(self.path)
+        try:
+            rows = connection.execute(
+                "SELECT company_name, status, linkedin_url, employee_count FROM results"
+            ).fetchall()
+        finally:
+            connection.close()
+        return {row[0]: dict(zip(OUTPUT_FIELDS[1:], row[1:])) for row in rows}
+
+    def test_write(self):
+        with SqliteSink(self.path, flush_rows=1) as sink:
+            sink.write_results(RESULTS)
+        self.assertEqual(self.read_results(), RESULTS)
+
+    def test_overwrite(self):
+        with SqliteSink(self.path) as sink:
+            sink.write("Walmart, Inc.", RESULTS["Walmart, Inc."])
+
+        # A new session replaces the previous results
+        with SqliteSink(self.path) as sink:
+            sink.write("Other", RESULTS["Walmart, Inc."])
+        self.assertEqual(set(self.read_results()), {"Other"})
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class TestParquetSink(SinkTestCase):
+    def test_row_groups(self):
+        with ParquetSink(self.path, row_group_size=1) as sink:
+            sink.write_results(RESULTS)
+
+        parquet_file = pyarrow.parquet.ParquetFile(self.path)
+        self.assertEqual(parquet_file.metadata.num_row_groups, 2)
+        records = parquet_file.read().to_pylist()
+        self.assertEqual({record.pop("company_name"): record for record in records}, RESULTS)
+
+
+class TestOpenSink(SinkTestCase):
+    def test_open_sink(self):
+        sink = open_sink("jsonl", self.path)
+        self.assertIsInstance(sink, JsonlSink)
+        sink.close()
+
+        with self.assertRaises(ValueError):
+            open_sink("xml", self.path)
@@ -0,0 +1,90 @@
+import time
+import unittest
+
+from linkedin_scraper.metrics import ScraperMetrics
+from linkedin_scraper.pool import WorkerPool
+from linkedin_scraper.processes import get_context
+from linkedin_scraper.supervisor import WorkerSupervisor
+from linkedin_scraper.tasks import GOOGLE_STAGE
+from tests.scrapers.test_base import DummyScraper
+
+
+class HangingDummyScraper(DummyScraper):
+    """Dummy scraper type, the "hang" tasks never finish"""
+
+    def run_task(self, input_data):
+        if input_data == "hang":
+            time.sleep(60)
+        return super().run_task(input_data)
+
+
+class TestWorkerSupervisor(unittest.TestCase):
+    def setUp(self):
+        self.input_queue = get_context().Queue()
+        self.results_queue = get_context().Queue()
+        self.metrics = ScraperMetrics(stages=(GOOGLE_STAGE,))
+        self.lost_tasks = []
+        self.pool = None
+
+    def tearDown(self):
+        self.pool.stop()
+
+    def start_pool(self, worker_class, **worker_kwargs):
+        self.pool = WorkerPool(
+            stage=GOOGLE_STAGE,
+            worker_class=worker_class,
+            input_queue=self.input_queue,
+            results_queue=self.results_queue,
+            min_size=1,
+            max_size=1,
+            worker_kwargs=worker_kwargs,
+        )
+        self.pool.resize(1)
+        self.supervisor = WorkerSupervisor(
+            pools=[self.pool],
+            task_timeouts={GOOGLE_STAGE: 0.5},
+            on_task_lost=lambda *lost_task: self.lost_tasks.append(lost_task),
+            metrics=self.metrics,
+        )
+
+    def wait_for_restart(self, reason: str):
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            self.supervisor.tick(force=True)
+            if self.get_restarts():
+                return
+            time.sleep(0.05)
+        self.fail(f"The worker was not restarted: {reason}")
+
+    def get_restarts(self) -> dict:
+        return self.metrics.summary()["stages"][GOOGLE_STAGE]["worker_restarts"]
+
+    def test_stuck_worker_is_restarted(self):
+        self.start_pool(HangingDummyScraper)
+        stuck_worker = self.pool.get_workers()[0]
+        self.input_queue.put(("scrape_task", "Hang Co", "hang"))
+
+        self.wait_for_restart("task_timeout")
+        self.assertEqual(self.get_restarts(), {"task_timeout": 1})
+        self.assertEqual(self.lost_tasks, [(GOOGLE_STAGE, "Hang Co", "Timeout: task exceeded 0.5s")])
+        self.assertFalse(stuck_worker.is_alive())
+
+        # The new worker takes the next tasks
+        self.assertEqual(len(self.pool.get_workers()), 1)
+        self.input_queue.put(("scrape_task", "t1", "abc"))
+        self.assertEqual(self.results_queue.get(timeout=5)[2], ("abc", "cba"))
+
+    def test_recycled_worker_is_replaced(self):
+        self.start_pool(DummyScraper, max_tasks=2)
+        recycled_worker = self.pool.get_workers()[0]
+        for i in range(3):
+            self.input_queue.put(("scrape_task", f"t{i}", "abc"))
+
+        self.wait_for_restart("recycled")
+        self.assertEqual(self.get_restarts(), {"recycled": 1})
+        self.assertEqual(self.lost_tasks, [])
+        self.assertNotIn(recycled_worker, self.pool.get_workers())
+
+        # The recycled worker ran two tasks, the new one runs the last one
+        results = {self.results_queue.get(timeout=5)[1] for _ in range(3)}
+        self.assertEqual(results, {"t0", "t1", "t2"})
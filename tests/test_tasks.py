@@ -0,0 +1,56 @@
+import unittest
+
+from linkedin_scraper.tasks import (
+    DONE,
+    FAILED,
+    QUEUED_GOOGLE,
+    QUEUED_LINKEDIN,
+    TaskRecord,
+    TaskTable,
+)
+
+
+class TestTaskTable(unittest.TestCase):
+    def setUp(self):
+        self.tasks = TaskTable()
+        for i in range(10):
+            self.tasks.add(TaskRecord(f"task{i}", f"Company{i}", QUEUED_GOOGLE))
+
+    def test_state_transitions_and_counts(self):
+        self.tasks.set_state(self.tasks.get("task0"), QUEUED_LINKEDIN)
+        self.tasks.set_state(self.tasks.get("task1"), QUEUED_LINKEDIN)
+        self.tasks.set_state(self.tasks.get("task1"), DONE)
+        self.tasks.set_state(self.tasks.get("task2"), FAILED)
+
+        self.assertEqual(
+            self.tasks.counts(),
+            {QUEUED_GOOGLE: 7, QUEUED_LINKEDIN: 1, DONE: 1, FAILED: 1},
+        )
+        self.assertEqual(self.tasks.pending_count(), 8)
+        self.assertTrue(self.tasks.get("task1").is_final())
+
+    def test_pop_and_replace(self):
+        self.assertEqual(self.tasks.pop("task0").input_data, "Company0")
+        self.assertIsNone(self.tasks.pop("task0"))
+        self.assertNotIn("task0", self.tasks)
+
+        # Adding a record with an existing task id replaces it
+        self.tasks.add(TaskRecord("task1", "Company1", DONE))
+        self.assertEqual(len(self.tasks), 9)
+        self.assertEqual(self.tasks.counts(), {QUEUED_GOOGLE: 8, DONE: 1})
+
+    def test_record_dict_roundtrip(self):
+        record = TaskRecord.from_dict(
+            "Walmart",
+            {"status": "success", "linkedin_url": "https://www.linkedin.com/company/walmart"},
+        )
+        self.assertEqual(record.state, DONE)
+        self.assertEqual(
+            record.to_dict(),
+            {
+                "status": "success",
+                "linkedin_url": "https://www.linkedin.com/company/walmart",
+                "employee_count": None,
+            },
+        )
+        self.assertEqual(TaskRecord.from_dict("x", {"status": "failed"}).state, FAILED)
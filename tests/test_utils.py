@@ -0,0 +1,40 @@
+import unittest
+
+from linkedin_scraper.utils import normalize_company_name, normalize_linkedin_url
+
+
+class TestNormalizeCompanyName(unittest.TestCase):
+    def test_equivalent_names(self):
+        for company_name in ("Walmart", "Walmart Inc.", " walmart ", "WALMART, INC", "Walmart Corp"):
+            self.assertEqual(normalize_company_name(company_name), "walmart")
+
+        self.assertEqual(normalize_company_name("Ford Motor Co."), "ford motor")
+        self.assertEqual(normalize_company_name("L.L.C. Holdings L.L.C."), "llc holdings")
+        self.assertEqual(
+            normalize_company_name("Procter & Gamble Co"),
+            normalize_company_name("Procter and Gamble Company"),
+        )
+        self.assertEqual(normalize_company_name("Lowe’s"), normalize_company_name("Lowe's"))
+
+    def test_different_names(self):
+        self.assertNotEqual(normalize_company_name("Walmart"), normalize_company_name("Walgreens"))
+        # A legal suffix alone is still a name
+        self.assertEqual(normalize_company_name("Co"), "co")
+        self.assertEqual(normalize_company_name("3M Co"), "3m")
+        self.assertEqual(normalize_company_name("JPMorgan Chase & Co."), "jpmorgan chase")
+        self.assertEqual(normalize_company_name("Johnson & Johnson"), "johnson and johnson")
+
+
+class TestNormalizeLinkedinUrl(unittest.TestCase):
+    def test_same_company_page(self):
+        for linkedin_url in (
+            "https://www.linkedin.com/company/walmart",
+            "https://uk.linkedin.com/company/Walmart/",
+            "http://linkedin.com/company/walmart?trk=public_profile#about",
+        ):
+            self.assertEqual(normalize_linkedin_url(linkedin_url), "linkedin.com/company/walmart")
+
+        self.assertNotEqual(
+            normalize_linkedin_url("https://www.linkedin.com/company/walmart"),
+            normalize_linkedin_url("https://www.linkedin.com/company/walmart-labs"),
+        )